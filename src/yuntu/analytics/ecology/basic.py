@@ -5,7 +5,10 @@ import pytz
 import numpy as np
 import pandas as pd
 import matplotlib.cm as cm
-from scipy.special import comb
+from scipy.special import comb, gammaln
+
+ABS_START_TIME = 'abs_start_time'
+ABS_END_TIME = 'abs_end_time'
 
 def diversity(row, labels, div_type="Shannon"):
     """Compute diversity for each row"""
@@ -43,9 +46,14 @@ def rarefaction(row, size, labels):
                       "rarefaction" : rare_calc})
 
 def rarefy(i, Sn, n, x, exact=False):
-    """Simulate values for rarefaction curve."""
+    """Simulate values for rarefaction curve.
+
+    If not exact, 'i' can be an array of sample sizes.
+    """
     if not exact:
-        sBar = Sn -  np.sum(comb(n-x, i))/comb(n, i)
+        sBar = Sn - np.sum(_comb_ratio(n - np.asarray(x),
+                                       np.asarray(i, dtype=float)[..., None],
+                                       n), axis=-1)
     else:
         sBar = Sn - np.sum(np.array([comb(n-val, i, exact=True) for val in x]))/comb(n, i, exact=True)
     return sBar
@@ -65,7 +73,7 @@ def rarefaction_curve(row, ax, view_time_zone="America/Mexico_city",
 
     if not exact:
         iPred = np.linspace(0, n, 1000)
-        yhat = [rarefy(i, Sn, n, y) for i in iPred]
+        yhat = rarefy(iPred, Sn, n, y)
 
         if plot_label is None:
             plot_label = (row["abs_start_time"]
@@ -78,3 +86,159 @@ def rarefaction_curve(row, ax, view_time_zone="America/Mexico_city",
 
     ax.plot(iPred, yhat, color=color)
     ax.text(iPred[-1], yhat[-1], plot_label, ha='left', va='center')
+
+
+def _log_comb(n, k):
+    """Logarithm of binomial coefficient for real arguments."""
+    return gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1)
+
+
+def _comb_ratio(m, k, n):
+    """Compute comb(m, k) / comb(n, k) with log-gamma functions.
+
+    Ratios are zero where k > m and NaN where k > n.
+    """
+    m, k, n = np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                    for v in (m, k, n)])
+    valid = (k <= m) & (k >= 0)
+    ratio = np.zeros(m.shape)
+    ratio[valid] = np.exp(_log_comb(m[valid], k[valid]) -
+                          _log_comb(n[valid], k[valid]))
+    ratio[(k > n) | (k < 0)] = np.nan
+    return ratio
+
+
+def label_counts(frame, labels):
+    """Return label counts of all rows as a float matrix.
+
+    Missing counts are treated as zero.
+    """
+    return np.nan_to_num(frame[labels].to_numpy(dtype=float))
+
+
+def shannon_index(counts, div_type="Shannon"):
+    """Compute Shannon or Hill diversity of each row of a count matrix."""
+    counts = np.atleast_2d(counts)
+    total = np.maximum(counts.sum(axis=1, keepdims=True), 1)
+    p = counts / total
+    div = -np.sum(p * np.log(np.where(p > 0, p, 1)), axis=1)
+    if div_type == "Hill":
+        div = np.exp(div)
+    return div
+
+
+def species_richness(counts):
+    """Compute number of labels present in each row of a count matrix."""
+    return np.sum(np.atleast_2d(counts) > 0, axis=1)
+
+
+def expected_richness(counts, size):
+    """Compute rarefied richness of each row of a count matrix.
+
+    Expected number of labels in a random subsample of 'size' detections
+    from each row. 'size' can be a number or an array with one size per
+    row. Rows with less than 'size' detections give NaN.
+    """
+    counts = np.atleast_2d(counts)
+    total = counts.sum(axis=1, keepdims=True)
+    size = np.reshape(np.asarray(size, dtype=float), [-1, 1])
+    ratio = _comb_ratio(total - counts, size, total)
+    return np.sum(1 - ratio, axis=1)
+
+
+def _measure_frame(frame, name, values, columns=None):
+    if columns is None:
+        columns = [ABS_START_TIME, ABS_END_TIME]
+    result = frame[columns].copy()
+    result[name] = values
+    return result
+
+
+def diversity_frame(frame, labels, div_type="Shannon", columns=None):
+    """Compute diversity of all rows at once.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+        Activity dataframe.
+    labels : list
+        Columns holding label counts.
+    div_type : str
+        Either 'Shannon' or 'Hill'.
+    columns : list, optional
+        Columns to copy into the result. Defaults to the absolute start
+        and end times.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Dataframe with a 'diversity' column and the same index as frame.
+    """
+    div = shannon_index(label_counts(frame, labels), div_type=div_type)
+    return _measure_frame(frame, "diversity", div, columns=columns)
+
+
+def richness_frame(frame, labels, columns=None):
+    """Compute richness of all rows at once.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Dataframe with a 'richness' column and the same index as frame.
+    """
+    rich = species_richness(label_counts(frame, labels))
+    return _measure_frame(frame, "richness", rich, columns=columns)
+
+
+def rarefaction_frame(frame, size, labels, columns=None):
+    """Compute rarefaction of all rows at once.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Dataframe with a 'rarefaction' column and the same index as frame.
+    """
+    rare = expected_richness(label_counts(frame, labels), size)
+    return _measure_frame(frame, "rarefaction", rare, columns=columns)
+
+
+def group_activity(frame, labels, by=None, freq=None):
+    """Sum label counts by groups of rows.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+        Activity dataframe.
+    labels : list
+        Columns holding label counts.
+    by : str or list, optional
+        Columns to group by, for example a site column.
+    freq : str, optional
+        Fixed frequency of time periods to group by, for example '1h'.
+        Periods are stored in a 'period' column.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Activity dataframe with one row per group, the earliest start
+        time, the latest end time and the total count of each label.
+    """
+    if by is None:
+        keys = []
+    elif isinstance(by, (list, tuple)):
+        keys = list(by)
+    else:
+        keys = [by]
+
+    if freq is not None:
+        keys.append(frame[ABS_START_TIME].dt.floor(freq).rename("period"))
+
+    if not keys:
+        message = "Either 'by' or 'freq' must be given to group activity."
+        raise ValueError(message)
+
+    grouped = frame.groupby(keys, sort=True)
+    times = grouped.agg(**{ABS_START_TIME: (ABS_START_TIME, "min"),
+                           ABS_END_TIME: (ABS_END_TIME, "max")})
+    counts = grouped[labels].sum().astype(float)
+    return pd.concat([times, counts], axis=1).reset_index()
@@ -1,28 +1,221 @@
 """Base classes for collection."""
 import os
+import copy
 import json
+from inspect import signature
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import shapely.wkt
+import dask.dataframe as dd
+from dask import delayed
+from pony.orm import db_session
+from pony.orm import select
+from pony.orm import exists
+from pony.orm import count
 
 from yuntu.core.database.base import DatabaseManager
 from yuntu.core.database.timed import TimedDatabaseManager
 from yuntu.core.database.spatial import SpatialDatabaseManager
 from yuntu.core.database.spatiotemporal import SpatioTemporalDatabaseManager
 from yuntu.core.database.spatial import build_query_with_geom
+from yuntu.core.database.spatial import as_wkt
 from yuntu.core.audio.audio import Audio
 from yuntu.core.annotation.annotation import Annotation
+from yuntu.core.annotation.annotated_object import AnnotationArray
 from yuntu.datastore.copy import CopyDatastore
 
-def _parse_annotation(annotation):
-    return {
-        'type': annotation.type,
-        'id': annotation.id,
-        'labels': annotation.labels,
-        'metadata': annotation.metadata,
-        'geometry': {
-            'wkt': annotation.geometry
-        }
-    }
+DEFAULT_BATCH_SIZE = 10000
+DEFAULT_PARTITION_SIZE = 100000
+# SQLite releases before 3.32 allow at most 999 bound parameters per query.
+MAX_QUERY_IDS = 500
+
+
+def _model_projection(model):
+    """Return column names and select expression for model rows.
+
+    Relations are replaced by the primary key of the related entity and
+    collections are skipped. The primary key is always the first column.
+    """
+    columns = ["id"]
+    expressions = ["x.id"]
+    for attr in model._attrs_:
+        if attr.is_collection or attr.name == "id":
+            continue
+        columns.append(attr.name)
+        if attr.is_relation:
+            expressions.append(f"x.{attr.name}.id")
+        else:
+            expressions.append(f"x.{attr.name}")
+    return columns, "(" + ", ".join(expressions) + ")"
+
+
+def _filter_id_range(matches, id_range=None):
+    """Restrict query to primary keys in the half open range (start, stop)."""
+    start, stop = (None, None) if id_range is None else id_range
+    if start is not None:
+        matches = matches.filter(lambda x: x.id >= start)
+    if stop is not None:
+        matches = matches.filter(lambda x: x.id < stop)
+    return matches
+
+
+def _iter_rows(model, matches, batch_size=DEFAULT_BATCH_SIZE, limit=None,
+               offset=0, id_range=None):
+    """Yield raw rows of query in pages ordered by primary key.
+
+    Pages are fetched with keyset pagination, filtering by the last
+    primary key seen instead of using OFFSET, and each page is read in its
+    own session so that no entity is kept in memory.
+    """
+    columns, expression = _model_projection(model)
+
+    with db_session:
+        matches = _filter_id_range(matches, id_range)
+        if offset:
+            first = select(x.id for x in matches).order_by(1)[offset:offset + 1]
+            if len(first) == 0:
+                return
+            first_id = first[0]
+            matches = matches.filter(lambda x: x.id >= first_id)
+
+    last_id = None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+
+        with db_session:
+            page = matches
+            if last_id is not None:
+                page = matches.filter(lambda x: x.id > last_id)
+            rows = select(f"{expression} for x in page").order_by(1)[:size]
+            rows = list(rows)
+
+        if len(rows) == 0:
+            return
+
+        yield columns, rows
+
+        last_id = rows[-1][0]
+        if remaining is not None:
+            remaining -= len(rows)
+        if len(rows) < size:
+            return
+
+
+def _concat_batches(batches):
+    """Concatenate dataframe batches into a single dataframe."""
+    if len(batches) == 0:
+        return pd.DataFrame()
+    if isinstance(batches[0], pa.Table):
+        return pa.concat_tables(batches)
+    return pd.concat(batches, ignore_index=True)
+
+
+def _conform_partition(batch, meta):
+    """Return batch with the columns and dtypes of meta."""
+    if len(batch) == 0:
+        return meta.copy()
+    batch = batch.reindex(columns=meta.columns)
+    return batch.astype(meta.dtypes.to_dict(), errors="ignore")
+
+
+def _load_partition(col_class, db_config, base_path, method, id_range, kwargs,
+                    meta=None):
+    """Read all batches of a key range with a new collection connection."""
+    col = col_class(db_config=db_config, base_path=base_path)
+    try:
+        batches = list(getattr(col, method)(id_range=id_range, **kwargs))
+    finally:
+        col.db_manager.db.disconnect()
+    batch = _concat_batches(batches)
+    if meta is not None:
+        batch = _conform_partition(batch, meta)
+    return batch
+
+
+def _as_utc(value):
+    """Return naive UTC datetime from datetime, timestamp or string."""
+    value = pd.Timestamp(value)
+    if value.tzinfo is not None:
+        value = value.tz_convert("UTC").tz_localize(None)
+    return value.to_pydatetime()
+
+
+def _filter_time_range(matches, time_range=None):
+    """Restrict recordings to UTC times in the half open range (start, end)."""
+    start, end = (None, None) if time_range is None else time_range
+    if start is not None:
+        start = _as_utc(start)
+        matches = matches.filter(lambda r: r.time_utc >= start)
+    if end is not None:
+        end = _as_utc(end)
+        matches = matches.filter(lambda r: r.time_utc < end)
+    return matches
+
+
+def _daily_counts(matches):
+    """Count recordings and total duration per datastore and UTC day."""
+    columns = ["datastore", "year", "month", "day", "count", "duration"]
+    with db_session:
+        rows = list(select((r.datastore.id,
+                            r.time_utc.year,
+                            r.time_utc.month,
+                            r.time_utc.day,
+                            count(r),
+                            sum(float(r.media_info["duration"])))
+                           for r in matches))
+
+    counts = pd.DataFrame.from_records(rows, columns=columns)
+    dates = pd.to_datetime(counts[["year", "month", "day"]])
+    counts = counts.drop(columns=["year", "month", "day"])
+    counts.insert(1, "date", dates)
+    return counts.sort_values(["datastore", "date"]).reset_index(drop=True)
+
+
+def _label_groups(labels):
+    """Return list of (key, values) from any label filter specification."""
+    if isinstance(labels, dict):
+        labels = [(key, value) for key, values in labels.items()
+                  for value in (values if isinstance(values, (list, tuple, set))
+                                else [values])]
+    elif isinstance(labels, (str, int, float)):
+        labels = [labels]
+
+    groups = {}
+    for label in labels:
+        if isinstance(label, dict):
+            key, value = label["key"], label["value"]
+        elif isinstance(label, (list, tuple)):
+            key, value = label
+        else:
+            key, value = None, label
+        groups.setdefault(key, []).append(str(value))
+
+    if len(groups) == 0:
+        raise ValueError("Argument 'labels' must specify at least one label.")
+
+    return [(None if key is None else str(key), values)
+            for key, values in groups.items()]
+
+
+def _nest_annotations(annotations, recording_ids):
+    """Group annotation rows by recording as lists of annotation dicts."""
+    nested = {recording_id: [] for recording_id in recording_ids}
+    for recording_id, atype, aid, labels, metadata, geometry in zip(
+            annotations["recording"], annotations["type"], annotations["id"],
+            annotations["labels"], annotations["metadata"],
+            annotations["geometry"]):
+        nested[recording_id].append({
+            'type': atype,
+            'id': aid,
+            'labels': labels,
+            'metadata': metadata,
+            'geometry': {
+                'wkt': geometry
+            }
+        })
+    return [nested[recording_id] for recording_id in recording_ids]
 
 
 class Collection:
@@ -123,6 +316,8 @@ class Collection:
             offset=0,
             with_metadata=False,
             with_annotations=False,
+            id_range=None,
+            annotation_format="nested",
             **kwargs):
         """Get audio dataframe from query.
 
@@ -141,43 +336,97 @@ class Collection:
             Wether to include metadata in the response or not.
         with_annotations : bool
             Wether to include annotations in the response or not.
+        id_range : tuple
+            Restrict recordings to ids in the half open range (start, stop).
+            Either end can be None.
+        annotation_format : str
+            Either 'nested', to add an 'annotations' column with a list of
+            annotations per recording, or 'long', to return annotations as
+            a separate dataframe with one row per annotation.
 
         Returns
         -------
         recording_dataframe : pandas.DataFrame
             A dataframe holding recordings.
+        annotation_dataframe : pandas.DataFrame
+            A dataframe holding annotations of the recordings. Only returned
+            when 'with_annotations' is True and 'annotation_format' is 'long'.
         """
-        if limit is None:
-            query_slice = slice(offset, None)
-        else:
-            query_slice = slice(offset, offset + limit)
-        recordings = self.recordings(query=query, **kwargs).order_by(lambda r: r.id)[query_slice]
+        if annotation_format not in ("nested", "long"):
+            message = ("Argument 'annotation_format' must be either "
+                       "'nested' or 'long'.")
+            raise ValueError(message)
+
+        long_format = with_annotations and annotation_format == "long"
+        batches = self.recording_batches(
+            query=query,
+            limit=limit,
+            offset=offset,
+            with_metadata=with_metadata,
+            with_annotations=with_annotations and not long_format,
+            id_range=id_range,
+            **kwargs)
+
+        if not long_format:
+            return _concat_batches(list(batches))
+
+        recordings = []
+        annotations = []
+        for batch in batches:
+            recordings.append(batch)
+            annotations.append(self.get_recording_annotations(
+                batch["id"], with_metadata=with_metadata))
 
-        records = []
-        for recording in recordings:
-            data = recording.to_dict()
-            media_info = data.pop('media_info')
-            data.update(media_info)
-            data["path"] = self.get_abspath(data["path"])
+        return _concat_batches(recordings), _concat_batches(annotations)
 
-            if not with_metadata:
-                data.pop('metadata')
+    def get_recording_annotations(self, recording_ids, with_metadata=False):
+        """Get annotations of a group of recordings with a few queries.
 
-            if with_annotations:
-                data['annotations'] = [
-                    _parse_annotation(annotation)
-                    for annotation in recording.annotations]
+        Annotations are fetched by recording id membership, with one query
+        per chunk of at most MAX_QUERY_IDS recording ids so that bound
+        parameters stay within database limits.
 
-            records.append(data)
+        Parameters
+        ----------
+        recording_ids : array-like
+            Recording ids.
+        with_metadata : bool
+            Wether to include metadata in the response or not.
 
-        return pd.DataFrame(records)
+        Returns
+        -------
+        annotation_dataframe : pandas.DataFrame
+            A dataframe holding annotations, one row per annotation.
+        """
+        columns, rows = self._recording_annotation_rows(recording_ids)
+        return self.build_annotation_batch(columns, rows,
+                                           with_metadata=with_metadata)
+
+    def _recording_annotation_rows(self, recording_ids):
+        recording_ids = np.asarray(recording_ids, dtype=np.int64)
+        columns, expression = _model_projection(self.annotations_model)
+        if recording_ids.size == 0:
+            return columns, []
+
+        recording_ids = np.unique(recording_ids)
+        rows = []
+        with db_session:
+            for start in range(0, recording_ids.size, MAX_QUERY_IDS):
+                ids = recording_ids[start:start + MAX_QUERY_IDS].tolist()
+                matches = self.annotations(
+                    query=lambda a: a.recording.id in ids)
+                rows.extend(select(f"{expression} for x in matches"))
+
+        rows.sort(key=lambda row: row[0])
+        return columns, rows
 
     def get_annotation_dataframe(
             self,
             query=None,
             limit=None,
             offset=0,
-            with_metadata=None):
+            with_metadata=None,
+            labels=None):
         """Get annotation dataframe from query.
 
         Fetch recording entries and build a pandas dataframe compatible with
@@ -193,34 +442,274 @@ class Collection:
             Skip this many entries and return the rest up to limit.
         with_metadata: bool
             Wether to include metadata in the response or not.
+        labels: dict, list
+            Only return annotations with any of these labels. See
+            'annotations'.
 
         Returns
         -------
         annotation_dataframe: pandas.DataFrame
             A dataframe holding annotations.
         """
-        if limit is None:
-            query_slice = slice(offset, None)
-        else:
-            query_slice = slice(offset, offset + limit)
-        annotations = self.annotations(query=query).order_by(lambda a: a.id)[query_slice]
+        return _concat_batches(list(self.annotation_batches(
+            query=query,
+            limit=limit,
+            offset=offset,
+            with_metadata=with_metadata,
+            labels=labels)))
+
+    def recording_batches(
+            self,
+            query=None,
+            batch_size=DEFAULT_BATCH_SIZE,
+            limit=None,
+            offset=0,
+            with_metadata=False,
+            as_arrow=False,
+            id_range=None,
+            with_annotations=False,
+            **kwargs):
+        """Iterate over recording dataframes in batches.
 
-        records = []
-        for annotation in annotations:
-            data = annotation.to_dict()
-            labels = data.pop('labels')
+        Rows are read in pages ordered by recording id using keyset
+        pagination and batches are built directly from raw rows, so memory
+        usage is bounded by the batch size.
 
-            if not with_metadata:
-                data.pop('metadata')
+        Parameters
+        ----------
+        query : callable
+            A function that conforms to Pony's query syntax.
+        batch_size : int
+            Number of recordings per batch.
+        limit : int
+            The number of maximum entries to return.
+        offset : int
+            Skip this many entries and return the rest up to limit.
+        with_metadata : bool
+            Wether to include metadata in the response or not.
+        as_arrow : bool
+            Wether to yield pyarrow tables instead of pandas dataframes.
+        id_range : tuple
+            Restrict recordings to ids in the half open range (start, stop).
+            Either end can be None.
+        with_annotations : bool
+            Wether to add an 'annotations' column with the list of
+            annotations of each recording. Annotations are fetched by
+            recording id, see 'get_recording_annotations'.
+
+        Yields
+        ------
+        recording_dataframe : pandas.DataFrame, pyarrow.Table
+            A batch of recordings.
+        """
+        matches = self.recordings(query=query, **kwargs)
+        for columns, rows in _iter_rows(self.recordings_model, matches,
+                                        batch_size=batch_size,
+                                        limit=limit,
+                                        offset=offset,
+                                        id_range=id_range):
+            batch = self.build_recording_batch(columns, rows,
+                                               with_metadata=with_metadata)
+            if with_annotations:
+                ann_columns, ann_rows = self._recording_annotation_rows(batch["id"])
+                annotations = pd.DataFrame.from_records(ann_rows,
+                                                        columns=ann_columns)
+                batch["annotations"] = _nest_annotations(annotations,
+                                                         batch["id"].tolist())
+            if as_arrow:
+                batch = pa.Table.from_pandas(batch, preserve_index=False)
+            yield batch
+
+    def build_recording_batch(self, columns, rows, with_metadata=False):
+        """Build recording dataframe from raw rows."""
+        batch = pd.DataFrame.from_records(rows, columns=columns)
+        media_info = pd.DataFrame.from_records(batch.pop("media_info").tolist(),
+                                               index=batch.index)
+        batch = batch.drop(columns=[col for col in media_info.columns
+                                    if col in batch.columns])
+        batch = pd.concat([batch, media_info], axis=1)
+        batch["path"] = [self.get_abspath(path) for path in batch["path"]]
+
+        if not with_metadata:
+            batch = batch.drop(columns="metadata")
+
+        return batch
+
+    def annotation_batches(
+            self,
+            query=None,
+            batch_size=DEFAULT_BATCH_SIZE,
+            limit=None,
+            offset=0,
+            with_metadata=False,
+            as_arrow=False,
+            id_range=None,
+            labels=None):
+        """Iterate over annotation dataframes in batches.
 
-            data['labels'] = labels
+        Rows are read in pages ordered by annotation id using keyset
+        pagination and batches are built directly from raw rows.
 
-            for label in labels:
-                data[label['key']] = label['value']
+        Parameters
+        ----------
+        query : callable
+            A function that conforms to Pony's query syntax.
+        batch_size : int
+            Number of annotations per batch.
+        limit : int
+            The number of maximum entries to return.
+        offset : int
+            Skip this many entries and return the rest up to limit.
+        with_metadata : bool
+            Wether to include metadata in the response or not.
+        as_arrow : bool
+            Wether to yield pyarrow tables instead of pandas dataframes.
+            Labels are stored as json strings in this case.
+        id_range : tuple
+            Restrict annotations to ids in the half open range (start, stop).
+            Either end can be None.
+        labels : dict, list
+            Only return annotations with any of these labels. See
+            'annotations'.
+
+        Yields
+        ------
+        annotation_dataframe : pandas.DataFrame, pyarrow.Table
+            A batch of annotations.
+        """
+        matches = self.annotations(query=query, labels=labels)
+        for columns, rows in _iter_rows(self.annotations_model, matches,
+                                        batch_size=batch_size,
+                                        limit=limit,
+                                        offset=offset,
+                                        id_range=id_range):
+            batch = self.build_annotation_batch(columns, rows,
+                                                with_metadata=with_metadata)
+            if as_arrow:
+                batch["labels"] = [json.dumps(labels)
+                                   for labels in batch["labels"]]
+                batch = pa.Table.from_pandas(batch, preserve_index=False)
+            yield batch
+
+    def build_annotation_batch(self, columns, rows, with_metadata=False):
+        """Build annotation dataframe from raw rows."""
+        batch = pd.DataFrame.from_records(rows, columns=columns)
+
+        if not with_metadata:
+            batch = batch.drop(columns="metadata")
+
+        label_values = pd.DataFrame.from_records(
+            [{label["key"]: label["value"] for label in labels}
+             for labels in batch["labels"]],
+            index=batch.index)
+        batch = batch.drop(columns=[col for col in label_values.columns
+                                    if col in batch.columns])
+
+        return pd.concat([batch, label_values], axis=1)
+
+    def get_recording_dask_dataframe(
+            self,
+            query=None,
+            partition_size=DEFAULT_PARTITION_SIZE,
+            **kwargs):
+        """Build a dask dataframe of recordings partitioned by id ranges.
 
-            records.append(data)
+        Partition boundaries are computed with a single ordered id query
+        over the same filtered recordings that partitions read, and each
+        partition reads its own id range with a new database connection,
+        so the collection must use a persistent database.
 
-        return pd.DataFrame(records)
+        Parameters
+        ----------
+        query : callable
+            A function that conforms to Pony's query syntax.
+        partition_size : int
+            Number of recordings per partition.
+        **kwargs
+            Additional arguments passed to 'recording_batches'.
+
+        Returns
+        -------
+        recording_dataframe : dask.dataframe.DataFrame
+            A dask dataframe holding recordings.
+        """
+        batch_options = signature(self.recording_batches).parameters
+        filters = {key: value for key, value in kwargs.items()
+                   if key not in batch_options}
+        matches = self.recordings(query=query, **filters)
+        return self._dask_dataframe("recording_batches", matches,
+                                    partition_size,
+                                    dict(query=query, **kwargs))
+
+    def get_annotation_dask_dataframe(
+            self,
+            query=None,
+            partition_size=DEFAULT_PARTITION_SIZE,
+            **kwargs):
+        """Build a dask dataframe of annotations partitioned by id ranges.
+
+        Every partition has one column per label key found in the queried
+        annotations.
+
+        Parameters
+        ----------
+        query : callable
+            A function that conforms to Pony's query syntax.
+        partition_size : int
+            Number of annotations per partition.
+        **kwargs
+            Additional arguments passed to 'annotation_batches'.
+
+        Returns
+        -------
+        annotation_dataframe : dask.dataframe.DataFrame
+            A dask dataframe holding annotations.
+        """
+        matches = self.annotations(query=query, labels=kwargs.get("labels"))
+        with db_session:
+            label_keys = list(select(l.key for a in matches
+                                     for l in a.label_set).order_by(1))
+        return self._dask_dataframe("annotation_batches", matches,
+                                    partition_size,
+                                    dict(query=query, **kwargs),
+                                    extra_columns=label_keys)
+
+    def _dask_dataframe(self, method, matches, partition_size, kwargs,
+                        extra_columns=None):
+        if kwargs.get("as_arrow", False):
+            raise ValueError("Dask dataframes can not be built from arrow "
+                             "batches.")
+
+        with db_session:
+            ids = np.array(select(x.id for x in matches).order_by(1)[:],
+                           dtype=np.int64)
+
+        if ids.size == 0:
+            return dd.from_pandas(_concat_batches([]), npartitions=1)
+
+        # Column names and dtypes are taken from the first row, completed
+        # with columns that only some partitions would produce.
+        sample_kwargs = {key: value for key, value in kwargs.items()
+                         if key not in ("batch_size", "limit", "offset")}
+        sample = next(getattr(self, method)(batch_size=1, limit=1,
+                                            **sample_kwargs))
+        meta = sample.iloc[:0].copy()
+        for column in extra_columns or []:
+            if column not in meta.columns:
+                meta[column] = pd.Series(dtype=object)
+
+        starts = ids[::partition_size].tolist()
+        stops = starts[1:] + [None]
+
+        partitions = [delayed(_load_partition)(self.__class__,
+                                               copy.deepcopy(self.db_config),
+                                               self.base_path,
+                                               method,
+                                               (start, stop),
+                                               kwargs,
+                                               meta=meta)
+                      for start, stop in zip(starts, stops)]
+        return dd.from_delayed(partitions, meta=meta)
 
     def get_db_manager(self):
         """Get database manager.
@@ -383,7 +872,7 @@ class Collection:
         """
         return self.db_manager.models.annotation
 
-    def annotations(self, query=None, iterate=True):
+    def annotations(self, query=None, iterate=True, labels=None):
         """Retrieve annotations from database.
 
         Fetch annotations according to query.
@@ -394,12 +883,29 @@ class Collection:
             A function that conforms to Pony's query syntax.
         iterate: bool
             Wether to return as list or as an iterator.
+        labels: dict, list
+            Only return annotations with any of these labels. Labels are
+            given as a dictionary mapping keys to a value or list of values,
+            a list of (key, value) tuples or label dictionaries, or a list
+            of values that may appear under any key. The filter uses the
+            indexed label table.
         Returns
         -------
         annotations: list, iterator
             A list of annotations as pony entities.
         """
         matches = self.db_manager.select(query, model="annotation")
+        if labels is not None:
+            groups = _label_groups(labels)
+            conditions = []
+            for ind, (key, _) in enumerate(groups):
+                condition = f"l.value in groups[{ind}][1]"
+                if key is not None:
+                    condition = f"l.key == groups[{ind}][0] and {condition}"
+                conditions.append(f"({condition})")
+            matches = matches.filter(
+                "lambda a: exists(l for l in a.label_set if "
+                + " or ".join(conditions) + ")")
         if iterate:
             return matches
         return list(matches)
@@ -437,15 +943,17 @@ class Collection:
         with_metadata: bool
             Wether to include metadata in the response or not.
 
+        Annotations are read as rows with a single query and stored in an
+        AnnotationArray, so no Annotation object is built until one is
+        accessed.
+
         Returns
         -------
         audio: Audio
         """
-        annotations = []
-        for annotation in recording.annotations:
-            data = annotation.to_dict()
-            annotation = self.annotation_class.from_record(data)
-            annotations.append(annotation)
+        columns, rows = self._recording_annotation_rows([recording.id])
+        annotations = AnnotationArray.from_dataframe(
+            pd.DataFrame.from_records(rows, columns=columns))
 
         metadata = recording.metadata if with_metadata else None
 
@@ -474,7 +982,8 @@ class Collection:
 
         datastore.insert_into(self)
 
-    def materialize(self, out_name, query=None, out_dir="", tqdm=None):
+    def materialize(self, out_name, query=None, out_dir="", tqdm=None,
+                    workers=1, link="copy", batch_size=500, verify=True):
         """Create materialized collection.
 
         Create an sqlite copy of collection's database as well as a directory
@@ -490,6 +999,17 @@ class Collection:
             A target directory to copy data.
         tqdm: module
             A tqdm module to use for reporting progress.
+        workers: int
+            Number of threads copying files concurrently.
+        link: str
+            How to place files in the target directory. One of 'copy',
+            'hardlink', 'reflink' or 'auto'. Links are only used for local
+            files on the same filesystem as the target directory, any other
+            file is copied.
+        batch_size: int
+            Number of recordings copied and inserted per transaction.
+        verify: bool
+            Wether to check the size of copied files against their source.
 
         Returns
         -------
@@ -501,7 +1021,11 @@ class Collection:
         copystore = CopyDatastore(collection=self,
                                   query=query,
                                   target_path=target_path,
-                                  tqdm=tqdm)
+                                  tqdm=tqdm,
+                                  workers=workers,
+                                  link=link,
+                                  batch_size=batch_size,
+                                  verify=verify)
         col_type = "simple"
         if isinstance(self.db_manager, TimedDatabaseManager):
             col_type = "timed"
@@ -533,13 +1057,66 @@ class TimedCollection(Collection):
     """Time aware collection."""
     db_manager_class = TimedDatabaseManager
 
+    def recordings(self, query=None, iterate=True, time_range=None):
+        """Retrieve recording objects from database
+
+        Fetch recordings according to query.
+
+        Parameters
+        ----------
+        query: callable
+            A function that conforms to Pony's query syntax.
+        iterate: bool
+            Wether to return as list or as an iterator.
+        time_range: tuple
+            Only return recordings with UTC time in the half open range
+            (start, end). Either end can be None. Times can be datetimes or
+            strings; timezone aware times are converted to UTC. The range
+            is resolved with the recording time index.
+        Returns
+        -------
+        recordings: list, iterator
+            A list of recording entries as pony entities.
+        """
+        matches = _filter_time_range(super().recordings(query=query), time_range)
+        if iterate:
+            return matches
+        return list(matches)
+
+    def daily_counts(self, query=None, time_range=None):
+        """Count recordings per datastore and UTC day.
+
+        Counts are aggregated by the database without loading recordings.
+
+        Parameters
+        ----------
+        query: callable
+            A function that conforms to Pony's query syntax.
+        time_range: tuple
+            Only count recordings with UTC time in the half open range
+            (start, end).
+
+        Returns
+        -------
+        counts: pandas.DataFrame
+            A dataframe with columns 'datastore', 'date', 'count' and
+            'duration' (total seconds of audio).
+        """
+        return _daily_counts(self.recordings(query=query, time_range=time_range))
+
 class SpatialCollection(Collection):
     """Geographic aware collection."""
     db_manager_class = SpatialDatabaseManager
 
-    def recordings(self, query=None, wkt=None, method='intersects', iterate=True):
-        """Retrieve audio objects."""
-        if wkt is not None:
+    def recordings(self, query=None, wkt=None, method='intersects', iterate=True,
+                   bbox=None):
+        """Retrieve audio objects.
+
+        Recordings can be filtered by a WKT geometry, a list of WKT
+        geometries or a bounding box (min_lon, min_lat, max_lon, max_lat).
+        """
+        if wkt is not None or bbox is not None:
+            wkt = as_wkt(wkt=wkt, bbox=bbox)
             geom_query = build_query_with_geom(provider=self.db_manager.provider, wkt=wkt, method=method)
             matches = self.db_manager.select(geom_query, model="recording")
             if query is not None:
@@ -551,46 +1128,71 @@ class SpatialCollection(Collection):
             return matches
         return list(matches)
 
-    def get_recording_dataframe(
-            self,
-            query=None,
-            limit=None,
-            offset=0,
-            with_metadata=False,
-            with_annotations=False,
-            with_geometry=False,
-            **kwargs):
-        if limit is None:
-            query_slice = slice(offset, None)
-        else:
-            query_slice = slice(offset, offset + limit)
-        recordings = self.recordings(query=query, **kwargs).order_by(lambda r: r.id)[query_slice]
+    def recording_ids(self, wkt=None, bbox=None, method='intersects'):
+        """Return ids of recordings matching a geometry.
 
-        records = []
-        for recording in recordings:
-            data = recording.to_dict()
-            media_info = data.pop('media_info')
-            data.update(media_info)
-            data["path"] = self.get_abspath(data["path"])
+        Ids are read with a single query without building recording
+        entities.
 
-            if not with_metadata:
-                data.pop('metadata')
+        Parameters
+        ----------
+        wkt: str, list
+            A WKT geometry or a list of WKT geometries.
+        bbox: tuple
+            Bounding box as (min_lon, min_lat, max_lon, max_lat).
+        method: str
+            Spatial predicate. One of 'intersects', 'within' or 'touches'.
 
-            if not with_geometry:
-                data.pop('geometry')
-            else:
-                data["geometry"] = shapely.wkt.loads(data["geometry"])
+        Returns
+        -------
+        ids: numpy.ndarray
+            Sorted recording ids.
+        """
+        ids = self.db_manager.select_ids(wkt=wkt, bbox=bbox, method=method)
+        return np.array(ids, dtype=np.int64)
 
-            if with_annotations:
-                data['annotations'] = [
-                    _parse_annotation(annotation)
-                    for annotation in recording.annotations]
+    def recording_batches(self, query=None, with_geometry=False,
+                          as_arrow=False, **kwargs):
+        """Iterate over recording dataframes in batches.
 
-            records.append(data)
+        Geometries are parsed as shapely objects if 'with_geometry' is True,
+        except for pyarrow tables that keep them as WKT strings.
+        """
+        for batch in super().recording_batches(query=query, **kwargs):
+            if not with_geometry:
+                batch = batch.drop(columns="geometry")
+            elif not as_arrow:
+                batch["geometry"] = batch["geometry"].map(shapely.wkt.loads)
 
-        return pd.DataFrame(records)
+            if as_arrow:
+                batch = pa.Table.from_pandas(batch, preserve_index=False)
+            yield batch
 
 
 class SpatioTemporalCollection(SpatialCollection):
     """Geographic aware collection."""
     db_manager_class = SpatioTemporalDatabaseManager
+
+    def recordings(self, query=None, wkt=None, method='intersects', iterate=True,
+                   bbox=None, time_range=None):
+        """Retrieve audio objects.
+
+        Recordings can be filtered by geometry as in SpatialCollection and
+        by a half open UTC time range (start, end) as in TimedCollection.
+        """
+        matches = super().recordings(query=query, wkt=wkt, method=method,
+                                     bbox=bbox)
+        matches = _filter_time_range(matches, time_range)
+        if iterate:
+            return matches
+        return list(matches)
+
+    def daily_counts(self, query=None, time_range=None, **kwargs):
+        """Count recordings per datastore and UTC day.
+
+        See TimedCollection.daily_counts. Additional arguments are used to
+        filter recordings by geometry.
+        """
+        return _daily_counts(self.recordings(query=query,
+                                             time_range=time_range,
+                                             **kwargs))
@@ -4,9 +4,51 @@ Annotated Object Module.
 This module defines a Mixin that can be given to all
 objects that posses annotations.
 """
+from uuid import uuid4
 from inspect import signature
+import numpy as np
 import pandas as pd
+import yuntu.core.geometry as geom
+from yuntu.core.utils.atlas import INFINITY
+from yuntu.core.annotation.labels import Label
+from yuntu.core.annotation.labels import Labels
+from yuntu.core.annotation import annotation as annotation_module
 from yuntu.core.annotation.annotation import Annotation
+from yuntu.core.annotation.index import AnnotationIndex
+from yuntu.core.annotation.index import BOX_GEOMETRIES
+
+
+ANNOTATION_CLASSES = [
+    annotation_module.WeakAnnotation,
+    annotation_module.TimeLineAnnotation,
+    annotation_module.TimeIntervalAnnotation,
+    annotation_module.FrequencyLineAnnotation,
+    annotation_module.FrequencyIntervalAnnotation,
+    annotation_module.BBoxAnnotation,
+    annotation_module.LineStringAnnotation,
+    annotation_module.PolygonAnnotation,
+    annotation_module.PointAnnotation,
+]
+ANNOTATION_CODES = {
+    **{cls.name.value: code for code, cls in enumerate(ANNOTATION_CLASSES)},
+    **{cls.__name__: code for code, cls in enumerate(ANNOTATION_CLASSES)},
+}
+
+# Geometry fields that hold the (start_time, min_freq, end_time, max_freq)
+# bounds of box geometries. Missing fields are unbounded.
+BOX_FIELDS = {
+    geom.Geometry.Types.Weak: (None, None, None, None),
+    geom.Geometry.Types.TimeLine: ('time', None, 'time', None),
+    geom.Geometry.Types.TimeInterval: (
+        'start_time', None, 'end_time', None),
+    geom.Geometry.Types.FrequencyLine: (None, 'freq', None, 'freq'),
+    geom.Geometry.Types.FrequencyInterval: (
+        None, 'min_freq', None, 'max_freq'),
+    geom.Geometry.Types.BBox: (
+        'start_time', 'min_freq', 'end_time', 'max_freq'),
+    geom.Geometry.Types.Point: ('time', 'freq', 'time', 'freq'),
+}
+BOUND_COLUMNS = ['start_time', 'min_freq', 'end_time', 'max_freq']
 
 
 class AnnotationList(list):
@@ -42,6 +84,10 @@ class AnnotationList(list):
 
     filter(func)
 
+    build_index()
+
+    intersecting(window)
+
     """
     def to_dict(self):
         """Produce list of dictionaries from AnnotationList."""
@@ -101,13 +147,15 @@ class AnnotationList(list):
         """
         data = []
         for annotation in self:
+            start_time, min_freq, end_time, max_freq = (
+                annotation.geometry.bounds)
             row = {
                 'id': annotation.id,
                 'type': type(annotation).__name__,
-                'start_time': annotation.geometry.bounds[0],
-                'end_time': annotation.geometry.bounds[2],
-                'min_freq': annotation.geometry.bounds[1],
-                'max_freq': annotation.geometry.bounds[3]
+                'start_time': start_time,
+                'end_time': end_time,
+                'min_freq': min_freq,
+                'max_freq': max_freq
             }
             for label in annotation.iter_labels():
                 row[label.key] = label.value
@@ -194,6 +242,754 @@ class AnnotationList(list):
         return AnnotationList(annotations)
 
 
+    def build_index(self):
+        """Return time and frequency index over annotations.
+
+        The index is not updated when annotations are added to the list.
+
+        Returns
+        -------
+        AnnotationIndex
+        """
+        return AnnotationIndex.from_annotations(self)
+
+    def intersecting(self, window):
+        """Return new AnnotationList with annotations that intersect window.
+
+        Parameters
+        ----------
+        window : Window, Geometry, Annotation or shapely.geometry
+
+        Returns
+        -------
+        AnnotationList
+        """
+        return AnnotationList(self.build_index().query(window))
+
+
+class AnnotationArray:
+    """Columnar list of annotations.
+
+    Annotations are stored by columns instead of as a list of objects. The
+    bounds of all geometries are held in float arrays, labels are stored
+    as codes into a table of distinct labels and the annotation type as a
+    small integer code. Only polygon and linestring geometries are kept,
+    all other geometries are rebuilt from their bounds when needed.
+
+    Annotation objects are built on access, hence modifying an annotation
+    obtained from the array does not modify the array. For this reason
+    annotated objects only keep an AnnotationArray when one is given and
+    use an AnnotationList otherwise. Bounds follow the
+    convention of Geometry.bounds, unbounded sides are stored as NaN.
+
+    Parameters
+    ----------
+    annotations : list of Annotation or dict, optional
+
+    Attributes
+    ----------
+    start_times : numpy.array
+    end_times : numpy.array
+    min_freqs : numpy.array
+    max_freqs : numpy.array
+    ids : list of str
+
+    Methods
+    -------
+    to_dict()
+
+    add(annotation=None, geometry=None, labels=None, metadata=None, id=None)
+
+    add_multiple(annotations)
+
+    take(positions)
+
+    copy()
+
+    to_dataframe(with_geometry=True)
+
+    from_dataframe(dataframe, label_columns=None)
+
+    plot(ax=None, **kwargs)
+
+    buffer(buffer=None, **kwargs)
+
+    apply(func)
+
+    filter(func)
+
+    build_index()
+
+    intersecting(window)
+
+    """
+
+    def __init__(self, annotations=None):
+        self._types = np.zeros([0], dtype=np.int8)
+        self._columns = {
+            column: np.zeros([0], dtype=float)
+            for column in BOUND_COLUMNS}
+        self._label_offsets = np.zeros([1], dtype=np.int64)
+        self._label_codes = np.zeros([0], dtype=np.int64)
+        self._ids = []
+        self._metadata = []
+        self._geometries = {}
+
+        # The label table only grows, so it can be shared between arrays.
+        self._label_table = []
+        self._label_lookup = {}
+
+        # Rows added since the columns were last built.
+        self._pending = []
+
+        if annotations is not None:
+            self.add_multiple(annotations)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return f'AnnotationArray(size={len(self)})'
+
+    def __iter__(self):
+        self._flush()
+        for position in range(len(self)):
+            yield self._get(position)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+
+            if key < 0 or key >= len(self):
+                raise IndexError('AnnotationArray index out of range')
+
+            self._flush()
+            return self._get(key)
+
+        if isinstance(key, slice):
+            return self.take(np.arange(len(self))[key])
+
+        key = np.asarray(key)
+        if key.dtype == bool:
+            key = np.nonzero(key)[0]
+
+        return self.take(key)
+
+    @property
+    def start_times(self):
+        self._flush()
+        return self._columns['start_time']
+
+    @property
+    def end_times(self):
+        self._flush()
+        return self._columns['end_time']
+
+    @property
+    def min_freqs(self):
+        self._flush()
+        return self._columns['min_freq']
+
+    @property
+    def max_freqs(self):
+        self._flush()
+        return self._columns['max_freq']
+
+    @property
+    def ids(self):
+        return self._ids
+
+    def _label_code(self, key, value, type=None):
+        entry = (key, value, type)
+        try:
+            lookup = (key, type, value.__class__, value)
+            if lookup in self._label_lookup:
+                return self._label_lookup[lookup]
+            self._label_lookup[lookup] = len(self._label_table)
+        except TypeError:
+            # Unhashable values are stored without interning
+            pass
+
+        self._label_table.append(entry)
+        return len(self._label_table) - 1
+
+    def _label_codes_from_list(self, labels):
+        if isinstance(labels, Labels):
+            labels = list(labels)
+
+        codes = []
+        keys = set()
+        for label in labels:
+            if isinstance(label, Label):
+                key, value, label_type = label.key, label.value, label.type
+            else:
+                key = label['key']
+                value = label['value']
+                label_type = label.get('type', None)
+
+            if key in keys:
+                message = 'Label list has two values for the same key.'
+                raise ValueError(message)
+            keys.add(key)
+
+            codes.append(self._label_code(key, value, label_type))
+        return codes
+
+    def _append(
+            self,
+            type_code,
+            bounds,
+            label_codes,
+            id=None,
+            metadata=None,
+            geometry=None):
+        if id is None:
+            id = str(uuid4())
+
+        if geometry is not None:
+            self._geometries[len(self._ids)] = geometry
+
+        self._pending.append((type_code, *bounds, label_codes))
+        self._ids.append(id)
+        self._metadata.append(metadata)
+
+    def _append_annotation(self, annotation):
+        geometry = annotation.geometry
+        if geometry.name in BOX_GEOMETRIES:
+            geometry = None
+
+        self._append(
+            ANNOTATION_CODES[annotation.name.value],
+            annotation.geometry.bounds,
+            self._label_codes_from_list(annotation.labels),
+            id=annotation.id,
+            metadata=annotation.metadata,
+            geometry=geometry)
+
+    def _append_dict(self, data):
+        try:
+            type_code = ANNOTATION_CODES[data['type']]
+        except KeyError:
+            message = 'Annotation is of unknown type.'
+            raise ValueError(message)
+
+        name = ANNOTATION_CLASSES[type_code].geometry_class.name
+        geometry_data = data.get('geometry', {})
+        fields = BOX_FIELDS.get(name)
+
+        geometry = None
+        if fields is not None and all(
+                field is None or field in geometry_data
+                for field in fields):
+            bounds = [
+                None if field is None else geometry_data[field]
+                for field in fields]
+        else:
+            geometry_data = dict(geometry_data)
+            if 'type' not in geometry_data:
+                geometry_data['type'] = name.name
+            geometry = geom.Geometry.from_dict(geometry_data)
+            bounds = geometry.bounds
+
+            if name in BOX_GEOMETRIES:
+                geometry = None
+
+        self._append(
+            type_code,
+            bounds,
+            self._label_codes_from_list(data.get('labels', [])),
+            id=data.get('id', None),
+            metadata=data.get('metadata', None),
+            geometry=geometry)
+
+    def _flush(self):
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = []
+
+        types, *bounds, label_codes = zip(*pending)
+        self._types = np.concatenate([
+            self._types,
+            np.array(types, dtype=np.int8)])
+
+        bounds = np.array(bounds, dtype=float)
+        for column, values in zip(BOUND_COLUMNS, bounds):
+            self._columns[column] = np.concatenate([
+                self._columns[column],
+                values])
+
+        counts = np.array([len(codes) for codes in label_codes],
+                          dtype=np.int64)
+        self._label_offsets = np.concatenate([
+            self._label_offsets,
+            self._label_offsets[-1] + np.cumsum(counts)])
+        self._label_codes = np.concatenate([
+            self._label_codes,
+            np.array([code for codes in label_codes for code in codes],
+                     dtype=np.int64)])
+
+    def _get_labels(self, position):
+        start = self._label_offsets[position]
+        end = self._label_offsets[position + 1]
+        return [
+            Label(*self._label_table[code])
+            for code in self._label_codes[start:end]]
+
+    def _box_fields(self, position):
+        annotation_class = ANNOTATION_CLASSES[self._types[position]]
+        fields = BOX_FIELDS[annotation_class.geometry_class.name]
+        return {
+            field: float(self._columns[column][position])
+            for field, column in zip(fields, BOUND_COLUMNS)
+            if field is not None}
+
+    def _geometry(self, position):
+        annotation_class = ANNOTATION_CLASSES[self._types[position]]
+        geometry_class = annotation_class.geometry_class
+
+        if position not in self._geometries:
+            return geometry_class(**self._box_fields(position))
+
+        geometry = self._geometries[position]
+        if isinstance(geometry, str):
+            geometry = geometry_class(wkt=geometry)
+            self._geometries[position] = geometry
+
+        return geometry
+
+    def _get(self, position):
+        annotation_class = ANNOTATION_CLASSES[self._types[position]]
+        return annotation_class(
+            labels=Labels(self._get_labels(position)),
+            id=self._ids[position],
+            metadata=self._metadata[position],
+            geometry=self._geometry(position))
+
+    def to_dict(self):
+        """Produce list of dictionaries from AnnotationArray."""
+        self._flush()
+
+        data = []
+        for position in range(len(self)):
+            annotation_class = ANNOTATION_CLASSES[self._types[position]]
+
+            geometry = self._geometries.get(position, None)
+            if geometry is None:
+                geometry_data = {
+                    'type': annotation_class.geometry_class.name.value,
+                    **self._box_fields(position)}
+            elif isinstance(geometry, str):
+                geometry_data = {
+                    'type': annotation_class.geometry_class.name.value,
+                    'wkt': geometry}
+            else:
+                geometry_data = geometry.to_dict()
+
+            row = {
+                'id': self._ids[position],
+                'labels': [
+                    label.to_dict()
+                    for label in self._get_labels(position)],
+                'type': annotation_class.name.value,
+                'geometry': geometry_data
+            }
+
+            if self._metadata[position] is not None:
+                row['metadata'] = self._metadata[position]
+
+            data.append(row)
+        return data
+
+    def add(
+            self,
+            annotation=None,
+            geometry=None,
+            labels=None,
+            metadata=None,
+            id=None):
+        """Append annotation to AnnotationArray.
+
+        Parameters
+        ----------
+
+        annotation : Annotation or dict, optional
+        geometry : shapely.geometry, optional
+        labels : dict, optional
+        metadata : dict, optional
+        id : str, optional
+        """
+        if annotation is None:
+            annotation = Annotation(
+                geometry=geometry,
+                labels=labels,
+                metadata=metadata,
+                id=id)
+
+        if isinstance(annotation, Annotation):
+            self._append_annotation(annotation)
+        else:
+            self._append_dict(annotation)
+
+    def append(self, annotation):
+        """Append annotation to AnnotationArray."""
+        self.add(annotation=annotation)
+
+    def add_multiple(self, annotations):
+        """Append annotations to AnnotationArray.
+
+        Parameters
+        ----------
+        annotations : list of Annotation or dict
+        """
+        if isinstance(annotations, AnnotationArray):
+            annotations = annotations.to_dict()
+
+        for annotation in annotations:
+            self.add(annotation=annotation)
+
+    def extend(self, annotations):
+        """Append annotations to AnnotationArray."""
+        self.add_multiple(annotations)
+
+    def take(self, positions):
+        """Return new AnnotationArray with annotations at given positions.
+
+        Parameters
+        ----------
+        positions : array-like of int
+
+        Returns
+        -------
+        AnnotationArray
+        """
+        self._flush()
+        positions = np.asarray(positions, dtype=np.int64).reshape([-1])
+        positions = np.where(positions < 0, positions + len(self), positions)
+
+        new = type(self)()
+        new._label_table = self._label_table
+        new._label_lookup = self._label_lookup
+        new._types = self._types[positions]
+        new._columns = {
+            column: values[positions]
+            for column, values in self._columns.items()}
+
+        starts = self._label_offsets[positions]
+        counts = self._label_offsets[positions + 1] - starts
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        new._label_offsets = offsets
+        new._label_codes = self._label_codes[
+            np.repeat(starts - offsets[:-1], counts) +
+            np.arange(offsets[-1])]
+
+        new._ids = [self._ids[position] for position in positions]
+        new._metadata = [self._metadata[position] for position in positions]
+        if self._geometries:
+            new._geometries = {
+                new_position: self._geometries[position]
+                for new_position, position in enumerate(positions)
+                if position in self._geometries}
+
+        return new
+
+    def copy(self):
+        """Return copy of AnnotationArray.
+
+        Columns are shared with the copy since they are never modified in
+        place.
+        """
+        self._flush()
+
+        new = type(self)()
+        new._label_table = self._label_table
+        new._label_lookup = self._label_lookup
+        new._types = self._types
+        new._columns = dict(self._columns)
+        new._label_offsets = self._label_offsets
+        new._label_codes = self._label_codes
+        new._ids = list(self._ids)
+        new._metadata = list(self._metadata)
+        new._geometries = dict(self._geometries)
+        return new
+
+    def to_dataframe(self, with_geometry=True):
+        """Produce pandas DataFrame from AnnotationArray.
+
+        Bound columns are passed to pandas without copying, but whether
+        the resulting dataframe shares memory with the array depends on
+        the pandas version. Versions that consolidate float columns into
+        a single block on construction (pandas < 2) copy them.
+
+        Parameters
+        ----------
+        with_geometry : bool, optional
+            Whether to include a column with the geometry of each
+            annotation. Building geometries is the most expensive part
+            of the conversion.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        self._flush()
+
+        type_names = np.array([
+            annotation_class.__name__
+            for annotation_class in ANNOTATION_CLASSES], dtype=object)
+        data = {
+            'id': self._ids,
+            'type': type_names[self._types],
+            'start_time': self._columns['start_time'],
+            'end_time': self._columns['end_time'],
+            'min_freq': self._columns['min_freq'],
+            'max_freq': self._columns['max_freq'],
+        }
+
+        rows = np.repeat(np.arange(len(self)), np.diff(self._label_offsets))
+        codes = self._label_codes
+        keys = np.empty([len(self._label_table)], dtype=object)
+        values = np.empty([len(self._label_table)], dtype=object)
+        for code, (key, value, _) in enumerate(self._label_table):
+            keys[code] = key
+            values[code] = value
+
+        for key in dict.fromkeys(keys[np.unique(codes)]):
+            selected = keys[codes] == key
+            column = np.full([len(self)], np.nan, dtype=object)
+            column[rows[selected]] = values[codes[selected]]
+            data[key] = column
+
+        if with_geometry:
+            data['geometry'] = [
+                self._geometry(position) for position in range(len(self))]
+
+        return pd.DataFrame(data, copy=False)
+
+    @classmethod
+    def from_dataframe(cls, dataframe, label_columns=None):
+        """Build AnnotationArray from an annotation dataframe.
+
+        Float bound columns are used without copying. Bounds that the
+        geometry of an annotation type does not have (e.g. frequencies of
+        time intervals) are ignored; a column is only copied if it holds
+        values for them. Polygon and linestring geometries are read from
+        the 'geometry' column, either as Geometry objects or as WKT
+        strings that are parsed on access.
+
+        Parameters
+        ----------
+        dataframe : pandas.DataFrame
+            Dataframe with 'type', 'start_time', 'end_time', 'min_freq'
+            and 'max_freq' columns. 'id', 'geometry', 'labels' and
+            'metadata' columns are used if present.
+        label_columns : list of str, optional
+            Columns to read as labels. By default labels are read from the
+            'labels' column if present, otherwise all other columns are
+            used as labels.
+
+        Returns
+        -------
+        AnnotationArray
+        """
+        missing = [
+            column for column in ['type', *BOUND_COLUMNS]
+            if column not in dataframe.columns]
+        if missing:
+            message = (
+                'The dataframe is missing the following columns: '
+                f'{", ".join(missing)}')
+            raise ValueError(message)
+
+        size = len(dataframe)
+        types = dataframe['type'].map(ANNOTATION_CODES)
+        if types.isna().any():
+            message = 'Annotation is of unknown type.'
+            raise ValueError(message)
+
+        array = cls()
+        array._types = types.values.astype(np.int8)
+        array._columns = {
+            column: np.asarray(dataframe[column].values, dtype=float)
+            for column in BOUND_COLUMNS}
+
+        for code, annotation_class in enumerate(ANNOTATION_CLASSES):
+            fields = BOX_FIELDS.get(annotation_class.geometry_class.name)
+            if fields is None:
+                continue
+
+            selected = array._types == code
+            for column, field in zip(BOUND_COLUMNS, fields):
+                values = array._columns[column]
+                if field is not None or np.isnan(values[selected]).all():
+                    continue
+                values = values.copy()
+                values[selected] = np.nan
+                array._columns[column] = values
+
+        if 'id' in dataframe.columns:
+            array._ids = dataframe['id'].tolist()
+        else:
+            array._ids = [str(uuid4()) for _ in range(size)]
+
+        if 'metadata' in dataframe.columns:
+            array._metadata = dataframe['metadata'].tolist()
+        else:
+            array._metadata = [None] * size
+
+        if 'geometry' in dataframe.columns:
+            non_box_codes = [
+                code for code, annotation_class
+                in enumerate(ANNOTATION_CLASSES)
+                if annotation_class.geometry_class.name not in BOX_GEOMETRIES]
+            geometries = dataframe['geometry'].values
+            array._geometries = {
+                position: geometries[position]
+                for position in np.nonzero(
+                    np.isin(array._types, non_box_codes))[0]}
+
+        if label_columns is None and 'labels' in dataframe.columns:
+            label_codes = [
+                array._label_codes_from_list(labels)
+                for labels in dataframe['labels'].values]
+            counts = np.array([len(codes) for codes in label_codes],
+                              dtype=np.int64)
+            array._label_offsets = np.concatenate([[0], np.cumsum(counts)])
+            array._label_codes = np.array(
+                [code for codes in label_codes for code in codes],
+                dtype=np.int64)
+            return array
+
+        if label_columns is None:
+            reserved = {
+                'id', 'type', 'geometry', 'labels', 'metadata',
+                *BOUND_COLUMNS}
+            label_columns = [
+                column for column in dataframe.columns
+                if column not in reserved]
+
+        rows = []
+        codes = []
+        for column in label_columns:
+            values = dataframe[column]
+            present = np.nonzero(values.notna().values)[0]
+            value_codes, uniques = pd.factorize(values.values[present])
+            uniques = np.array([
+                array._label_code(column, value) for value in uniques],
+                dtype=np.int64)
+            rows.append(present)
+            codes.append(uniques[value_codes])
+
+        if rows:
+            rows = np.concatenate(rows)
+            codes = np.concatenate(codes)
+            order = np.argsort(rows, kind='stable')
+            array._label_codes = codes[order]
+            array._label_offsets = np.concatenate([
+                [0], np.cumsum(np.bincount(rows, minlength=size))])
+        else:
+            array._label_offsets = np.zeros([size + 1], dtype=np.int64)
+
+        return array
+
+    def plot(self, ax=None, **kwargs):
+        """Plot all annotations.
+
+        Parameters
+        ----------
+        ax : matplotlib.axes, optional
+        **kwargs : dict, optional
+        """
+        return AnnotationList(self).plot(ax=ax, **kwargs)
+
+    def buffer(self, buffer=None, **kwargs):
+        """Return new AnnotationArray with buffered annotations.
+
+        Parameters
+        ----------
+        buffer : float, optional
+        **kwargs : dict, optional
+
+        Returns
+        -------
+        AnnotationArray
+        """
+        if buffer is None:
+            buffer = kwargs.get('buffer', 0)
+
+        return AnnotationArray([
+            annotation.buffer(buffer=buffer, **kwargs)
+            for annotation in self])
+
+    def apply(self, func):
+        """Return new AnnotationArray with applied function.
+
+        Parameters
+        ----------
+        func : function
+
+        Returns
+        -------
+        AnnotationArray
+        """
+        return AnnotationArray([func(annotation) for annotation in self])
+
+    def filter(self, func):
+        """Return new AnnotationArray with filtered annotations.
+
+        Parameters
+        ----------
+        func : function
+
+        Returns
+        -------
+        AnnotationArray
+        """
+        return self.take([
+            position for position, annotation in enumerate(self)
+            if func(annotation)])
+
+    def build_index(self):
+        """Return time and frequency index over annotations.
+
+        The index is not updated when annotations are added to the array.
+
+        Returns
+        -------
+        AnnotationIndex
+        """
+        self._flush()
+        non_box_codes = [
+            code for code, annotation_class in enumerate(ANNOTATION_CLASSES)
+            if annotation_class.geometry_class.name not in BOX_GEOMETRIES]
+
+        # Unbounded sides span the whole plane as in the shapely geometries
+        return AnnotationIndex(
+            np.nan_to_num(self._columns['start_time'], nan=0),
+            np.nan_to_num(self._columns['end_time'], nan=INFINITY),
+            np.nan_to_num(self._columns['min_freq'], nan=0),
+            np.nan_to_num(self._columns['max_freq'], nan=INFINITY),
+            annotations=self,
+            exact=np.isin(self._types, non_box_codes),
+            geometry_getter=lambda position: (
+                self._geometry(position).geometry))
+
+    def intersecting(self, window):
+        """Return new AnnotationArray with annotations that intersect window.
+
+        Parameters
+        ----------
+        window : Window, Geometry, Annotation or shapely.geometry
+
+        Returns
+        -------
+        AnnotationArray
+        """
+        return self.take(self.build_index().query_positions(window))
+
+
 class AnnotatedObjectMixin:
     """Annotated Object Mixin.
 
@@ -203,12 +999,14 @@ class AnnotatedObjectMixin:
 
     Parameters
     ----------
-    annotations : list of Annotation, optional
+    annotations : list of Annotation or AnnotationArray, optional
+        Annotations are kept in an AnnotationList unless an AnnotationArray
+        is given, in which case a copy of the array is kept.
     filter_annotations : bool, optional
     
     Attributes
     ----------
-    annotations : AnnotationList
+    annotations : AnnotationList or AnnotationArray
 
     Methods
     -------
@@ -216,7 +1014,9 @@ class AnnotatedObjectMixin:
 
     _cast_annotations(annotations)
 
-    _filter_annotations(annotation_list)
+    _filter_annotations(annotations)
+
+    get_annotation_index()
 
     """
     def __init__(
@@ -232,7 +1032,10 @@ class AnnotatedObjectMixin:
         if filter_annotations:
             annotations = self._filter_annotations(annotations)
 
-        self.annotations = AnnotationList(annotations)
+        if not isinstance(annotations, AnnotationArray):
+            annotations = AnnotationList(annotations)
+
+        self.annotations = annotations
 #         if len([key for key in signature(super().__init__).parameters.keys() if key != "self"]) != 0:
 #             super().__init__(**kwargs)
 #         else:
@@ -252,6 +1055,9 @@ class AnnotatedObjectMixin:
         if annotations is None:
             return []
 
+        if isinstance(annotations, AnnotationArray):
+            return annotations.copy()
+
         new_annotations = []
         for annotation in annotations:
             if not isinstance(annotation, Annotation):
@@ -261,22 +1067,21 @@ class AnnotatedObjectMixin:
 
         return new_annotations
 
-    def _filter_annotations(self, annotation_list):
+    def _filter_annotations(self, annotations):
         if not hasattr(self, 'window'):
-            return annotation_list
+            return annotations
 
         if self.window is None:
-            return annotation_list
+            return annotations
 
         if self.window.is_trivial():
-            return annotation_list
+            return annotations
 
-        filtered = [
-            annotation for annotation in annotation_list
-            if annotation.intersects(self.window)
-        ]
+        if isinstance(annotations, AnnotationArray):
+            return annotations.intersecting(self.window)
 
-        return filtered
+        index = AnnotationIndex.from_annotations(annotations)
+        return index.query(self.window)
 
     def annotate(
             self,
@@ -319,6 +1124,15 @@ class AnnotatedObjectMixin:
         
         self.annotations.add_multiple(annotations)
 
+    def get_annotation_index(self):
+        """Return time and frequency index over annotations.
+
+        Returns
+        -------
+        AnnotationIndex
+        """
+        return self.annotations.build_index()
+
     def plot(self, ax=None, **kwargs):
         """Plot all annotations.
 
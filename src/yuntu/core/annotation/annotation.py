@@ -214,6 +214,9 @@ class Annotation(ABC):
         if annotation_type == Annotation.Types.POLYGON.value:
             return PolygonAnnotation
 
+        if annotation_type == Annotation.Types.POINT.value:
+            return PointAnnotation
+
         message = 'Annotation is of unknown type.'
         raise ValueError(message)
 
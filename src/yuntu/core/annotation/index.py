@@ -0,0 +1,331 @@
+"""Annotation index module.
+
+This module defines an index over the time and frequency bounds of a set
+of annotations. It answers which annotations overlap a window and which
+pairs of annotations overlap without comparing every pair of geometries.
+
+Annotations are grouped by the magnitude of their duration and sorted by
+start time within each group. A window query inspects, in each group,
+only the annotations that start within the window or less than the
+longest duration of the group before it. Overlapping pairs are found with
+a sweep over start times. Bounds are compared first and geometries are
+only compared for annotations that are not axis aligned rectangles, such
+as polygons and linestrings.
+"""
+import numpy as np
+import shapely.wkt
+from shapely.geometry import box
+
+from yuntu.core import geometry as geom
+from yuntu.core import windows
+from yuntu.core.annotation.annotation import Annotation
+
+
+BOX_GEOMETRIES = [
+    geom.Geometry.Types.Weak,
+    geom.Geometry.Types.TimeLine,
+    geom.Geometry.Types.TimeInterval,
+    geom.Geometry.Types.FrequencyLine,
+    geom.Geometry.Types.FrequencyInterval,
+    geom.Geometry.Types.BBox,
+    geom.Geometry.Types.Point,
+]
+NON_BOX_ANNOTATIONS = [
+    Annotation.Types.LINESTRING.value,
+    Annotation.Types.POLYGON.value,
+]
+
+
+def _as_shapely(geometry):
+    if isinstance(geometry, Annotation):
+        geometry = geometry.geometry
+
+    if isinstance(geometry, (windows.Window, geom.Geometry)):
+        geometry = geometry.geometry
+
+    return geometry
+
+
+def _sweep_pairs(starts, ends, other_starts, order, other_order,
+                 strict=False):
+    """Return pairs (i, j) such that other start j is within interval i."""
+    sorted_starts = other_starts[other_order]
+    if strict:
+        lower = np.searchsorted(sorted_starts, starts, side='right')
+    else:
+        lower = np.searchsorted(sorted_starts, starts, side='left')
+    upper = np.searchsorted(sorted_starts, ends, side='right')
+    counts = np.maximum(upper - lower, 0)
+
+    left = np.repeat(order, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,
+                                                  counts)
+    right = other_order[np.repeat(lower, counts) + offsets]
+    return left, right
+
+
+class AnnotationIndex:
+    """Time and frequency index over annotation bounds.
+
+    Parameters
+    ----------
+    start_times : array-like
+        Start time of each annotation.
+    end_times : array-like
+        End time of each annotation.
+    min_freqs : array-like
+        Minimum frequency of each annotation.
+    max_freqs : array-like
+        Maximum frequency of each annotation.
+    annotations : list, optional
+        Objects returned by queries, one per bound. Defaults to positions.
+    exact : array-like of bool, optional
+        Whether geometries must be compared beyond their bounds for each
+        annotation.
+    geometry_getter : function, optional
+        Function that returns the shapely geometry of an annotation given
+        its position. Required if any annotation needs exact comparison.
+
+    Methods
+    -------
+    from_annotations(annotations)
+
+    from_dataframe(dataframe)
+
+    query(window)
+
+    query_positions(window)
+
+    overlapping_pairs(other=None)
+    """
+
+    def __init__(
+            self,
+            start_times,
+            end_times,
+            min_freqs,
+            max_freqs,
+            annotations=None,
+            exact=None,
+            geometry_getter=None):
+        self.start_times = np.asarray(start_times, dtype=float)
+        self.end_times = np.asarray(end_times, dtype=float)
+        self.min_freqs = np.asarray(min_freqs, dtype=float)
+        self.max_freqs = np.asarray(max_freqs, dtype=float)
+
+        size = self.start_times.shape[0]
+        if exact is None:
+            exact = np.zeros([size], dtype=bool)
+
+        self.annotations = annotations
+        self.exact = np.asarray(exact, dtype=bool)
+        self.geometry_getter = geometry_getter
+
+        if self.exact.any() and geometry_getter is None:
+            message = (
+                'A geometry getter is required to compare geometries '
+                'that are not rectangles.')
+            raise ValueError(message)
+
+        self.order = np.argsort(self.start_times, kind='stable')
+        self._build_groups()
+
+    def _build_groups(self):
+        durations = self.end_times - self.start_times
+        groups = np.full(durations.shape, -1, dtype=np.int64)
+        positive = durations > 0
+        groups[positive] = np.floor(np.log2(durations[positive]))
+
+        self.groups = []
+        for group in np.unique(groups):
+            members = np.nonzero(groups == group)[0]
+            order = members[np.argsort(self.start_times[members],
+                                       kind='stable')]
+            self.groups.append((
+                order,
+                self.start_times[order],
+                durations[order].max()))
+
+    @classmethod
+    def from_annotations(cls, annotations):
+        """Build index from a list of annotations."""
+        bounds = np.array([
+            annotation.geometry.geometry.bounds
+            for annotation in annotations], dtype=float).reshape([-1, 4])
+        exact = [
+            annotation.geometry.name not in BOX_GEOMETRIES
+            for annotation in annotations]
+        return cls(
+            bounds[:, 0],
+            bounds[:, 2],
+            bounds[:, 1],
+            bounds[:, 3],
+            annotations=annotations,
+            exact=exact,
+            geometry_getter=lambda position: (
+                annotations[position].geometry.geometry))
+
+    @classmethod
+    def from_dataframe(
+            cls,
+            dataframe,
+            start_time_column='start_time',
+            end_time_column='end_time',
+            min_freq_column='min_freq',
+            max_freq_column='max_freq',
+            geometry_column='geometry',
+            type_column='type'):
+        """Build index from an annotation dataframe.
+
+        Queries return row positions. Polygons and linestrings are
+        compared using their WKT geometry.
+        """
+        exact = None
+        geometry_getter = None
+        if type_column in dataframe.columns:
+            exact = dataframe[type_column].isin(NON_BOX_ANNOTATIONS).values
+            wkts = dataframe[geometry_column].values
+            geometry_getter = lambda position: shapely.wkt.loads(
+                wkts[position])
+
+        return cls(
+            dataframe[start_time_column].values,
+            dataframe[end_time_column].values,
+            dataframe[min_freq_column].values,
+            dataframe[max_freq_column].values,
+            exact=exact,
+            geometry_getter=geometry_getter)
+
+    def __len__(self):
+        return self.start_times.shape[0]
+
+    def _get(self, positions):
+        if self.annotations is None:
+            return list(positions)
+        return [self.annotations[position] for position in positions]
+
+    def query_positions(self, window):
+        """Return positions of annotations that intersect window.
+
+        Parameters
+        ----------
+        window : Window, Geometry, Annotation, shapely.geometry or tuple
+            Region to query. Tuples are read as
+            (start_time, min_freq, end_time, max_freq).
+
+        Returns
+        -------
+        positions : numpy.array
+            Sorted positions of intersecting annotations.
+        """
+        if isinstance(window, (tuple, list)):
+            shape = box(*window)
+        else:
+            shape = _as_shapely(window)
+
+        start_time, min_freq, end_time, max_freq = shape.bounds
+
+        candidates = []
+        for order, starts, duration in self.groups:
+            lower = np.searchsorted(starts, start_time - duration,
+                                    side='left')
+            upper = np.searchsorted(starts, end_time, side='right')
+            candidates.append(order[lower:upper])
+
+        if len(candidates) == 0:
+            return np.zeros([0], dtype=np.int64)
+
+        candidates = np.sort(np.concatenate(candidates))
+        overlap = (
+            (self.end_times[candidates] >= start_time) &
+            (self.min_freqs[candidates] <= max_freq) &
+            (self.max_freqs[candidates] >= min_freq))
+        candidates = candidates[overlap]
+
+        if shape.equals(box(*shape.bounds)):
+            check = self.exact[candidates]
+        else:
+            check = np.ones(candidates.shape, dtype=bool)
+
+        if check.any():
+            keep = np.ones(candidates.shape, dtype=bool)
+            keep[check] = [
+                self._geometry(position).intersects(shape)
+                for position in candidates[check]]
+            candidates = candidates[keep]
+
+        return candidates
+
+    def query(self, window):
+        """Return annotations that intersect window."""
+        return self._get(self.query_positions(window))
+
+    def _geometry(self, position):
+        if self.geometry_getter is None:
+            return box(
+                self.start_times[position],
+                self.min_freqs[position],
+                self.end_times[position],
+                self.max_freqs[position])
+        return self.geometry_getter(position)
+
+    def overlapping_pairs(self, other=None):
+        """Return positions of all pairs of intersecting annotations.
+
+        Parameters
+        ----------
+        other : AnnotationIndex, optional
+            Index to pair against. If not given, pairs of distinct
+            annotations of this index are returned once, with the first
+            position less than the second.
+
+        Returns
+        -------
+        pairs : numpy.array
+            Array of shape (n, 2) with positions in this index and in the
+            other index, sorted by both columns.
+        """
+        if other is None:
+            other = self
+
+        left, right = _sweep_pairs(
+            self.start_times[self.order],
+            self.end_times[self.order],
+            other.start_times,
+            self.order,
+            other.order)
+
+        if other is self:
+            # Every pair is found from the annotation that starts first
+            distinct = left != right
+            left, right = left[distinct], right[distinct]
+            swap = left > right
+            left[swap], right[swap] = right[swap], left[swap]
+        else:
+            other_left, other_right = _sweep_pairs(
+                other.start_times[other.order],
+                other.end_times[other.order],
+                self.start_times,
+                other.order,
+                self.order,
+                strict=True)
+            left = np.concatenate([left, other_right])
+            right = np.concatenate([right, other_left])
+
+        overlap = (
+            (self.end_times[left] >= other.start_times[right]) &
+            (other.end_times[right] >= self.start_times[left]) &
+            (self.min_freqs[left] <= other.max_freqs[right]) &
+            (other.min_freqs[right] <= self.max_freqs[left]))
+        codes = np.unique(left[overlap] * len(other) + right[overlap])
+        pairs = np.stack([codes // len(other), codes % len(other)], axis=1)
+
+        check = self.exact[pairs[:, 0]] | other.exact[pairs[:, 1]]
+        if check.any():
+            keep = np.ones(pairs.shape[0], dtype=bool)
+            keep[check] = [
+                self._geometry(first).intersects(other._geometry(second))
+                for first, second in pairs[check]]
+            pairs = pairs[keep]
+
+        return pairs
@@ -13,6 +13,7 @@ import numpy as np
 from yuntu.core.media.time import TimeMedia
 from yuntu.core.audio.utils import read_info
 from yuntu.core.audio.utils import read_media
+from yuntu.core.audio.utils import memmap_media
 from yuntu.core.audio.utils import write_media
 import yuntu.core.audio.audio_features as features
 from yuntu.core.windows import TimeWindow
@@ -36,6 +37,7 @@ REQUIRED_MEDIA_INFO_FIELDS = [
     DURATION,
     SAMPLE_RATE
 ]
+ALL_CHANNELS = 'all'
 OUT_RANGE = {
     "minmax": lambda x1,x2,y1,y2: [min(x1,y1), max(x2,y2)],
     "left": lambda x1,x2,y1,y2: [x1,x2],
@@ -87,6 +89,17 @@ class Audio(TimeMedia):
         The samplerate used to read the audio data. If different
         from the native sample rate, the audio will be resampled
         at read.
+    channel: int or str, optional
+        Channel to read from multichannel files. If None (default)
+        all channels are averaged. If an integer, only that channel
+        is decoded. If 'all', channels are stacked in an array of
+        shape (channels, samples).
+    mmap: bool, optional
+        If True, the array of local WAV files is a lazily scaled view
+        over a memory map of the file samples. Reads and cuts return
+        views and data is only loaded when used. Audio that can not be
+        mapped (remote or non WAV files, resampled reads or averaged
+        channels) is decoded as usual.
     """
 
     features_class = features.AudioFeatures
@@ -103,6 +116,8 @@ class Audio(TimeMedia):
             samplerate: Optional[int] = None,
             duration: Optional[float] = None,
             resolution: Optional[float] = None,
+            channel: Optional[Union[int, str]] = None,
+            mmap: Optional[bool] = False,
             **kwargs):
         """Construct an Audio object.
 
@@ -133,6 +148,17 @@ class Audio(TimeMedia):
             The samplerate used to read the audio data. If different
             from the native sample rate, the audio will be resampled
             at read.
+        channel: int or str, optional
+            Channel to read from multichannel files. If None (default)
+            all channels are averaged. If an integer, only that channel
+            is decoded. If 'all', channels are stacked in an array of
+            shape (channels, samples).
+        mmap: bool, optional
+            If True, the array of local WAV files is a lazily scaled view
+            over a memory map of the file samples. Reads and cuts return
+            views and data is only loaded when used. Audio that can not be
+            mapped (remote or non WAV files, resampled reads or averaged
+            channels) is decoded as usual.
         """
         if path is None and array is None:
             message = 'Either array or path must be supplied'
@@ -141,8 +167,21 @@ class Audio(TimeMedia):
         if timeexp is None:
             timeexp = 1.0
 
+        if channel is not None and channel != ALL_CHANNELS \
+                and not isinstance(channel, int):
+            message = (
+                f"Argument 'channel' must be None, an integer or "
+                f"'{ALL_CHANNELS}'.")
+            raise ValueError(message)
+
         self.path = path
         self._timeexp = timeexp
+        self.channel = channel
+        self.mmap = mmap
+
+        if channel == ALL_CHANNELS:
+            # Stacked channels keep time in the last axis
+            self.time_axis_index = -1
 
         if id is None:
             if path is not None:
@@ -167,10 +206,10 @@ class Audio(TimeMedia):
                                  "either samplerate or duration must be specified.")
 
             if samplerate is not None and duration is None:
-                duration = len(array)/samplerate
+                duration = array.shape[-1]/samplerate
 
             if samplerate is None and duration is not None:
-                samplerate = np.round(float(len(array))/duration).astype(int)
+                samplerate = np.round(float(array.shape[-1])/duration).astype(int)
 
         if media_info is not None and isinstance(media_info, dict):
             if not media_info_is_complete(media_info):
@@ -352,6 +391,9 @@ class Audio(TimeMedia):
             DURATION: size / samplerate
         }
 
+        if channels > 1:
+            kwargs.setdefault('channel', ALL_CHANNELS)
+
         return cls(
             array=array,
             media_info=media_info,
@@ -365,9 +407,15 @@ class Audio(TimeMedia):
             'media_info': self.media_info,
             'metadata': self.metadata,
             'id': self.id,
+            'channel': self.channel,
+            'mmap': self.mmap,
             **super()._copy_dict(**kwargs),
         }
 
+    def _supports_lazy_cut(self):
+        # Audio files are read only within the window limits.
+        return self.path is not None
+
     def read_info(self, path=None):
         """Read media info from file headers.
 
@@ -398,6 +446,10 @@ class Audio(TimeMedia):
         ----------
         path : str
             Path to signal data.
+        res_type : str
+            Resampling method, only used when the read samplerate differs
+            from the native samplerate. Use 'polyphase' for fast polyphase
+            filtering or any method supported by librosa.
 
         Returns
         -------
@@ -415,12 +467,25 @@ class Audio(TimeMedia):
         end = self._get_end()
         duration = end - start
 
+        if self.mmap and isinstance(path, str):
+            try:
+                signal, _ = memmap_media(
+                    path,
+                    self.samplerate,
+                    offset=start,
+                    duration=duration,
+                    channel=self.channel)
+                return signal
+            except ValueError:
+                pass
+
         signal, _ = read_media(
             path,
             self.samplerate,
             offset=start,
             res_type=res_type,
             duration=duration,
+            channel=self.channel,
             **read_kwargs
         )
 
@@ -454,10 +519,11 @@ class Audio(TimeMedia):
         if samplerate is None:
             samplerate = self.samplerate
 
+        nchannels = 1 if signal.ndim == 1 else signal.shape[0]
         write_media(self.path,
                     signal,
                     samplerate,
-                    self.media_info.nchannels,
+                    nchannels,
                     media_format)
 
     def listen(self, speed: Optional[float] = 1):
@@ -620,7 +686,7 @@ class Audio(TimeMedia):
         else:
             media_info = dict(self.media_info._asdict())
 
-        return {
+        data = {
             'timeexp': self.timeexp,
             'media_info': media_info,
             'metadata': self.metadata.copy(),
@@ -628,6 +694,14 @@ class Audio(TimeMedia):
             **super().to_dict()
         }
 
+        if self.channel is not None:
+            data['channel'] = self.channel
+
+        if self.mmap:
+            data['mmap'] = self.mmap
+
+        return data
+
     def __repr__(self):
         """Return a representation of the audio object."""
         data = OrderedDict()
@@ -642,6 +716,9 @@ class Audio(TimeMedia):
         if self.timeexp != 1:
             data['timeexp'] = self.timeexp
 
+        if self.channel is not None:
+            data['channel'] = repr(self.channel)
+
         if not self._has_trivial_window():
             data['window'] = repr(self.window)
 
@@ -0,0 +1,155 @@
+"""Process wide cache of decoded audio signals.
+
+Decoding and resampling compressed or long recordings is expensive and the
+same recordings are usually read several times within a session (soundscape
+slicing, probing, plotting). This module keeps decoded signals keyed by
+path, read samplerate, offset, duration and read options, evicting the least
+recently used entries when the total size exceeds a byte budget.
+
+Optionally, entries are also written as '.npy' files to a cache directory,
+so that they survive eviction and are read back as memory maps.
+
+The cache is disabled by default. Use 'enable_audio_cache' to activate it::
+
+    from yuntu.core.audio.cache import enable_audio_cache
+    enable_audio_cache(max_bytes=2 * 1024**3, cache_dir="/tmp/yuntu_cache")
+
+Cached arrays are returned as read only arrays.
+"""
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+DEFAULT_MAX_BYTES = 1024**3
+
+
+class AudioCache:
+    """Bounded LRU cache of decoded signals.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size in bytes of in-memory entries.
+    cache_dir : str, optional
+        Directory to persist entries as memory mappable '.npy' files.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, cache_dir=None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if cache_dir is not None and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(path, samplerate, offset=0.0, duration=None, **kwargs):
+        """Return cache key for a read or None if path can not be keyed."""
+        if not isinstance(path, str):
+            return None
+
+        mtime = None
+        if os.path.isfile(path):
+            mtime = os.path.getmtime(path)
+
+        options = tuple(sorted((key, repr(value))
+                               for key, value in kwargs.items()))
+        return (path, mtime, samplerate, float(offset or 0.0),
+                None if duration is None else float(duration), options)
+
+    def _use_disk(self, key):
+        # Signals read at native samplerate are kept in memory only since
+        # their samplerate can not be recovered from the stored array.
+        return self.cache_dir is not None and key[2] is not None
+
+    def _disk_path(self, key):
+        digest = hashlib.md5(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npy")
+
+    def get(self, key):
+        """Return cached (signal, samplerate) or None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        if self._use_disk(key):
+            disk_path = self._disk_path(key)
+            if os.path.exists(disk_path):
+                signal = np.load(disk_path, mmap_mode="r")
+                with self._lock:
+                    self.hits += 1
+                return signal, key[2]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, signal, samplerate):
+        """Store decoded signal and return read only version."""
+        signal = np.asarray(signal)
+        signal.flags.writeable = False
+
+        if self._use_disk(key):
+            disk_path = self._disk_path(key)
+            if not os.path.exists(disk_path):
+                tmp_path = f"{disk_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as tmp_file:
+                    np.save(tmp_file, signal)
+                os.replace(tmp_path, disk_path)
+
+        if signal.nbytes > self.max_bytes:
+            return signal, samplerate
+
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries[key][0].nbytes
+            self._entries[key] = (signal, samplerate)
+            self._entries.move_to_end(key)
+            self.nbytes += signal.nbytes
+
+            while self.nbytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+        return signal, samplerate
+
+    def clear(self):
+        """Remove all in-memory entries."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+_AUDIO_CACHE = None
+
+
+def enable_audio_cache(max_bytes=DEFAULT_MAX_BYTES, cache_dir=None):
+    """Activate process wide decoded audio cache and return it."""
+    global _AUDIO_CACHE
+    _AUDIO_CACHE = AudioCache(max_bytes=max_bytes, cache_dir=cache_dir)
+    return _AUDIO_CACHE
+
+
+def disable_audio_cache():
+    """Deactivate process wide decoded audio cache."""
+    global _AUDIO_CACHE
+    _AUDIO_CACHE = None
+
+
+def get_audio_cache():
+    """Return active audio cache or None."""
+    return _AUDIO_CACHE
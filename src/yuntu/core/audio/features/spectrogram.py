@@ -167,7 +167,7 @@ class Spectrogram(TimeFrequencyFeature):
                 if array is not None:
                     columns = array.shape[self.frequency_axis_index]
                 elif audio is not None:
-                    columns = 1 + len(audio) // hop_length
+                    columns = 1 + audio.time_size // hop_length
                 else:
                     message = (
                         'If no audio or array is provided a samplerate must be '
@@ -176,6 +176,17 @@ class Spectrogram(TimeFrequencyFeature):
 
                 time_resolution = columns / duration
 
+        if isinstance(audio, dict):
+            channel = audio.get('channel', None)
+        else:
+            channel = getattr(audio, 'channel', None)
+
+        if channel == 'all':
+            # Stacked channels produce arrays of shape
+            # (channels, frequencies, times)
+            self.frequency_axis_index = -2
+            self.time_axis_index = -1
+
         if frequency_axis is None:
             if max_freq is None:
                 if audio is not None:
@@ -273,47 +284,91 @@ class Spectrogram(TimeFrequencyFeature):
         """Compute representation from audio data.
 
         Uses the spectrogram instance configurations for stft
-        calculation.
+        calculation. If the spectrogram has a non trivial window only the
+        audio samples needed for the frames within the window are read,
+        so that the result matches cutting the full spectrogram.
 
         Returns
         -------
         numpy.array
             Computed representation of audio data.
         """
-        if not self._has_trivial_window():
-            start = self._get_start()
-            end = self._get_end()
-            array = self.audio.cut(
-                start_time=start, end_time=end).array
+        audio = self.audio
+        if (self._get_start() > audio._get_start() or
+                self._get_end() < audio._get_end()):
+            result = self._compute_window()
         else:
-            array = self.audio.array
-
-        result = self.transform(array)
-
-        max_index = self.get_index_from_frequency(self._get_max())
-        min_index = self.get_index_from_frequency(self._get_min())
-
-        start_index = self.get_index_from_time(self._get_start())
-        end_index = self.get_index_from_time(self._get_end())
+            result = self.transform(audio.array)
 
-        cut_x = False
-        cut_y = False
+        # Rows and frames are indexed from the full spectrogram limits
+        min_index = self.frequency_axis.get_bin_nums(0, self._get_min())
+        max_index = self.frequency_axis.get_bin_nums(0, self._get_max())
+        end_index = self.time_axis.get_bin_nums(
+            self._get_start(), self._get_end())
 
-        if start_index != 0 or end_index != result.shape[1]:
-            cut_x = True
+        cut_x = end_index != result.shape[-1]
+        cut_y = min_index != 0 or max_index != result.shape[-2]
 
-        if min_index != 0 or max_index != result.shape[0]:
-            cut_y = True
-
-        if self._has_trivial_window() and not (cut_y or cut_x):
+        if not (cut_y or cut_x):
             return result
 
         slices = (
+            Ellipsis,
             slice(min_index, max_index),
-            slice(start_index, end_index))
+            slice(0, end_index))
 
         return result[slices]
 
+    def _supports_lazy_cut(self):
+        # Stored spectrograms are read whole, computed ones are computed
+        # only within the window.
+        return self.has_audio() and not self.path_exists()
+
+    def _compute_window(self):
+        """Compute the frames that fall within the spectrogram window.
+
+        Frame k of the full spectrogram is centered at sample
+        k * hop_length of the audio. The audio is read lazily from a hop
+        aligned sample before the first frame of the window, with enough
+        context for the first frame, up to the last sample used by the
+        last frame. Frames are computed on this fragment and the ones
+        outside of the window are dropped.
+
+        Returns
+        -------
+        numpy.array
+            Computed representation starting at the first frame of the
+            window.
+        """
+        audio = self.audio
+        samplerate = audio.samplerate
+        audio_start = audio._get_start()
+        length = audio.time_size
+
+        first_frame = self.time_axis.get_bin_nums(
+            audio_start, self._get_start())
+        last_frame = self.time_axis.get_bin_nums(
+            audio_start, self._get_end())
+
+        context = -(-(self.n_fft // 2) // self.hop_length)
+        start_hop = max(first_frame - context, 0)
+        start_sample = start_hop * self.hop_length
+        end_sample = min(
+            max(last_frame - 1, first_frame) * self.hop_length
+            + self.n_fft // 2 + self.hop_length,
+            length)
+
+        if audio.is_empty():
+            array = audio.cut(
+                start_time=audio_start + start_sample / samplerate,
+                end_time=audio_start + end_sample / samplerate,
+                lazy=True).array
+        else:
+            array = audio.array[..., start_sample:end_sample]
+
+        result = self.transform(array)
+        return result[..., first_frame - start_hop:]
+
     def write(self, path):  # pylint: disable=arguments-differ
         """Write the spectrogram matrix into the filesystem."""
         # TODO
@@ -513,6 +568,14 @@ class Spectrogram(TimeFrequencyFeature):
 
         return MelSpectrogram(**kwargs)
 
+    def _copy_dict(self):
+        return {
+            'n_fft': self.n_fft,
+            'hop_length': self.hop_length,
+            'window_function': self.window_function,
+            **super()._copy_dict()
+        }
+
     def to_dict(self):
         """Return feature's specification as dictionary.
 
@@ -721,6 +784,19 @@ class DecibelSpectrogram(Spectrogram):
 
         super().__init__(**kwargs)
 
+    def _copy_dict(self):
+        return {
+            'ref': self.ref,
+            'amin': self.amin,
+            'top_db': self.top_db,
+            **super()._copy_dict()
+        }
+
+    def _supports_lazy_cut(self):
+        # Clipping at 'top_db' is relative to the maximum of the whole
+        # spectrogram, which a window alone does not know.
+        return self.top_db is None and super()._supports_lazy_cut()
+
     def mel(self, *args, **kwargs):
         """Get mel spectrogram from spec.
 
@@ -853,6 +929,13 @@ class MelSpectrogram(Spectrogram):
             self._n_mels = (1 + self.n_fft // 2)//4
         return self._n_mels
 
+    def _copy_dict(self):
+        return {
+            'sr': self._sr,
+            'n_mels': self._n_mels,
+            **super()._copy_dict()
+        }
+
     @staticmethod
     def _default_resolution(n_fft, max_freq):
         """Default resolution for feature according to parameters"""
@@ -1015,6 +1098,19 @@ class DecibelMelSpectrogram(MelSpectrogram):
 
         super().__init__(**kwargs)
 
+    def _copy_dict(self):
+        return {
+            'ref': self.ref,
+            'amin': self.amin,
+            'top_db': self.top_db,
+            **super()._copy_dict()
+        }
+
+    def _supports_lazy_cut(self):
+        # Clipping at 'top_db' is relative to the maximum of the whole
+        # spectrogram, which a window alone does not know.
+        return self.top_db is None and super()._supports_lazy_cut()
+
     def mel(self, *args, **kwargs):
         """Get mel spectrogram from spec.
 
@@ -103,7 +103,7 @@ class Spectrum(FrequencyFeature):
         np.array
             Computed representation of audio data.
         """
-        return np.abs(np.fft.rfft(self.audio.array))
+        return np.abs(np.fft.rfft(np.asarray(self.audio.array)))
 
     def write(self, path=None):
         """Write feature to path.
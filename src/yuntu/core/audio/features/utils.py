@@ -3,12 +3,18 @@ import numpy as np
 import librosa
 
 
+# librosa.stft accepts arrays of shape (..., samples) since version 0.9
+LIBROSA_MULTICHANNEL = tuple(
+    int(part) for part in librosa.__version__.split('.')[:2]) >= (0, 9)
+
+
 def stft(signal,
          n_fft,
          hop_length,
          win_length=None,
          window='hann',
-         center=True):
+         center=True,
+         pad_mode=None):
     """Short Time Fourier Transform.
 
     Currently a wrapper for librosa.stft. For full documentation on each
@@ -33,6 +39,9 @@ def stft(signal,
         If True, the signal y is padded so that frame D[:, t] is centered at
         signal[t * hop_length]. If False, then D[:, t] begins at
         signal[t * hop_length].
+    pad_mode : str
+        Padding mode used when 'center' is True. Defaults to the librosa
+        default. Mono and multichannel signals are padded the same way.
 
     Returns
     -------
@@ -40,12 +49,86 @@ def stft(signal,
         Short Time Fourier Transform of input signal.
 
     """
+    signal = np.asarray(signal)
+
+    if signal.ndim > 1:
+        return multichannel_stft(signal,
+                                 n_fft,
+                                 hop_length,
+                                 win_length=win_length,
+                                 window=window,
+                                 center=center,
+                                 pad_mode=pad_mode)
+
+    kwargs = {}
+    if pad_mode is not None:
+        kwargs['pad_mode'] = pad_mode
+
     return librosa.stft(y=signal,
                         n_fft=n_fft,
                         hop_length=hop_length,
                         win_length=win_length,
                         window=window,
-                        center=center)
+                        center=center,
+                        **kwargs)
+
+
+def multichannel_stft(signal,
+                      n_fft,
+                      hop_length,
+                      win_length=None,
+                      window='hann',
+                      center=True,
+                      pad_mode=None):
+    """Short Time Fourier Transform of stacked channels.
+
+    All channels are transformed with a single librosa.stft call, which
+    frames and transforms the signal in blocks. Older librosa versions
+    without multichannel support transform each channel separately.
+
+    Parameters
+    ----------
+    signal : numpy.array
+        An array of shape (channels, samples).
+    n_fft : int
+        Length of the windowed signal after padding with zeros.
+    hop_length : int
+        Number of audio samples between adjacent STFT columns.
+    win_length : int
+        Each frame of audio is windowed by window of length win_length and then
+        padded with zeros to match n_fft.
+    window : str, numpy.array, callable
+        A window specification by name, array (of size n_fft) or function.
+    center : bool
+        If True, the signal is padded so that frame D[..., t] is centered at
+        signal[..., t * hop_length].
+    pad_mode : str
+        Padding mode used when 'center' is True. Defaults to the librosa
+        default.
+
+    Returns
+    -------
+    numpy.array
+        Array of shape (channels, 1 + n_fft // 2, frames).
+
+    """
+    signal = np.asarray(signal)
+    kwargs = dict(n_fft=n_fft,
+                  hop_length=hop_length,
+                  win_length=win_length,
+                  window=window,
+                  center=center)
+    if pad_mode is not None:
+        kwargs['pad_mode'] = pad_mode
+
+    if LIBROSA_MULTICHANNEL:
+        return librosa.stft(y=signal, **kwargs)
+
+    channels = signal.reshape([-1, signal.shape[-1]])
+    result = np.stack([
+        librosa.stft(y=np.ascontiguousarray(channel), **kwargs)
+        for channel in channels])
+    return result.reshape(signal.shape[:-1] + result.shape[1:])
 
 
 def spectrogram(signal,
@@ -4,11 +4,17 @@ import os
 import glob
 import io
 import hashlib
+import struct
 import wave
 import numpy as np
 import librosa
 import soundfile
 import shutil
+from fractions import Fraction
+from scipy.signal import resample_poly
+
+from yuntu.utils import get_s3_filesystem
+from yuntu.core.audio.cache import get_audio_cache
 
 SAMPWIDTHS = {
     'PCM_16': 2,
@@ -17,6 +23,11 @@ SAMPWIDTHS = {
     'FLOAT': 4
 }
 
+WAV_FORMAT_PCM = 0x0001
+WAV_FORMAT_IEEE_FLOAT = 0x0003
+WAV_FORMAT_EXTENSIBLE = 0xFFFE
+WAV_HEADER_BLOCK_SIZE = 65536
+
 def s3_glob(path):
     """Glob using s3fs.
 
@@ -31,8 +42,7 @@ def s3_glob(path):
             A list of path names.
 
     """
-    from s3fs.core import S3FileSystem
-    s3 = S3FileSystem()
+    s3 = get_s3_filesystem()
     return [os.path.join("s3://", x) for x in s3.glob(path)]
 
 def s3_walk(path):
@@ -49,8 +59,7 @@ def s3_walk(path):
             A list of path names.
 
     """
-    from s3fs.core import S3FileSystem
-    s3 = S3FileSystem()
+    s3 = get_s3_filesystem()
     return [(os.path.join("s3://", x[0]),x[1],x[2]) for x in s3.walk(path)]
 
 def ag_glob(path):
@@ -103,8 +112,7 @@ def media_open_s3(path):
             File object to access data.
 
     """
-    from s3fs.core import S3FileSystem
-    s3 = S3FileSystem()
+    s3 = get_s3_filesystem()
     bucket = path.replace("s3://", "").split("/")[0]
     key = path.replace(f"s3://{bucket}/", "")
     return s3.open('{}/{}'.format(bucket, key))
@@ -125,8 +133,7 @@ def media_copy_s3(source_path, target_path):
             The destination path
 
     """
-    from s3fs.core import S3FileSystem
-    s3 = S3FileSystem()
+    s3 = get_s3_filesystem()
     if source_path[:5] == "s3://" and target_path[:5] == "s3://":
         return s3.copy(source_path, target_path)
     elif source_path[:5] == "s3://":
@@ -153,6 +160,96 @@ def media_copy(source_path, target_path):
         return media_copy_s3(source_path, target_path)
     return shutil.copy(source_path, target_path)
 
+LINK_METHODS = ("copy", "hardlink", "reflink", "auto")
+FICLONE = 0x40049409
+
+def media_reflink(source_path, target_path):
+    """Clone local file sharing data blocks with the source.
+
+    Only available on filesystems with copy on write support (btrfs, xfs).
+
+    Parameters
+    ----------
+    source_path : str
+        A local source path.
+    target_path : str
+        A local target path.
+
+    Returns
+    -------
+        target_path : str
+            The destination path
+
+    Raises
+    ------
+    OSError
+        If the filesystem does not support cloning.
+    """
+    import fcntl
+
+    with open(source_path, "rb") as source:
+        with open(target_path, "wb") as target:
+            try:
+                fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+            except OSError:
+                target.close()
+                os.remove(target_path)
+                raise
+    shutil.copystat(source_path, target_path)
+    return target_path
+
+def media_link(source_path, target_path, method="auto"):
+    """Place source file at target using links when possible.
+
+    Local files on the same filesystem are hardlinked or cloned instead of
+    copied. Remote files and unsupported filesystems fall back to a regular
+    copy.
+
+    Parameters
+    ----------
+    source_path : str
+        Any source path.
+    target_path : str
+        A target path.
+    method : str
+        One of 'copy', 'hardlink', 'reflink' or 'auto'. With 'auto' a
+        reflink is attempted first, then a hardlink.
+
+    Returns
+    -------
+        method : str
+            The method that was actually used.
+
+    """
+    if method not in LINK_METHODS:
+        raise ValueError(f"Unknown link method '{method}'. "
+                         f"Use one of {LINK_METHODS}.")
+
+    if (method == "copy" or
+            source_path[:5] == "s3://" or target_path[:5] == "s3://"):
+        media_copy(source_path, target_path)
+        return "copy"
+
+    if os.path.lexists(target_path):
+        os.remove(target_path)
+
+    if method in ("reflink", "auto"):
+        try:
+            media_reflink(source_path, target_path)
+            return "reflink"
+        except (OSError, ImportError):
+            pass
+
+    if method in ("hardlink", "auto"):
+        try:
+            os.link(source_path, target_path)
+            return "hardlink"
+        except OSError:
+            pass
+
+    media_copy(source_path, target_path)
+    return "copy"
+
 def media_open(path, mode='rb'):
     """Open file from any path.
 
@@ -188,8 +285,7 @@ def media_exists(path):
 
     """
     if path[:5] == "s3://":
-        from s3fs.core import S3FileSystem
-        s3 = S3FileSystem()
+        s3 = get_s3_filesystem()
         return s3.exists(path)
     return os.path.exists(path)
 
@@ -215,8 +311,7 @@ def load_media_info_s3(path):
             Size of file.
 
     """
-    from s3fs.core import S3FileSystem
-    s3 = S3FileSystem()
+    s3 = get_s3_filesystem()
     info = s3.info(path)
     if "size" in info:
         if info["size"] is not None:
@@ -362,13 +457,508 @@ def hash_file(path, alg="md5"):
         return binary_md5(path)
     raise NotImplementedError("Algorithm "+alg+" is not implemented.")
 
+def read_wav_header(media):
+    """Read WAV header from an open binary file object.
+
+    Parameters
+    ----------
+    media : file
+        Binary file object positioned at the start of the file.
+
+    Returns
+    -------
+    header : dict
+        A dictionary with format code ('format'), number of channels
+        ('nchannels'), samplerate ('samplerate'), sample width in bytes
+        ('sampwidth'), frame size in bytes ('block_align'), position and
+        size in bytes of sample data ('data_offset', 'data_size') and number
+        of frames ('nframes').
+
+    Raises
+    ------
+    ValueError
+        If the file is not a RIFF/WAVE file or data is not directly
+        addressable PCM or float samples.
+
+    """
+    riff = media.read(12)
+    if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE file.")
+
+    header = None
+    position = 12
+    while True:
+        chunk = media.read(8)
+        if len(chunk) < 8:
+            raise ValueError("Could not find data chunk.")
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk)
+        position += 8
+
+        if chunk_id == b'fmt ':
+            fmt = media.read(chunk_size)
+            fmt_code, nchannels, samplerate, _, block_align, bits = \
+                struct.unpack('<HHIIHH', fmt[:16])
+            if fmt_code == WAV_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+                fmt_code = struct.unpack('<H', fmt[24:26])[0]
+            header = {
+                'format': fmt_code,
+                'nchannels': nchannels,
+                'samplerate': samplerate,
+                'sampwidth': bits // 8,
+                'block_align': block_align
+            }
+        elif chunk_id == b'data':
+            if header is None:
+                raise ValueError("Data chunk found before format chunk.")
+            if header['format'] not in [WAV_FORMAT_PCM, WAV_FORMAT_IEEE_FLOAT]:
+                raise ValueError("Only PCM and float WAV data can be read "
+                                 "directly.")
+            header['data_offset'] = position
+            header['data_size'] = chunk_size
+            header['nframes'] = chunk_size // header['block_align']
+            return header
+        position += chunk_size + chunk_size % 2
+        media.seek(position)
+
+
+def decode_wav_frames(data, header, channel=None):
+    """Decode raw WAV sample bytes as float32 array of shape (frames, channels).
+
+    Integer samples are scaled to [-1, 1) as soundfile does. If a channel
+    index is given, only that channel is converted and the resulting array
+    has a single column.
+    """
+    sampwidth = header['sampwidth']
+    nchannels = header['nchannels']
+    columns = slice(None) if channel is None else slice(channel, channel + 1)
+
+    if header['format'] == WAV_FORMAT_IEEE_FLOAT:
+        dtype = {4: '<f4', 8: '<f8'}[sampwidth]
+        raw = np.frombuffer(data, dtype=dtype).reshape(-1, nchannels)
+        return raw[:, columns].astype(np.float32)
+
+    if sampwidth == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, nchannels, 3)
+        raw = raw[:, columns]
+        samples = np.zeros(raw.shape[:2] + (4,), dtype=np.uint8)
+        samples[..., 1:] = raw
+        return samples.view('<i4')[..., 0].astype(np.float32) / 2**31
+
+    dtype = {1: np.uint8, 2: '<i2', 4: '<i4'}[sampwidth]
+    raw = np.frombuffer(data, dtype=dtype).reshape(-1, nchannels)
+    samples = raw[:, columns].astype(np.float32)
+    if sampwidth == 1:
+        samples -= 128
+        samples /= 128
+    else:
+        samples /= 2**(8 * sampwidth - 1)
+    return samples
+
+
+def wav_frame_range(header, offset=0.0, duration=None):
+    """Return first frame and number of frames for a time window."""
+    samplerate = header['samplerate']
+    nframes = header['nframes']
+
+    start = min(int(np.round(samplerate * (offset or 0.0))), nframes)
+    if duration is None:
+        stop = nframes
+    else:
+        stop = min(start + int(np.round(samplerate * duration)), nframes)
+    return start, stop - start
+
+
+def open_wav(path):
+    """Open a WAV file for ranged reads, local or remote."""
+    if path[:5] == "s3://":
+        return get_s3_filesystem().open(path,
+                                        'rb',
+                                        block_size=WAV_HEADER_BLOCK_SIZE,
+                                        cache_type='readahead')
+    return open(path, 'rb')
+
+
+def read_wav_window(path,
+                    samplerate=None,
+                    offset=0.0,
+                    duration=None,
+                    channel=None,
+                    res_type='kaiser_best'):
+    """Read a time window of a PCM or float WAV file.
+
+    Only the bytes that hold the requested window are read. Remote files
+    are read with range requests.
+
+    Parameters
+    ----------
+    path : str
+        Any path, remote or local.
+    samplerate : int
+        Audio samplerate to use for reading. Signal is resampled if it
+        differs from the native samplerate.
+    offset : float
+        Time offset to start reading.
+    duration : float
+        Duration of window to read. Reads until the end of the file if None.
+    channel : int, str
+        Channel to read. All channels are averaged if None and stacked with
+        shape (channels, frames) if 'all'. Only the requested channel is
+        decoded.
+    res_type : str
+        Resampling method.
+
+    Returns
+    -------
+    signal : np.array
+        Array containing audio data.
+    samplerate : int
+        Samplerate of signal.
+
+    """
+    with open_wav(path) as media:
+        header = read_wav_header(media)
+        start, nframes = wav_frame_range(header,
+                                         offset=offset,
+                                         duration=duration)
+        media.seek(header['data_offset'] + start * header['block_align'])
+        data = media.read(nframes * header['block_align'])
+
+    # Truncated files may declare more data than they hold
+    data = data[:len(data) - len(data) % header['block_align']]
+
+    if isinstance(channel, int):
+        if not 0 <= channel < header['nchannels']:
+            raise IndexError(f"Channel {channel} out of range.")
+        frames = decode_wav_frames(data, header, channel=channel)
+        channel = 0
+    else:
+        frames = decode_wav_frames(data, header)
+
+    return prepare_signal(frames,
+                          header['samplerate'],
+                          samplerate=samplerate,
+                          channel=channel,
+                          res_type=res_type)
+
+
+def prepare_signal(frames, native_samplerate, samplerate=None, channel=None,
+                   res_type='kaiser_best'):
+    """Select channels and resample decoded frames only when needed.
+
+    Parameters
+    ----------
+    frames : np.array
+        Decoded float32 array of shape (frames, channels).
+    native_samplerate : int
+        Samplerate of frames.
+    samplerate : int
+        Target samplerate. No resampling is done if None or equal to the
+        native samplerate.
+    channel : int, str
+        Channel to return. All channels are averaged if None and stacked
+        with shape (channels, frames) if 'all'.
+    res_type : str
+        Resampling method.
+
+    Returns
+    -------
+    signal : np.array
+        Array containing audio data.
+    samplerate : int
+        Samplerate of signal.
+
+    """
+    nchannels = frames.shape[1]
+    if channel == 'all':
+        signal = frames.T
+    elif nchannels == 1:
+        signal = frames[:, 0]
+    elif channel is not None:
+        signal = get_channel(frames.T, channel, nchannels)
+    else:
+        signal = channel_mean(frames.T)
+
+    if samplerate is None or samplerate == native_samplerate:
+        return signal, native_samplerate
+
+    signal = resample(signal,
+                      native_samplerate,
+                      samplerate,
+                      res_type=res_type)
+    return signal, samplerate
+
+
+def _read_soundfile_frames(media, offset=0.0, duration=None, channel=None):
+    """Read native float32 frames of shape (frames, channels) and header."""
+    with soundfile.SoundFile(media) as sound:
+        if isinstance(channel, int) and not 0 <= channel < sound.channels:
+            raise IndexError(f"Channel {channel} out of range.")
+        header = {'samplerate': sound.samplerate, 'nframes': sound.frames}
+        start, nframes = wav_frame_range(header,
+                                         offset=offset,
+                                         duration=duration)
+        if start > 0:
+            sound.seek(start)
+        frames = sound.read(nframes, dtype='float32', always_2d=True)
+    return frames, header
+
+
+def read_soundfile_window(path,
+                          samplerate=None,
+                          offset=0.0,
+                          duration=None,
+                          channel=None,
+                          res_type='kaiser_best'):
+    """Read a time window of any file supported by soundfile.
+
+    Samples are decoded directly as float32 at native samplerate and are
+    only resampled if a different samplerate is requested.
+
+    Parameters
+    ----------
+    path : str
+        Any path, remote or local.
+    samplerate : int
+        Audio samplerate to use for reading.
+    offset : float
+        Time offset to start reading.
+    duration : float
+        Duration of window to read. Reads until the end of the file if None.
+    channel : int, str
+        Channel to read. All channels are averaged if None and stacked with
+        shape (channels, frames) if 'all'.
+    res_type : str
+        Resampling method.
+
+    Returns
+    -------
+    signal : np.array
+        Array containing audio data.
+    samplerate : int
+        Samplerate of signal.
+
+    """
+    if path[:5] == "s3://":
+        with media_open_s3(path) as media:
+            frames, header = _read_soundfile_frames(media,
+                                                    offset=offset,
+                                                    duration=duration,
+                                                    channel=channel)
+    else:
+        frames, header = _read_soundfile_frames(path,
+                                                offset=offset,
+                                                duration=duration,
+                                                channel=channel)
+
+    return prepare_signal(frames,
+                          header['samplerate'],
+                          samplerate=samplerate,
+                          channel=channel,
+                          res_type=res_type)
+
+
+class MemmapSignal(np.lib.mixins.NDArrayOperatorsMixin):
+    """Lazily scaled float32 view over raw memory mapped samples.
+
+    Slicing returns new views over the same memory map, so reading and
+    cutting windows does not load data. Samples are converted and scaled
+    to float32 only when the signal is used as a numpy array.
+
+    Parameters
+    ----------
+    raw : np.memmap
+        Raw samples of shape (samples,) or (channels, samples).
+    scale : float
+        Factor to scale raw samples to [-1, 1).
+    shift : float
+        Value to subtract from raw samples before scaling.
+    """
+
+    dtype = np.dtype(np.float32)
+
+    def __init__(self, raw, scale=1.0, shift=0.0):
+        self.raw = raw
+        self.scale = scale
+        self.shift = shift
+
+    @property
+    def shape(self):
+        return self.raw.shape
+
+    @property
+    def ndim(self):
+        return self.raw.ndim
+
+    @property
+    def size(self):
+        return self.raw.size
+
+    @property
+    def nbytes(self):
+        return self.raw.size * self.dtype.itemsize
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, key):
+        view = self.raw[key]
+        if np.ndim(view) == 0:
+            return np.float32((view - self.shift) * self.scale)
+        return MemmapSignal(view, scale=self.scale, shift=self.shift)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.raw.astype(np.float32)
+        if self.shift != 0:
+            array -= self.shift
+        if self.scale != 1:
+            array *= self.scale
+        if dtype is not None:
+            array = array.astype(dtype, copy=False)
+        return array
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        out = kwargs.get('out', ())
+        if any(isinstance(arr, MemmapSignal) for arr in out):
+            message = ('Memory mapped signals are read only and do not '
+                       'support in place operations. Use copy() to get a '
+                       'writable array.')
+            raise TypeError(message)
+        inputs = tuple(np.asarray(inp) if isinstance(inp, MemmapSignal)
+                       else inp for inp in inputs)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def copy(self, **kwargs):
+        """Return scaled samples as a new writable array."""
+        return np.asarray(self).copy(**kwargs)
+
+    def take(self, indices, axis=None):
+        raw = self.raw.take(indices, axis=axis).astype(np.float32)
+        return (raw - self.shift) * self.scale
+
+    def __getattr__(self, name):
+        # Any other array attribute is taken from the scaled array
+        if name.startswith('__') or name == 'raw':
+            raise AttributeError(name)
+        return getattr(np.asarray(self), name)
+
+    def __repr__(self):
+        return f'MemmapSignal(shape={self.shape}, dtype={self.raw.dtype})'
+
+
+def memmap_media(path,
+                 samplerate=None,
+                 offset=0.0,
+                 duration=None,
+                 channel=None):
+    """Memory map a time window of a local PCM or float WAV file.
+
+    Parameters
+    ----------
+    path : str
+        Local path.
+    samplerate : int
+        Audio samplerate to use for reading. Must be None or the native
+        samplerate since memory mapped signals can not be resampled.
+    offset : float
+        Time offset to start reading.
+    duration : float
+        Duration of window to read. Reads until the end of the file if None.
+    channel : int, str
+        Channel to map. If 'all', channels are stacked with shape
+        (channels, samples). Multichannel files must specify a channel since
+        averaged channels can not be mapped.
+
+    Returns
+    -------
+    signal : MemmapSignal
+        Lazily scaled view of the samples.
+    samplerate : int
+        Samplerate of signal.
+
+    Raises
+    ------
+    ValueError
+        If the file can not be mapped with the requested configuration.
+
+    """
+    if not is_wav(path) or path[:5] == "s3://":
+        raise ValueError("Only local WAV files can be memory mapped.")
+
+    with open(path, 'rb') as media:
+        header = read_wav_header(media)
+
+    if samplerate is not None and samplerate != header['samplerate']:
+        raise ValueError("Memory mapped audio must be read at its native "
+                         "samplerate.")
+
+    nchannels = header['nchannels']
+    if channel is None and nchannels > 1:
+        raise ValueError("Memory mapped multichannel audio must be read "
+                         "with a specific channel or with channel='all'.")
+    if isinstance(channel, int) and not 0 <= channel < nchannels:
+        raise IndexError(f"Channel {channel} out of range.")
+
+    sampwidth = header['sampwidth']
+    shift = 0.0
+    scale = 1.0
+    if header['format'] == WAV_FORMAT_IEEE_FLOAT:
+        dtype = {4: '<f4', 8: '<f8'}[sampwidth]
+    elif sampwidth == 1:
+        dtype = np.uint8
+        shift = 128.0
+        scale = 1 / 128
+    elif sampwidth in [2, 4]:
+        dtype = {2: '<i2', 4: '<i4'}[sampwidth]
+        scale = 1 / 2**(8 * sampwidth - 1)
+    else:
+        raise ValueError(f"Samples of {sampwidth} bytes can not be memory "
+                         "mapped.")
+
+    # Truncated files may declare more data than they hold
+    available = os.path.getsize(path) - header['data_offset']
+    nframes = min(header['nframes'], available // header['block_align'])
+    start, size = wav_frame_range({'samplerate': header['samplerate'],
+                                   'nframes': nframes},
+                                  offset=offset,
+                                  duration=duration)
+
+    raw = np.memmap(path,
+                    dtype=dtype,
+                    mode='r',
+                    offset=header['data_offset'],
+                    shape=(nframes, nchannels))
+    raw = raw[start:start + size]
+
+    if channel == 'all':
+        raw = raw.T
+    else:
+        raw = raw[:, channel or 0]
+
+    return MemmapSignal(raw, scale=scale, shift=shift), header['samplerate']
+
+
+def is_wav(path):
+    """Check if path has a WAV extension."""
+    return isinstance(path, str) and os.path.splitext(path)[1].lower() == '.wav'
+
+
 def read_media(path,
                samplerate,
                offset=0.0,
                duration=None,
+               channel=None,
+               use_cache=True,
                **kwargs):
     """Read data as audio and return signal.
 
+    PCM and float WAV files are read with ranged reads of the requested
+    window and other formats supported by soundfile are decoded directly at
+    native samplerate. Signals are resampled only if the requested
+    samplerate differs from the native one. Files that soundfile can not
+    read are decoded with librosa. If a decoded audio cache
+    is active (see yuntu.core.audio.cache) signals are looked up and stored
+    there.
+
     Parameters
     ----------
     path : str
@@ -377,6 +967,11 @@ def read_media(path,
         Audio samplerate to use for reading.
     offset : float
         Time offset to start reading.
+    channel : int, str
+        Channel to read. All channels are averaged if None and stacked with
+        shape (channels, frames) if 'all'.
+    use_cache : bool
+        Whether to use the decoded audio cache if active.
 
     Returns
     -------
@@ -384,15 +979,53 @@ def read_media(path,
         Array containing audio data.
 
     """
-    if isinstance(path, str):
-        if path[:5] == "s3://":
-            path = media_open_s3(path)
-    return librosa.load(path,
-                        sr=samplerate,
-                        offset=offset,
-                        duration=duration,
-                        mono=True,
-                        **kwargs)
+    cache = get_audio_cache() if use_cache else None
+    key = None
+    if cache is not None:
+        key = cache.make_key(path, samplerate, offset=offset,
+                             duration=duration, channel=channel, **kwargs)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+    signal = None
+    if isinstance(path, str) and set(kwargs.keys()) <= {'res_type'}:
+        readers = [read_soundfile_window]
+        if is_wav(path):
+            readers = [read_wav_window] + readers
+
+        for reader in readers:
+            try:
+                signal, read_samplerate = reader(path,
+                                                 samplerate=samplerate,
+                                                 offset=offset,
+                                                 duration=duration,
+                                                 channel=channel,
+                                                 **kwargs)
+                break
+            except (ValueError, KeyError, RuntimeError):
+                signal = None
+
+    if signal is None:
+        if isinstance(path, str):
+            if path[:5] == "s3://":
+                path = media_open_s3(path)
+        signal, read_samplerate = librosa.load(path,
+                                               sr=samplerate,
+                                               offset=offset,
+                                               duration=duration,
+                                               mono=channel is None,
+                                               **kwargs)
+        if channel is not None:
+            signal = np.atleast_2d(signal)
+            if channel != 'all':
+                signal = get_channel(signal, channel, signal.shape[0])
+                if signal.ndim > 1:
+                    signal = signal[0]
+    if key is not None:
+        return cache.put(key, signal, read_samplerate)
+    return signal, read_samplerate
 
 def write_media(path,
                 signal,
@@ -416,7 +1049,7 @@ def write_media(path,
     if media_format not in ["wav", "flac", "ogg"]:
         raise NotImplementedError("Writer for " + media_format
                                   + " not implemented.")
-    if nchannels > 1:
+    if nchannels > 1 and signal.ndim > 1:
         signal = np.transpose(signal, (1, 0))
     soundfile.write(path,
                     signal,
@@ -447,6 +1080,29 @@ def get_channel(signal, channel, nchannels):
     return signal
 
 
+def polyphase_resample(array, original_sr, target_sr, fix=True, scale=False, axis=-1):
+    """Resample with a polyphase filter.
+
+    Much faster than band limited sinc interpolation for samplerates with
+    small rational ratios. Output is float32 for float32 input.
+    """
+    ratio = Fraction(int(target_sr), int(original_sr))
+    signal = resample_poly(array,
+                           ratio.numerator,
+                           ratio.denominator,
+                           axis=axis)
+    signal = signal.astype(array.dtype, copy=False)
+
+    if fix:
+        size = int(np.ceil(array.shape[axis] * float(target_sr) / original_sr))
+        signal = librosa.util.fix_length(signal, size=size, axis=axis)
+
+    if scale:
+        signal /= np.sqrt(float(target_sr) / original_sr)
+
+    return signal
+
+
 def resample(
         array: np.array,
         original_sr: int,
@@ -466,7 +1122,8 @@ def resample(
     target_sr : int
         Target samplerate.
     res_type : str
-        Resampling method.
+        Resampling method. Use 'polyphase' for polyphase filtering or any
+        method supported by librosa.
     fix : bool
         Adjust size of resulting audio file.
     scale : bool
@@ -478,6 +1135,17 @@ def resample(
         Array containing resampled audio data.
 
     """
+    if original_sr == target_sr:
+        return array
+
+    if res_type == 'polyphase':
+        return polyphase_resample(array,
+                                  original_sr,
+                                  target_sr,
+                                  fix=fix,
+                                  scale=scale,
+                                  **kwargs)
+
     return librosa.core.resample(
         array,
         orig_sr=original_sr,
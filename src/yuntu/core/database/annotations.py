@@ -4,6 +4,7 @@ from pony.orm import Optional
 from pony.orm import Set
 from pony.orm import PrimaryKey
 from pony.orm import Json
+from pony.orm import composite_index
 from datetime import datetime
 
 
@@ -25,6 +26,29 @@ ANNOTATION_TYPES = [
 ]
 
 
+def label_pairs(labels):
+    """Return (key, value) string pairs of annotation labels."""
+    if not isinstance(labels, (list, tuple)):
+        return []
+    return [(str(label["key"]), str(label["value"]))
+            for label in labels
+            if isinstance(label, dict) and "key" in label and "value" in label]
+
+
+def build_label_model(db):
+    """Create normalized annotation label model."""
+    class AnnotationLabel(db.Entity):
+        """Indexed key and value of a single annotation label."""
+
+        id = PrimaryKey(int, auto=True)
+        annotation = Required('Annotation')
+        key = Required(str)
+        value = Optional(str)
+        composite_index(key, value)
+
+    return AnnotationLabel
+
+
 def build_base_annotation_model(db):
     """Create base annotation model."""
     class Annotation(db.Entity):
@@ -47,6 +71,21 @@ def build_base_annotation_model(db):
 
         geometry = Required(str)
 
+        label_set = Set('AnnotationLabel')
+
+        def index_labels(self):
+            """Synchronize normalized label rows with labels."""
+            for label in list(self.label_set):
+                label.delete()
+            for key, value in label_pairs(self.labels):
+                self.label_set.create(key=key, value=value)
+
+        def after_insert(self):
+            self.index_labels()
+
+        def before_update(self):
+            self.index_labels()
+
         def before_insert(self):
             if self.type not in ANNOTATION_TYPES:
                 message = f'Notetype {self.type} not implemented'
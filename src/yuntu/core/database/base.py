@@ -3,9 +3,12 @@ from collections import namedtuple
 from pony.orm import Database
 from pony.orm import db_session
 from pony.orm import raw_sql
+from pony.orm import select
 from datetime import datetime
 
 from yuntu.core.database.annotations import build_base_annotation_model
+from yuntu.core.database.annotations import build_label_model
+from yuntu.core.database.annotations import label_pairs
 from yuntu.core.database.recordings import build_base_recording_model
 from yuntu.core.database.datastores import build_base_datastore_model
 from yuntu.core.database.datastores import build_foreign_db_datastore_model
@@ -16,6 +19,7 @@ from yuntu.core.database.datastores import build_remote_storage_model
 MODELS = [
     'recording',
     'annotation',
+    'label',
     'datastore',
     'foreign_db_store',
     'storage',
@@ -55,12 +59,14 @@ class DatabaseManager:
         recording = self.build_recording_model()
         datastore = self.build_datastore_model()
         annotation = self.build_annotation_model()
+        label = self.build_label_model()
 
         foreign, storage, remote = self.build_extra_datastores(datastore)
         models = {
             'recording': recording,
             'datastore': datastore,
             'annotation': annotation,
+            'label': label,
             'foreign_db_store': foreign,
             'storage': storage,
             'remote_storage': remote
@@ -79,6 +85,10 @@ class DatabaseManager:
         """Construct the annotation entity."""
         return build_base_annotation_model(self.db)
 
+    def build_label_model(self):
+        """Construct the normalized annotation label entity."""
+        return build_label_model(self.db)
+
     def build_extra_datastores(self, datastore):
         """Build supplemental datastores for specific behaviours."""
         foreign = build_foreign_db_datastore_model(datastore)
@@ -127,3 +137,18 @@ class DatabaseManager:
         """Directly insert new media entries without a datastore."""
         model_class = self.get_model_class(model)
         return [model_class(**meta) for meta in meta_arr]
+
+    @db_session
+    def index_labels(self):
+        """Rebuild normalized label rows of all annotations.
+
+        Labels are indexed on insertion and update, so this is only needed
+        for databases created before label indexing existed.
+        """
+        label_model = self.models.label
+        annotation_model = self.models.annotation
+        label_model.select().delete(bulk=True)
+        rows = select((a.id, a.labels) for a in annotation_model)
+        for annotation_id, labels in rows:
+            for key, value in label_pairs(labels):
+                label_model(annotation=annotation_id, key=key, value=value)
@@ -4,6 +4,7 @@ from pony.orm import Optional
 from pony.orm import PrimaryKey
 from pony.orm import Set
 from pony.orm import Json
+from pony.orm import composite_index
 from datetime import datetime
 
 
@@ -52,7 +53,8 @@ def build_timed_recording_model(Recording):
         time_raw = Required(str)
         time_format = Required(str)
         time_zone = Required(str)
-        time_utc = Required(datetime, precision=6)
+        time_utc = Required(datetime, precision=6, index=True)
+        composite_index('datastore', time_utc)
 
     return TimedRecording
 
@@ -71,7 +73,8 @@ def build_spatio_temporal_recording_model(Recording):
         time_raw = Required(str)
         time_format = Required(str)
         time_zone = Required(str)
-        time_utc = Required(datetime, precision=6)
+        time_utc = Required(datetime, precision=6, index=True)
+        composite_index('datastore', time_utc)
         latitude = Required(float)
         longitude = Required(float)
         geometry = Required(str)
@@ -2,7 +2,10 @@
 from pony.orm import db_session
 from pony.orm.dbapiprovider import ProgrammingError
 from psycopg2.errors import DuplicateColumn
+import shapely.wkt
 from shapely.geometry import Point
+from shapely.geometry import box
+from shapely.ops import unary_union
 from yuntu.core.database.recordings import build_spatial_recording_model
 from yuntu.core.database.base import DatabaseManager
 
@@ -59,29 +62,61 @@ def parse_sqlite_geometry(db, entities):
     db.commit()
     return entities
 
+GEOMETRY_METHODS = {
+    "intersects": "st_intersects",
+    "within": "st_within",
+    "touches": "st_touches"
+}
+
+def get_geometry_function(method):
+    if method not in GEOMETRY_METHODS:
+        raise NotImplementedError(F"Method {method} not implemented. Use 'raw_sql'.")
+    return GEOMETRY_METHODS[method]
+
+def as_wkt(wkt=None, bbox=None):
+    """Return a single WKT from a WKT, a list of WKTs or a bounding box.
+
+    Lists of geometries are merged into a single (multi) geometry and
+    bounding boxes are given as (min_lon, min_lat, max_lon, max_lat).
+    """
+    if bbox is not None:
+        if wkt is not None:
+            raise ValueError("Use either 'wkt' or 'bbox', not both.")
+        return box(*bbox).wkt
+    if wkt is None:
+        raise ValueError("A 'wkt' or a 'bbox' must be provided.")
+    if isinstance(wkt, (list, tuple)):
+        return unary_union([shapely.wkt.loads(geom) for geom in wkt]).wkt
+    return wkt
+
+def build_postgres_geom_predicate(wkt, method="intersects"):
+    function = get_geometry_function(method)
+    return F"{function}(recording.geom, st_geomfromtext('{wkt}', 4326))"
+
+def build_sqlite_geom_predicate(wkt, method="intersects"):
+    """Spatial predicate that prefilters candidates with the R*Tree index.
+
+    SpatiaLite does not use spatial indices for bare st_* predicates, so
+    candidates are first searched by bounding box in the SpatialIndex
+    virtual table and only those are tested with the exact predicate.
+    Columns are qualified with the recording table name so that the
+    predicate stays unambiguous when queries join other tables.
+    """
+    function = get_geometry_function(method)
+    geometry = F"GeomFromText('{wkt}', 4326)"
+    index_filter = ("recording.id IN (SELECT ROWID FROM SpatialIndex "
+                    "WHERE f_table_name = 'recording' "
+                    "AND f_geometry_column = 'geom' "
+                    F"AND search_frame = {geometry})")
+    return F"{index_filter} AND {function}(recording.geom, {geometry})"
+
 def build_query_postgres_with_geom(wkt, method="intersects"):
-    if method == "intersects":
-        query = F'''lambda recording: raw_sql("st_intersects(geom, st_geomfromtext('{wkt}', 4326))")'''
-        return query
-    elif method == "within":
-        query = F'''lambda recording: raw_sql("st_within(geom, st_geomfromtext('{wkt}', 4326))")'''
-        return query
-    elif method == "touches":
-        query = F'''lambda recording: raw_sql("st_touches(geom, st_geomfromtext('{wkt}', 4326))")'''
-        return query
-    raise NotImplementedError(F"Method {method} not implemented. Use 'raw_sql'.")
+    predicate = build_postgres_geom_predicate(wkt, method)
+    return F'''lambda recording: raw_sql("{predicate}")'''
 
 def build_query_sqlite_with_geom(wkt, method="intersects"):
-    if method == "intersects":
-        query = F'''lambda recording: raw_sql("st_intersects(geom, GeomFromText('{wkt}', 4326))")'''
-        return query
-    elif method == "within":
-        query = F'''lambda recording: raw_sql("st_within(geom, GeomFromText('{wkt}', 4326))")'''
-        return query
-    elif method == "touches":
-        query = F'''lambda recording: raw_sql("st_touches(geom, GeomFromText('{wkt}', 4326))")'''
-        return query
-    raise NotImplementedError(F"Method {method} not implemented. Use 'raw_sql'.")
+    predicate = build_sqlite_geom_predicate(wkt, method)
+    return F'''lambda recording: raw_sql("{predicate}")'''
 
 def create_spatial_structure(db, provider):
     if provider == "sqlite":
@@ -107,6 +142,15 @@ def build_query_with_geom(provider, wkt, method="intersects"):
     else:
         raise NotImplementedError("Only sqlite and postgres databases support spatial query for now")
 
+def build_ids_query_with_geom(provider, wkt, method="intersects"):
+    if provider == "sqlite":
+        predicate = build_sqlite_geom_predicate(wkt, method)
+    elif provider == "postgres":
+        predicate = build_postgres_geom_predicate(wkt, method)
+    else:
+        raise NotImplementedError("Only sqlite and postgres databases support spatial query for now")
+    return F"SELECT id FROM recording WHERE {predicate} ORDER BY id"
+
 
 
 class SpatialDatabaseManager(DatabaseManager):
@@ -135,6 +179,14 @@ class SpatialDatabaseManager(DatabaseManager):
             return parse_geometry(self.db, entities, provider=self.provider)
         return super().insert(meta_arr, model)
 
+    @db_session
+    def select_ids(self, wkt=None, bbox=None, method="intersects"):
+        """Return ids of recordings matching geometry without loading entities."""
+        sql = build_ids_query_with_geom(self.provider,
+                                        as_wkt(wkt=wkt, bbox=bbox),
+                                        method=method)
+        return self.db.select(sql)
+
     def create_spatial_structure(self):
         create_spatial_structure(self.db, self.provider)
 
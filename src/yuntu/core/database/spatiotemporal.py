@@ -1,11 +1,21 @@
 '''Database manager with both time and spatial capabilities'''
 from yuntu.core.database.spatial import SpatialDatabaseManager
+from yuntu.core.database.timed import create_time_indices
 from yuntu.core.database.annotations import build_timed_annotation_model
 from yuntu.core.database.recordings import build_spatio_temporal_recording_model
 
 
 class SpatioTemporalDatabaseManager(SpatialDatabaseManager):
 
+    def init_db(self):
+        """Initialize database.
+
+        Will bind with database, generate all tables, spatial structure and
+        time indices.
+        """
+        super().init_db()
+        create_time_indices(self.db)
+
     def build_spatialized_recording_model(self, recording):
         return build_spatio_temporal_recording_model(recording)
 
@@ -1,9 +1,34 @@
 '''Timed database manager'''
+from pony.orm import db_session
 from yuntu.core.database.annotations import build_timed_annotation_model
 from yuntu.core.database.recordings import build_timed_recording_model
 from yuntu.core.database.base import DatabaseManager
 
+TIME_INDICES = {
+    "idx_recording__time_utc": "time_utc",
+    "idx_recording__datastore_time_utc": "datastore, time_utc"
+}
+
+@db_session
+def create_time_indices(db):
+    """Create recording time indices if missing.
+
+    New tables get these indices from the model definition, this makes sure
+    tables created before they were declared have them too.
+    """
+    for name, columns in TIME_INDICES.items():
+        db.execute(f"CREATE INDEX IF NOT EXISTS {name} ON recording ({columns})")
+    db.commit()
+
 class TimedDatabaseManager(DatabaseManager):
+    def init_db(self):
+        """Initialize database.
+
+        Will bind with database, generate all tables and time indices.
+        """
+        super().init_db()
+        create_time_indices(self.db)
+
     def build_recording_model(self):
         recording = super().build_recording_model()
         return build_timed_recording_model(recording)
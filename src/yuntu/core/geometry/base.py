@@ -16,6 +16,15 @@ INFINITY = 10e+15
 
 
 class Geometry(ABC):
+    """Base class for geometries.
+
+    Geometries that are described by their bounds, such as boxes,
+    intervals, lines and points, store the bounds and only build the
+    shapely geometry when it is first requested.
+    """
+
+    __slots__ = ('_geometry',)
+
     name = None
 
     class Types(Enum):
@@ -34,7 +43,22 @@ class Geometry(ABC):
         GeometryCollection = 'GeometryCollection'
 
     def __init__(self, geometry=None):
-        self.geometry = geometry
+        self._geometry = geometry
+
+    @property
+    def geometry(self):
+        """Return shapely geometry."""
+        if self._geometry is None:
+            self._geometry = self._build_geometry()
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        self._geometry = geometry
+
+    # pylint: disable=no-self-use
+    def _build_geometry(self):
+        return None
 
     def __repr__(self):
         args = ', '.join([
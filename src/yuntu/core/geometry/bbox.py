@@ -4,6 +4,8 @@ from yuntu.core.geometry.mixins import Geometry2DMixin
 
 
 class BBox(Geometry2DMixin, Geometry):
+    __slots__ = ('start_time', 'end_time', 'min_freq', 'max_freq')
+
     name = Geometry.Types.BBox
 
     def __init__(
@@ -30,18 +32,27 @@ class BBox(Geometry2DMixin, Geometry):
                 message = 'Bounding box min freq must be set.'
                 raise ValueError(message)
 
-            geometry = utils.bbox_to_polygon([
-                start_time, end_time,
-                min_freq, max_freq])
+            start_time, end_time = sorted([float(start_time), float(end_time)])
+            min_freq, max_freq = sorted([float(min_freq), float(max_freq)])
+        else:
+            start_time, min_freq, end_time, max_freq = geometry.bounds
 
         super().__init__(geometry=geometry)
 
-        start_time, min_freq, end_time, max_freq = self.geometry.bounds
         self.start_time = start_time
         self.end_time = end_time
         self.min_freq = min_freq
         self.max_freq = max_freq
 
+    def _build_geometry(self):
+        return utils.bbox_to_polygon([
+            self.start_time, self.end_time,
+            self.min_freq, self.max_freq])
+
+    @property
+    def bounds(self):
+        return self.start_time, self.min_freq, self.end_time, self.max_freq
+
     def to_dict(self):
         data = super().to_dict()
         data['start_time'] = self.start_time
@@ -9,6 +9,8 @@ class GeometryCollection(
         Geometry):
     """Point collection geometry."""
 
+    __slots__ = ('_geoms',)
+
     name = Geometry.Types.GeometryCollection
 
     def __init__(self, collection=None, geometry=None):
@@ -8,20 +8,26 @@ class TimeInterval(
         Non2DGeometryMixin,
         TimeIntervalMixin,
         Geometry):
+    __slots__ = ('start_time', 'end_time')
+
     name = Geometry.Types.TimeInterval
 
     def __init__(self, start_time=None, end_time=None, geometry=None):
         if geometry is None:
-            geometry = utils.bbox_to_polygon([
-                start_time, end_time,
-                0, utils.INFINITY])
+            start_time, end_time = sorted([float(start_time), float(end_time)])
+        else:
+            start_time, _, end_time, _ = geometry.bounds
 
         super().__init__(geometry=geometry)
 
-        start_time, _, end_time, _ = self.geometry.bounds
         self.end_time = end_time
         self.start_time = start_time
 
+    def _build_geometry(self):
+        return utils.bbox_to_polygon([
+            self.start_time, self.end_time,
+            0, utils.INFINITY])
+
     def to_dict(self):
         data = super().to_dict()
         data['start_time'] = self.start_time
@@ -95,21 +101,27 @@ class FrequencyInterval(
         Non2DGeometryMixin,
         FrequencyIntervalMixin,
         Geometry):
+    __slots__ = ('min_freq', 'max_freq')
+
     name = Geometry.Types.FrequencyInterval
 
     def __init__(self, min_freq=None, max_freq=None, geometry=None):
         if geometry is None:
-            geometry = utils.bbox_to_polygon([
-                0, utils.INFINITY,
-                min_freq, max_freq
-            ])
+            min_freq, max_freq = sorted([float(min_freq), float(max_freq)])
+        else:
+            _, min_freq, _, max_freq = geometry.bounds
 
         super().__init__(geometry=geometry)
 
-        _, min_freq, _, max_freq = self.geometry.bounds
         self.min_freq = min_freq
         self.max_freq = max_freq
 
+    def _build_geometry(self):
+        return utils.bbox_to_polygon([
+            0, utils.INFINITY,
+            self.min_freq, self.max_freq
+        ])
+
     def to_dict(self):
         data = super().to_dict()
         data['min_freq'] = self.min_freq
@@ -4,19 +4,25 @@ from yuntu.core.geometry.mixins import Non2DGeometryMixin, TimeIntervalMixin
 
 
 class TimeLine(Non2DGeometryMixin, Geometry):
+    __slots__ = ('time',)
+
     name = Geometry.Types.TimeLine
 
     def __init__(self, time=None, geometry=None):
         if geometry is None:
-            geometry = utils.linestring_geometry([
-                (time, 0),
-                (time, utils.INFINITY)])
+            time = float(time)
+        else:
+            time, _, _, _ = geometry.bounds
 
         super().__init__(geometry=geometry)
 
-        time, _, _, _ = self.geometry.bounds
         self.time = time
 
+    def _build_geometry(self):
+        return utils.linestring_geometry([
+            (self.time, 0),
+            (self.time, utils.INFINITY)])
+
     def to_dict(self):
         data = super().to_dict()
         data['time'] = self.time
@@ -62,19 +68,25 @@ class TimeLine(Non2DGeometryMixin, Geometry):
 
 
 class FrequencyLine(Non2DGeometryMixin, Geometry):
+    __slots__ = ('freq',)
+
     name = Geometry.Types.FrequencyLine
 
     def __init__(self, freq=None, geometry=None):
         if geometry is None:
-            geometry = utils.linestring_geometry([
-                (0, freq),
-                (utils.INFINITY, freq)])
+            freq = float(freq)
+        else:
+            _, freq, _, _ = geometry.bounds
 
         super().__init__(geometry=geometry)
 
-        _, freq, _, _ = self.geometry.bounds
         self.freq = freq
 
+    def _build_geometry(self):
+        return utils.linestring_geometry([
+            (0, self.freq),
+            (utils.INFINITY, self.freq)])
+
     def to_dict(self):
         data = super().to_dict()
         data['freq'] = self.freq
@@ -7,25 +7,36 @@ from yuntu.core.geometry.mixins import Geometry2DMixin, MultiGeometryMixin
 
 
 class LineString(Geometry2DMixin, Geometry):
+    __slots__ = ('_wkt',)
+
     name = Geometry.Types.LineString
 
     def __init__(self, wkt=None, vertices=None, geometry=None):
         if geometry is None:
-            if wkt is not None:
-                geometry = utils.geom_from_wkt(wkt)
-
-            elif vertices is not None:
-                geometry = utils.linestring_geometry(vertices)
-
-            else:
+            if wkt is None and vertices is None:
                 message = (
                     'Either wkt or vertices must be supplied '
                     'to create a LineString geometry.')
                 raise ValueError(message)
 
+            # Geometries given as WKT are parsed when first needed
+            if wkt is None:
+                geometry = utils.linestring_geometry(vertices)
+        else:
+            wkt = None
+
         super().__init__(geometry=geometry)
 
-        self.wkt = self.geometry.wkt
+        self._wkt = wkt
+
+    def _build_geometry(self):
+        return utils.geom_from_wkt(self._wkt)
+
+    @property
+    def wkt(self):
+        if self._wkt is None:
+            self._wkt = self.geometry.wkt
+        return self._wkt
 
     def __iter__(self):
         from yuntu.core.geometry.points import Point
@@ -126,6 +137,8 @@ class MultiLineString(
         Geometry):
     """Linestring collection geometry."""
 
+    __slots__ = ()
+
     name = Geometry.Types.MultiLineString
 
     def __init__(self, linestrings=None, geometry=None):
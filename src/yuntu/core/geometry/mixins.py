@@ -1,4 +1,6 @@
 class Non2DGeometryMixin:
+    __slots__ = ()
+
     def union(self, other):
         import yuntu.core.geometry.geometry_collections as geometry_collections
 
@@ -10,6 +12,8 @@ class Non2DGeometryMixin:
 
 
 class TimeIntervalMixin:
+    __slots__ = ()
+
     def to_start_line(self):
         from yuntu.core.geometry.lines import TimeLine
 
@@ -31,6 +35,8 @@ class TimeIntervalMixin:
 
 
 class FrequencyIntervalMixin:
+    __slots__ = ()
+
     def to_min_line(self):
         from yuntu.core.geometry.lines import FrequencyLine
 
@@ -52,6 +58,8 @@ class FrequencyIntervalMixin:
 
 
 class Geometry2DMixin(TimeIntervalMixin, FrequencyIntervalMixin):
+    __slots__ = ()
+
     def to_time_interval(self):
         from yuntu.core.geometry.intervals import TimeInterval
 
@@ -90,6 +98,8 @@ class Geometry2DMixin(TimeIntervalMixin, FrequencyIntervalMixin):
 class MultiGeometryMixin:
     """Mixin that adds multi geometry behaviour to geometry classes."""
 
+    __slots__ = ()
+
     @property
     def geoms(self):
         """Return iterator of geometries."""
@@ -5,16 +5,29 @@ from yuntu.core.geometry.mixins import Geometry2DMixin, MultiGeometryMixin
 
 
 class Point(Geometry):
+    __slots__ = ('time', 'freq')
+
     name = Geometry.Types.Point
 
     def __init__(self, time=None, freq=None, geometry=None):
         if geometry is None:
-            geometry = utils.point_geometry(time, freq)
+            time = float(time)
+            freq = float(freq)
+        else:
+            time = geometry.x
+            freq = geometry.y
 
         super().__init__(geometry=geometry)
 
-        self.time = self.geometry.x
-        self.freq = self.geometry.y
+        self.time = time
+        self.freq = freq
+
+    def _build_geometry(self):
+        return utils.point_geometry(self.time, self.freq)
+
+    @property
+    def bounds(self):
+        return self.time, self.freq, self.time, self.freq
 
     def __getitem__(self, key):
         if not isinstance(key, int):
@@ -55,6 +68,8 @@ class MultiPoint(
         Geometry):
     """Point collection geometry."""
 
+    __slots__ = ()
+
     name = Geometry.Types.MultiPoint
 
     def __init__(self, points=None, geometry=None):
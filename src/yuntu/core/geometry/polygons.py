@@ -5,22 +5,33 @@ from yuntu.core.geometry.mixins import Geometry2DMixin, MultiGeometryMixin
 
 
 class Polygon(Geometry2DMixin, Geometry):
+    __slots__ = ('_wkt',)
+
     name = Geometry.Types.Polygon
 
     def __init__(self, wkt=None, shell=None, holes=None, geometry=None):
         if geometry is None:
-            if wkt is not None:
-                geometry = utils.geom_from_wkt(wkt)
-
-            elif shell is not None:
+            # Geometries given as WKT are parsed when first needed
+            if wkt is None and shell is not None:
                 if holes is None:
                     holes = []
 
                 geometry = utils.polygon_geometry(shell, holes)
+        else:
+            wkt = None
 
         super().__init__(geometry=geometry)
 
-        self.wkt = self.geometry.wkt
+        self._wkt = wkt
+
+    def _build_geometry(self):
+        return utils.geom_from_wkt(self._wkt)
+
+    @property
+    def wkt(self):
+        if self._wkt is None:
+            self._wkt = self.geometry.wkt
+        return self._wkt
 
     def to_dict(self):
         data = super().to_dict()
@@ -86,6 +97,8 @@ class MultiPolygon(
         Geometry):
     """Polygon collection geometry."""
 
+    __slots__ = ()
+
     name = Geometry.Types.MultiPolygon
 
     def __init__(self, polygons=None, geometry=None):
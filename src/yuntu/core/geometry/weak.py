@@ -3,16 +3,19 @@ from yuntu.core.geometry.base import Geometry
 
 
 class Weak(Geometry):
+    __slots__ = ()
+
     name = Geometry.Types.Weak
 
     def __init__(self, geometry=None):
-        if geometry is None:
-            geometry = utils.bbox_to_polygon([
-                0, utils.INFINITY,
-                0, utils.INFINITY
-            ])
         super().__init__(geometry=geometry)
 
+    def _build_geometry(self):
+        return utils.bbox_to_polygon([
+            0, utils.INFINITY,
+            0, utils.INFINITY
+        ])
+
     def buffer(self, buffer=None, **kwargs):
         return self
 
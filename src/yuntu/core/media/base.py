@@ -12,6 +12,7 @@ from abc import abstractmethod
 from urllib.parse import urlparse
 
 from yuntu.utils import download_file
+from yuntu.utils import get_s3_filesystem
 from yuntu.core.windows import Window
 from yuntu.core.annotation.annotated_object import AnnotatedObjectMixin
 
@@ -135,9 +136,7 @@ class Media(ABC, AnnotatedObjectMixin):
             return False
 
         if "s3://" == path[:5]:
-            from s3fs.core import S3FileSystem
-            s3 = S3FileSystem()
-            return s3.exists(path)
+            return get_s3_filesystem().exists(path)
 
         return os.path.exists(path)
 
@@ -264,6 +263,11 @@ class Media(ABC, AnnotatedObjectMixin):
     def _has_trivial_window(self):
         return True
 
+    # pylint: disable=no-self-use
+    def _supports_lazy_cut(self):
+        """Check if a windowed copy can load only its own window."""
+        return False
+
     # pylint: disable=no-self-use
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         """Use numpy universal functions on media array."""
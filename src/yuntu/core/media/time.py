@@ -233,7 +233,9 @@ class TimeMediaMixin:
             A window object to use for cutting.
         lazy: bool, optional
             Boolean flag that determines if the fragment loads
-            its data lazily.
+            its data lazily. Lazy fragments of unloaded media read or
+            compute only the data within their window. Media that is
+            already loaded is always cut eagerly.
 
         Returns
         -------
@@ -274,10 +276,14 @@ class TimeMediaMixin:
             end=end_time if pad else bounded_end_time)
 
         if lazy:
-            # TODO: No lazy cutting for now. The compute method does not take
-            # into acount possible cuts and thus might not give the correct
-            # result.
-            lazy = False
+            # Loaded arrays are sliced directly and padding outside of the
+            # media bounds can only be done on loaded arrays.
+            needs_pad = pad and (
+                start_time < current_start or end_time > current_end)
+            lazy = (
+                self.is_empty() and
+                self._supports_lazy_cut() and
+                not needs_pad)
 
         kwargs_dict['lazy'] = lazy
         kwargs_dict['duration'] = kwargs_dict['window'].end - kwargs_dict['window'].start
@@ -115,17 +115,21 @@ class TimeFrequencyMediaMixin(TimeMediaMixin, FrequencyMediaMixin):
         freq_index = self.get_index_from_frequency(freq)
         freq_index = self._restrain_freq_index(freq_index)
 
-        if self.time_axis_index > self.frequency_axis_index:
-            first_axis = self.time_axis_index
+        ndim = self.array.ndim
+        time_axis = self.time_axis_index % ndim
+        frequency_axis = self.frequency_axis_index % ndim
+
+        if time_axis > frequency_axis:
+            first_axis = time_axis
             first_index = time_index
 
-            second_axis = self.frequency_axis_index
+            second_axis = frequency_axis
             second_index = freq_index
         else:
-            first_axis = self.frequency_axis_index
+            first_axis = frequency_axis
             first_index = freq_index
 
-            second_axis = self.time_axis_index
+            second_axis = time_axis
             second_index = time_index
 
         result = self.array.take(first_index, axis=first_axis)
@@ -246,10 +250,17 @@ class TimeFrequencyMediaMixin(TimeMediaMixin, FrequencyMediaMixin):
             max=max_freq if pad else bounded_max_freq)
 
         if lazy:
-            # TODO: No lazy cutting for now. The compute method does not take
-            # into acount possible cuts and thus might not give the correct
-            # result.
-            lazy = False
+            # Loaded arrays are sliced directly and padding outside of the
+            # media bounds can only be done on loaded arrays.
+            needs_pad = pad and (
+                start_time < current_start or
+                end_time > current_end or
+                min_freq < current_min or
+                max_freq > current_max)
+            lazy = (
+                self.is_empty() and
+                self._supports_lazy_cut() and
+                not needs_pad)
         kwargs['lazy'] = lazy
 
         if not lazy:
@@ -504,15 +515,64 @@ class TimeFrequencyMediaMixin(TimeMediaMixin, FrequencyMediaMixin):
             time_axis=self.time_axis,
             frequency_axis=self.frequency_axis)
 
+    def to_label_mask(self, geometries, labels=None, stack=False):
+        """Rasterize many geometries on the media grid in one pass.
+
+        Parameters
+        ----------
+        geometries: list
+            Annotations, windows or geometries to rasterize.
+        labels: array-like of int, optional
+            Positive integer label of each geometry. Defaults to the
+            position of each geometry plus one.
+        stack: bool
+            If True return one binary mask per distinct label instead of
+            a labeled mask.
+
+        Returns
+        -------
+        mask: np.array
+            Integer mask of shape (frequencies, times) with the label of
+            the last geometry covering each cell and 0 elsewhere. If
+            'stack' is True, a boolean array of shape
+            (number of labels, frequencies, times) ordered by label value.
+        """
+        shapes = []
+        for geometry in geometries:
+            if isinstance(geometry, (annotation.Annotation, windows.Window)):
+                geometry = geometry.geometry
+
+            if isinstance(geometry, geom.Geometry):
+                geometry = geometry.geometry
+
+            shapes.append(geometry)
+
+        start_time = self._get_start()
+        min_freq = self._get_min()
+        time_bins = np.vectorize(self.time_axis.get_bin, otypes=[np.int64])
+        freq_bins = np.vectorize(
+            self.frequency_axis.get_bin, otypes=[np.int64])
+        start_bin = self.time_axis.get_bin(start_time)
+        min_bin = self.frequency_axis.get_bin(min_freq)
+
+        return geom_utils.geometries_to_mask(
+            shapes,
+            (self.frequency_size, self.time_size),
+            labels=labels,
+            transformX=lambda values: time_bins(values) - start_bin,
+            transformY=lambda values: freq_bins(values) - min_bin,
+            bounds=(start_time, min_freq, self._get_end(), self._get_max()),
+            stack=stack)
+
     # pylint: disable=arguments-differ
     def _build_slices(self, start_time, end_time, min_freq, max_freq):
-        slice_args = [slice(None, None, None) for _ in self.shape]
+        slice_args = [slice(None, None, None) for _ in range(self.ndim)]
         slice_args[self.time_axis_index] = slice(start_time, end_time)
         slice_args[self.frequency_axis_index] = slice(min_freq, max_freq)
         return tuple(slice_args)
 
     def _build_pad_widths(self, start_pad, end_pad, min_pad, max_pad):
-        widths = [(0, 0) for _ in self.shape]
+        widths = [(0, 0) for _ in range(self.ndim)]
         widths[self.time_axis_index] = (start_pad, end_pad)
         widths[self.frequency_axis_index] = (min_pad, max_pad)
         return widths
@@ -678,6 +678,159 @@ def geometry_to_mask(geom,
     raise NotImplementedError(message)
 
 
+def _box_bounds(geom):
+    """Return bounds of axis aligned rectangles or None for other geometries."""
+    if not isinstance(geom, Polygon) or geom.is_empty:
+        return None
+
+    if len(geom.interiors) > 0 or len(geom.exterior.coords) != 5:
+        return None
+
+    minx, miny, maxx, maxy = geom.bounds
+    if minx == maxx or miny == maxy:
+        return None
+
+    if not math.isclose(geom.area, (maxx - minx) * (maxy - miny)):
+        return None
+
+    return minx, miny, maxx, maxy
+
+
+def geometries_to_mask(geoms,
+                       shape,
+                       labels=None,
+                       transformX=None,
+                       transformY=None,
+                       bounds=None,
+                       stack=False):
+    """Rasterize many geometries on a shared grid in one pass.
+
+    Axis aligned rectangles (boxes and time or frequency intervals) are
+    written as index ranges, computed for all of them at once, and cover
+    every cell they touch even when thinner than a cell. Any other
+    geometry is rasterized with 'geometry_to_mask'.
+
+    Parameters
+    ----------
+    geoms: list of shapely.geometry
+        Geometries to rasterize.
+    shape: tuple(int, int)
+        Shape of output mask.
+    labels: array-like of int, optional
+        Positive integer label of each geometry. Defaults to the position
+        of each geometry plus one.
+    transformX: function
+        Vectorized transformation to apply on 'x' coordinates.
+    transformY: function
+        Vectorized transformation to apply on 'y' coordinates.
+    bounds: tuple(float, float, float, float), optional
+        Extent of the grid as (minx, miny, maxx, maxy). Geometries that
+        are not rectangles are clipped to it before rasterization.
+    stack: bool
+        If True return one binary mask per distinct label instead of a
+        labeled mask.
+
+    Returns
+    -------
+    mask: np.array
+        Integer mask with the label of the last geometry covering each
+        cell and 0 elsewhere. If 'stack' is True, a boolean array of shape
+        (number of labels, *shape) ordered by label value.
+    """
+    if labels is None:
+        labels = np.arange(1, len(geoms) + 1)
+    labels = np.asarray(labels, dtype=np.int64)
+
+    if labels.shape[0] != len(geoms):
+        message = 'Labels and geometries must have the same length'
+        raise ValueError(message)
+
+    if np.any(labels <= 0):
+        message = 'Labels must be positive integers'
+        raise ValueError(message)
+
+    if transformX is None:
+        transformX = np.asarray
+    if transformY is None:
+        transformY = np.asarray
+
+    box_positions = []
+    box_bounds = []
+    other_positions = []
+    for position, geom in enumerate(geoms):
+        gbounds = _box_bounds(geom)
+        if gbounds is None:
+            if not geom.is_empty:
+                other_positions.append(position)
+            continue
+        box_positions.append(position)
+        box_bounds.append(gbounds)
+
+    rows, cols = shape
+    row_ranges = np.zeros([0, 2], dtype=np.int64)
+    col_ranges = np.zeros([0, 2], dtype=np.int64)
+    if len(box_bounds) > 0:
+        box_bounds = np.array(box_bounds, dtype=float)
+        col_ranges = np.stack([
+            np.asarray(transformX(box_bounds[:, 0])),
+            np.asarray(transformX(box_bounds[:, 2]))], axis=1)
+        row_ranges = np.stack([
+            np.asarray(transformY(box_bounds[:, 1])),
+            np.asarray(transformY(box_bounds[:, 3]))], axis=1)
+
+        # Vertices fall on cell centers so both ends of ranges are included
+        col_ranges = np.stack([
+            np.clip(np.ceil(col_ranges[:, 0]), 0, cols),
+            np.clip(np.floor(col_ranges[:, 1]) + 1, 0, cols)],
+            axis=1).astype(np.int64)
+        row_ranges = np.stack([
+            np.clip(np.ceil(row_ranges[:, 0]), 0, rows),
+            np.clip(np.floor(row_ranges[:, 1]) + 1, 0, rows)],
+            axis=1).astype(np.int64)
+
+    if bounds is not None:
+        extent = box(*bounds)
+
+    def other_mask(position):
+        geom = geoms[position]
+        if bounds is not None:
+            geom = geom.intersection(extent)
+        return geometry_to_mask(geom,
+                                shape,
+                                transformX=transformX,
+                                transformY=transformY)
+
+    if stack:
+        unique_labels, label_index = np.unique(labels, return_inverse=True)
+        nlabels = unique_labels.shape[0]
+
+        # Box coverage is accumulated as 2D differences and integrated once
+        diff = np.zeros([nlabels, rows + 1, cols + 1], dtype=np.int32)
+        box_labels = label_index[box_positions]
+        np.add.at(diff, (box_labels, row_ranges[:, 0], col_ranges[:, 0]), 1)
+        np.add.at(diff, (box_labels, row_ranges[:, 0], col_ranges[:, 1]), -1)
+        np.add.at(diff, (box_labels, row_ranges[:, 1], col_ranges[:, 0]), -1)
+        np.add.at(diff, (box_labels, row_ranges[:, 1], col_ranges[:, 1]), 1)
+        masks = diff.cumsum(axis=1).cumsum(axis=2)[:, :rows, :cols] > 0
+
+        for position in other_positions:
+            masks[label_index[position]] |= other_mask(position)
+
+        return masks
+
+    mask = np.zeros(shape, dtype=np.int64)
+    box_ranges = dict(zip(box_positions, zip(row_ranges, col_ranges)))
+    others = set(other_positions)
+    for position, label in enumerate(labels):
+        if position in box_ranges:
+            (row_start, row_end), (col_start, col_end) = box_ranges[position]
+            mask[row_start:row_end, col_start:col_end] = label
+        elif position in others:
+            mask[other_mask(position)] = label
+
+    return mask
+
+
 def point_neighbourhood(array,
                         point,
                         bins=1,
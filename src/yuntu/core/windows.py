@@ -9,9 +9,33 @@ INFINITY = 10e+15
 
 
 class Window(ABC):
-    """A window is an object used to select portions of data."""
+    """A window is an object used to select portions of data.
+
+    Windows hold their bounds and only build the corresponding shapely
+    geometry when it is first requested.
+    """
+
+    # Bounds of all window types are declared here since
+    # TimeFrequencyWindow inherits from both TimeWindow and FrequencyWindow.
+    __slots__ = ('start', 'end', 'min', 'max', '_geometry')
+
     def __init__(self, geometry=None):
-        self.geometry = geometry
+        self._geometry = geometry
+
+    @property
+    def geometry(self):
+        """Return window as shapely geometry."""
+        if self._geometry is None:
+            self._geometry = self._build_geometry()
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        self._geometry = geometry
+
+    # pylint: disable=no-self-use
+    def _build_geometry(self):
+        return None
 
     def cut(self, other):
         """Use window to cut out object."""
@@ -76,6 +100,8 @@ class TimeWindow(Window):
     Used to cut a time interval.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             start: Optional[float] = None,
@@ -92,21 +118,16 @@ class TimeWindow(Window):
         """
         self.start = start
         self.end = end
-
-        if 'geometry' not in kwargs:
-            if start is None:
-                start = 0
-
-            if end is None:
-                end = INFINITY
-
-            kwargs['geometry'] = geom_utils.bbox_to_polygon([
-                start, end,
-                0, INFINITY
-            ])
-
         super().__init__(**kwargs)
 
+    def _build_geometry(self):
+        start = self.start if self.start is not None else 0
+        end = self.end if self.end is not None else INFINITY
+        return geom_utils.bbox_to_polygon([
+            start, end,
+            0, INFINITY
+        ])
+
     def plot(self, ax=None, **kwargs):
         """Plot time window."""
         import matplotlib.pyplot as plt
@@ -169,6 +190,8 @@ class FrequencyWindow(Window):
     Used to cut a range of frequencies.
     """
 
+    __slots__ = ()
+
     # pylint: disable=redefined-builtin
     def __init__(
             self,
@@ -186,21 +209,16 @@ class FrequencyWindow(Window):
         """
         self.min = min
         self.max = max
-
-        if 'geometry' not in kwargs:
-            if min is None:
-                min = 0
-
-            if max is None:
-                max = INFINITY
-
-            kwargs['geometry'] = geom_utils.bbox_to_polygon([
-                0, INFINITY,
-                min, max
-            ])
-
         super().__init__(**kwargs)
 
+    def _build_geometry(self):
+        min_freq = self.min if self.min is not None else 0
+        max_freq = self.max if self.max is not None else INFINITY
+        return geom_utils.bbox_to_polygon([
+            0, INFINITY,
+            min_freq, max_freq
+        ])
+
     def buffer(self, buffer):
         """Get a buffer window."""
         if isinstance(buffer, (tuple, list)):
@@ -263,6 +281,8 @@ class TimeFrequencyWindow(TimeWindow, FrequencyWindow):
     Used to cut a range of frequencies and times.
     """
 
+    __slots__ = ()
+
     # pylint: disable=redefined-builtin
     def __init__(
             self,
@@ -284,18 +304,18 @@ class TimeFrequencyWindow(TimeWindow, FrequencyWindow):
         max:
             Interval ending frequency in hertz.
         """
-        if 'geometry' not in kwargs:
-            start_time = start if start is not None else 0
-            end_time = end if end is not None else INFINITY
-            min_freq = min if min is not None else 0
-            max_freq = max if max is not None else INFINITY
-            kwargs['geometry'] = geom_utils.bbox_to_polygon([
-                start_time, end_time,
-                min_freq, max_freq
-            ])
-
         super().__init__(start=start, end=end, min=min, max=max, **kwargs)
 
+    def _build_geometry(self):
+        start_time = self.start if self.start is not None else 0
+        end_time = self.end if self.end is not None else INFINITY
+        min_freq = self.min if self.min is not None else 0
+        max_freq = self.max if self.max is not None else INFINITY
+        return geom_utils.bbox_to_polygon([
+            start_time, end_time,
+            min_freq, max_freq
+        ])
+
     def to_time(self):
         return TimeWindow(start=self.start, end=self.end)
 
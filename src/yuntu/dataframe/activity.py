@@ -5,7 +5,13 @@ import pytz
 import datetime
 import matplotlib.pyplot as plt
 import matplotlib.cm as cm
-from yuntu.analytics.ecology.basic import diversity, richness, rarefaction, rarefaction_curve
+from yuntu.analytics.ecology.basic import rarefaction_curve
+from yuntu.analytics.ecology.basic import diversity_frame
+from yuntu.analytics.ecology.basic import richness_frame
+from yuntu.analytics.ecology.basic import rarefaction_frame
+from yuntu.analytics.ecology.basic import group_activity
+from yuntu.analytics.ecology.basic import label_counts
+from yuntu.analytics.ecology.basic import shannon_index
 
 ABS_START_TIME = 'abs_start_time'
 ABS_END_TIME = 'abs_end_time'
@@ -39,57 +45,83 @@ class ActivityAccessor:
             message = "Could not find any column to treat as activity."
             raise ValueError(message)
 
-    def diversity(self, div_type="Shannon", component="alpha", labels=None):
+    def group(self, by=None, freq=None, labels=None):
+        """Return activity dataframe with label counts summed by groups.
+
+        Parameters
+        ----------
+        by : str or list, optional
+            Columns to group by, for example a site column.
+        freq : str, optional
+            Fixed frequency of time periods to group by, for example '1h'.
+        labels : list, optional
+            Label columns to sum. Defaults to all activity columns.
+        """
         if labels is None:
             labels = self.activity_columns
- 
+        return group_activity(self._obj, labels, by=by, freq=freq)
+
+    def _grouped(self, labels, by=None, freq=None):
+        """Return frame to compute measures on and columns to keep."""
+        columns = [ABS_START_TIME, ABS_END_TIME]
+        if by is None and freq is None:
+            return self._obj, columns
+
+        grouped = group_activity(self._obj, labels, by=by, freq=freq)
+        keys = [column for column in grouped.columns
+                if column not in labels and column not in columns]
+        return grouped, keys + columns
+
+    def diversity(self, div_type="Shannon", component="alpha", labels=None,
+                  by=None, freq=None):
+        if labels is None:
+            labels = self.activity_columns
+
+        obj, columns = self._grouped(labels, by=by, freq=freq)
+
+        gamma = shannon_index(label_counts(obj, labels).sum(axis=0),
+                              div_type=div_type)[0]
+
         if component == "gamma":
-            return diversity(self._obj[labels].sum(), labels=labels, div_type=div_type)
+            return pd.DataFrame({ABS_START_TIME: [obj[ABS_START_TIME].min()],
+                                 ABS_END_TIME: [obj[ABS_END_TIME].max()],
+                                 "diversity": [gamma]})
 
-        div = self._obj.apply(diversity, labels=labels, div_type=div_type, axis=1)
+        div = diversity_frame(obj, labels, div_type=div_type, columns=columns)
 
         if component == "alpha":
             return div
 
-        gamma = diversity(self._obj[labels].sum(), labels=labels, div_type=div_type)
-
         if component == "beta":
             return div.diversity.mean() / gamma
 
         if component == "partial_beta":
-            div.loc[:, "diversity"] = div.diversity.apply(lambda x: x / gamma)
+            div["diversity"] = div["diversity"] / gamma
             return div
 
-    def richness(self, labels=None, total=False):
+    def richness(self, labels=None, total=False, by=None, freq=None):
         if labels is None:
             labels = self.activity_columns
-        rich = self._obj.apply(richness, labels=labels, axis=1)
+        obj, columns = self._grouped(labels, by=by, freq=freq)
+        rich = richness_frame(obj, labels, columns=columns)
         if not total:
             return rich
         return rich.richness.sum()
 
-    def rarefaction(self, size=None, labels=None):
+    def rarefaction(self, size=None, labels=None, by=None, freq=None):
         if labels is None:
             labels = self.activity_columns
 
+        obj, columns = self._grouped(labels, by=by, freq=freq)
+
         if size is None:
-            sums = self._obj[labels].apply(sum, axis=1)
-            size = np.min(sums)
-            rarefact = self._obj.apply(rarefaction, size=size, labels=labels, axis=1)
-        else:
-            if isinstance(size, (int, float)):
-                rarefact = self._obj.apply(rarefaction, size=size, labels=labels, axis=1)
-            else:
-                if len(size) != len(self.activity_columns):
-                    msg = 'Size length should be equal to the number of labels.'
-                    raise ValueError(msg)
-                z = self._obj.copy()
-                z['size'] = size
-                s2 = z['size']
-                x2 = z.drop('size')
-                rarefact = x2.apply(rarefaction, size=s2, labels=labels, axis=1)
-
-        return rarefact
+            size = label_counts(obj, labels).sum(axis=1).min()
+        elif np.ndim(size) != 0:
+            if len(size) != obj.shape[0]:
+                msg = 'Size length should be equal to the number of rows.'
+                raise ValueError(msg)
+
+        return rarefaction_frame(obj, size, labels, columns=columns)
 
     def plot(self, ax=None, time_format = '%d-%m-%Y %H:%M:%S', labels=None,
              view_time_zone="America/Mexico_city", nticks=15, stacked=True, **kwargs):
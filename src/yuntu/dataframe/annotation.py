@@ -3,8 +3,11 @@
 An audio dataframe is a
 """
 import datetime
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 import shapely.wkt
 from shapely.ops import unary_union
@@ -12,8 +15,9 @@ from shapely.geometry import Polygon, box
 
 from yuntu.soundscape.utils import parse_json
 from yuntu.core.utils.atlas import buffer_geometry
-from yuntu.core.annotation.labels import Labels
 from yuntu.core.annotation.annotation import Annotation
+from yuntu.core.annotation.index import AnnotationIndex
+from yuntu.core.annotation.index import NON_BOX_ANNOTATIONS
 
 
 GEOMETRY = 'geometry'
@@ -50,6 +54,20 @@ def buffer_geometry_clip(geom, radius):
     x = np.clip(x, 0, None)
     return Polygon(zip(x,y)).simplify(0)
 
+def merge_labels(label_lists):
+    '''Merge label lists keeping the first value found for each key'''
+    merged = OrderedDict()
+    for labels in label_lists:
+        for label in labels:
+            if label["key"] in merged:
+                continue
+            data = {"key": label["key"], "value": label["value"]}
+            if label.get("type") is not None:
+                data["type"] = label["type"]
+            merged[label["key"]] = data
+
+    return list(merged.values())
+
 def disolve_file_annotations(group, key, join_meta_func=None):
     '''Return disolved weak annotations within group'''
 
@@ -59,24 +77,14 @@ def disolve_file_annotations(group, key, join_meta_func=None):
         metadata = join_meta_func(group.metadata.values)
     else:
         metadata = {}
-    
-    labels = None
-    for n, lab in group.labels.items():
-        llab = Labels.from_dict(lab)
-        if labels is None:
-            labels = llab
-            continue
-        for l in llab:
-            if l.key not in labels:
-                labels.add(l)
+
+    labels = merge_labels(group.labels.values)
 
     metadata["disolve"] = {
         "members": list(group.id.values.astype(int)),
         "group": {"key": key,
                   "value": label_str}
     }
-    
-    labels = labels.to_dict()
 
     row = {
         "geometry": 'POLYGON ((0 0, 0 10000000000000000, 10000000000000000 10000000000000000, 10000000000000000 0, 0 0))',
@@ -90,50 +98,125 @@ def disolve_file_annotations(group, key, join_meta_func=None):
     }
 
     return pd.DataFrame([row])
-    
 
-def disolve_annotations(group, key, radius, join_meta_func=None, keep_radius=True):
-    '''Return disolved annotations within group'''
+def _group_bounds(group, wkts):
+    '''Return annotation bounds as an array of shape (n, 4)'''
+    columns = ["start_time", "min_freq", "end_time", "max_freq"]
+    if all(column in group.columns for column in columns):
+        return group[columns].values.astype(float)
 
-    recording, label_str, dtype, classtype = group.name
-    ori_geoms = group[["id", "labels", "metadata"]]
-    ori_geoms.loc[:, "geometry"] = group.geometry.apply(lambda x: shapely.wkt.loads(x))
+    return np.array([shapely.wkt.loads(wkt).bounds for wkt in wkts],
+                    dtype=float).reshape([-1, 4])
 
-    if radius is not None:
-        ref_geometries = [buffer_geometry_clip(x, radius) for x in ori_geoms.geometry.values]
+def _disolve_components(bounds, radius, geometry):
+    '''Return component of each annotation after merging buffered shapes.
+
+    Boxes are connected when their buffered shapes intersect, which is
+    decided from the gaps between their bounds. Candidate pairs come from
+    a sweep over buffered time bounds. Other shapes are compared with
+    their buffered geometries, obtained with the 'geometry' function.
+    '''
+    if radius is None:
+        time_radius, freq_radius = 0, 0
+    else:
+        time_radius, freq_radius = radius[0], max(1e-10, radius[1])
+
+    index = AnnotationIndex(bounds[:, 0] - time_radius,
+                            bounds[:, 2] + time_radius,
+                            bounds[:, 1] - freq_radius,
+                            bounds[:, 3] + freq_radius)
+    pairs = index.overlapping_pairs()
+    first, second = pairs[:, 0], pairs[:, 1]
+
+    if geometry is None:
+        time_gap = np.maximum(0, np.maximum(bounds[second, 0] - bounds[first, 2],
+                                            bounds[first, 0] - bounds[second, 2]))
+        freq_gap = np.maximum(0, np.maximum(bounds[second, 1] - bounds[first, 3],
+                                            bounds[first, 1] - bounds[second, 3]))
+        if radius is None:
+            connected = (time_gap == 0) & (freq_gap == 0)
+        else:
+            # Buffers have elliptic corners with radii twice the buffer
+            connected = ((time_gap / (2 * time_radius))**2 +
+                         (freq_gap / (2 * freq_radius))**2) <= 1
     else:
-        ref_geometries = [x for x in ori_geoms.geometry.values]
+        connected = np.array([geometry(i).intersects(geometry(j))
+                              for i, j in pairs], dtype=bool)
+
+    size = bounds.shape[0]
+    graph = coo_matrix((np.ones(connected.sum()),
+                        (first[connected], second[connected])),
+                       shape=(size, size))
+    _, components = connected_components(graph, directed=False)
+    return components
+
+def disolve_annotations(group, key, radius, join_meta_func=None, keep_radius=True):
+    '''Return disolved annotations within group
+
+    Annotations are merged when their buffered shapes intersect. Boxes and
+    intervals are merged from their bounds and only merged groups are
+    unioned as geometries. Polygons and linestrings are compared with
+    their buffered geometries.
+    '''
+
+    recording, label_str, dtype, classtype = group.name
+    wkts = group.geometry.values
+    ids = group.id.values
+    labels_values = group.labels.values
+    metadata_values = group.metadata.values
+    bounds = _group_bounds(group, wkts)
+
+    original_cache = {}
+    def original(position):
+        if position not in original_cache:
+            if dtype in NON_BOX_ANNOTATIONS:
+                geometry = shapely.wkt.loads(wkts[position])
+            else:
+                geometry = box(*bounds[position])
+            if not isinstance(geometry, Polygon):
+                raise NotImplementedError(f"Geometry type not supported. Only polygons can be disolved for now.")
+            original_cache[position] = geometry
+        return original_cache[position]
+
+    buffered_cache = {}
+    def buffered(position):
+        if radius is None:
+            return original(position)
+        if position not in buffered_cache:
+            if dtype not in NON_BOX_ANNOTATIONS and radius[1] <= 0:
+                # Without frequency radius buffered boxes are boxes up to
+                # negligible rounded corners
+                start_time, min_freq, end_time, max_freq = bounds[position]
+                buffered_cache[position] = box(max(0, start_time - radius[0]),
+                                               max(0, min_freq - 1e-10),
+                                               end_time + radius[0],
+                                               min(1e16, max_freq + 1e-10))
+            else:
+                buffered_cache[position] = buffer_geometry_clip(original(position), radius)
+        return buffered_cache[position]
 
-    ref_geometries = unary_union(ref_geometries)
+    components = _disolve_components(
+        bounds,
+        radius,
+        buffered if dtype in NON_BOX_ANNOTATIONS else None)
 
     if classtype == "TimedAnnotation":
         min_abs_start_time = group.abs_start_time.min()
         min_start_time = group.start_time.min()
 
-    rows = []
-    geoms = ref_geometries
-    if isinstance(geoms, Polygon):
-        geoms = [geoms]
-    else:
-        geoms = geoms.geoms
+    order = np.lexsort((np.arange(components.shape[0]), components))
+    splits = np.nonzero(np.diff(components[order]))[0] + 1
+    members_list = sorted(np.split(order, splits),
+                          key=lambda members: bounds[members, 0].min())
 
-    for geom in geoms:
+    rows = []
+    for members in members_list:
         row = {}
-        bgeom = geom.buffer(1e-10)
-        members = ori_geoms[ori_geoms.geometry.apply(lambda x: x.within(bgeom))]
-        member_ids = list(members.id.values.astype(int))
-        labels = None
-        for n, lab in members.labels.items():
-            llab = Labels.from_dict(lab)
-            if labels is None:
-                labels = llab
-                continue
-            for l in llab:
-                if l.key not in labels:
-                    labels.add(l)
+        member_ids = list(ids[members].astype(int))
+        labels = merge_labels(labels_values[members])
 
         if join_meta_func is not None:
-            metadata = join_meta_func(members.metadata.values)
+            metadata = join_meta_func(metadata_values[members])
         else:
             metadata = {}
 
@@ -145,17 +228,23 @@ def disolve_annotations(group, key, radius, join_meta_func=None, keep_radius=Tru
                       "keep_radius": keep_radius}
         }
 
+        if len(members) == 1:
+            geom = buffered(members[0])
+        else:
+            geom = unary_union([buffered(position) for position in members])
+
         if not keep_radius and radius is not None:
-            if len(member_ids) == 1:
-                geometry = members.iloc[0].geometry
+            if len(members) == 1:
+                geometry = original(members[0])
             else:
-                geometry = geom.intersection(box(*unary_union(members.geometry.values).bounds, ccw=True))
+                start_time, min_freq = bounds[members, :2].min(axis=0)
+                end_time, max_freq = bounds[members, 2:].max(axis=0)
+                geometry = geom.intersection(box(start_time, min_freq, end_time, max_freq, ccw=True))
         else:
             geometry = geom
 
         start_time, min_freq, end_time, max_freq = geometry.bounds
 
-        labels = labels.to_dict()
         row["geometry"] = geometry.wkt
         row["start_time"] = start_time
         row["end_time"] = end_time
@@ -168,7 +257,6 @@ def disolve_annotations(group, key, radius, join_meta_func=None, keep_radius=Tru
 
         row["labels"] = labels
         row["metadata"] = metadata
-        row["labels"] = labels
         rows.append(row)
 
     return pd.DataFrame(rows)
@@ -292,6 +380,68 @@ class AnnotationAccessor:
             labels_column=labels_column,
             id_column=id_column)
 
+    def index(self):
+        """Return time and frequency index over annotation rows.
+
+        Queries on the index return row positions.
+        """
+        return AnnotationIndex.from_dataframe(self._obj,
+                                              geometry_column=self.geometry_column,
+                                              type_column=self.type_column)
+
+    def query(self, window):
+        """Return rows that intersect window."""
+        return self._obj.iloc[self.index().query_positions(window)]
+
+    def overlapping_pairs(self, other=None, by="recording"):
+        """Return pairs of overlapping annotations within each group.
+
+        Parameters
+        ----------
+        other : pandas.DataFrame, optional
+            Annotations to pair against, for example ground truth against
+            detections. If not given, pairs of distinct rows of this
+            dataframe are returned once.
+        by : str, optional
+            Column that defines groups, such as recordings. Only rows with
+            the same value are compared. If None all rows are compared.
+
+        Returns
+        -------
+        pairs : pandas.DataFrame
+            Dataframe with index labels of both rows of each pair in
+            columns 'left' and 'right'.
+        """
+        left_df = self._obj
+        right_df = left_df if other is None else other
+
+        if by is None:
+            groups = [(left_df, right_df)]
+        else:
+            right_groups = dict(list(right_df.groupby(by, sort=False)))
+            groups = [
+                (group, right_groups[name])
+                for name, group in left_df.groupby(by, sort=False)
+                if name in right_groups]
+
+        lefts = []
+        rights = []
+        for left_group, right_group in groups:
+            left_index = left_group.annotation.index()
+            if other is None:
+                pairs = left_index.overlapping_pairs()
+            else:
+                pairs = left_index.overlapping_pairs(right_group.annotation.index())
+            lefts.append(left_group.index.values[pairs[:, 0]])
+            rights.append(right_group.index.values[pairs[:, 1]])
+
+        if len(lefts) == 0:
+            return pd.DataFrame({"left": left_df.index.values[:0],
+                                 "right": right_df.index.values[:0]})
+
+        return pd.DataFrame({"left": np.concatenate(lefts),
+                             "right": np.concatenate(rights)})
+
     def disolve(self, key, radius=(1.5, 0), join_meta_func=None, keep_radius=True, whole_file=False):
         '''Merge annotations by geometry and key'''
        
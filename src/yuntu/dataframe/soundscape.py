@@ -10,6 +10,7 @@ from dask.diagnostics import ProgressBar
 from yuntu.soundscape.utils import absolute_timing, aware_time
 from yuntu.soundscape.hashers.base import Hasher
 from yuntu.soundscape.hashers.crono import CronoHasher, DEFAULT_HASHER_CONFIG
+from yuntu.soundscape.fingerprints import FingerprintIndex, DEFAULT_FINGERPRINT_NAME
 from yuntu.soundscape.pipelines.build_soundscape import HashSoundscape, AbsoluteTimeSoundscape
 
 ID = 'id'
@@ -140,6 +141,13 @@ class SoundscapeAccessor:
             return df
         return pipeline["hashed_soundscape"].future(client=client, feed={"npartitions": npartitions})
 
+    def fingerprint_index(self, name=DEFAULT_FINGERPRINT_NAME, key_column=None, **kwargs):
+        """Build an approximate nearest neighbour index over fingerprints."""
+        return FingerprintIndex.from_dataframe(self._obj,
+                                               name=name,
+                                               key_column=key_column,
+                                               **kwargs)
+
     def add_hash(self, hasher, out_name="xhash"):
         """Add row hasher"""
         print("Hashing dataframe...")
@@ -1,18 +1,27 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pony.orm import db_session
 from yuntu.datastore.base import Datastore
-from yuntu.core.audio.utils import media_copy
+from yuntu.core.audio.utils import media_link, media_size
 from yuntu.core.database.timed import TimedDatabaseManager
 from yuntu.core.database.spatial import SpatialDatabaseManager
 from yuntu.core.database.spatiotemporal import SpatioTemporalDatabaseManager
 
 class CopyDatastore(Datastore):
     """A datastore that copies all files to a target_directory and inserts
-    metadata into a new collection"""
+    metadata into a new collection
+
+    Recordings are processed in batches of 'batch_size'. Files of each batch
+    are copied by a pool of 'workers' threads while metadata of the whole
+    batch is inserted in a single transaction. With 'link' set to
+    'hardlink', 'reflink' or 'auto', local files are linked instead of
+    copied when source and target share a filesystem. Copied files are
+    verified by size when 'verify' is True."""
 
     def __init__(self, *args, collection, query=None, limit=None, offset=0,
                  target_path=None, keep_metadata=True, absolute_path=False,
-                 keep_id=True, tqdm=None, **kwargs):
+                 keep_id=True, tqdm=None, workers=1, link="copy",
+                 batch_size=500, verify=True, **kwargs):
         self.limit = limit
         self.offset = offset
         self.query = query
@@ -23,6 +32,10 @@ class CopyDatastore(Datastore):
         self.keep_metadata = keep_metadata
         self.keep_id = keep_id
         self.tqdm = tqdm
+        self.workers = workers
+        self.link = link
+        self.batch_size = batch_size
+        self.verify = verify
 
         if self.offset is not None:
             if self.limit is None:
@@ -77,28 +90,73 @@ class CopyDatastore(Datastore):
             for recording in self.collection.recordings(query=self.query)[self.query_slice]:
                 yield recording
 
+    def iter_batches(self):
+        batch = []
+        for datum in self.iter():
+            batch.append(datum)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+
+        if len(batch) > 0:
+            yield batch
+
     def iter_annotations(self, datum):
         recid = datum.id
         query = eval(f'lambda annotation: annotation.recording.id == {recid}')
         for annotation in self.collection.annotations(query=query):
             yield annotation
 
-    def copy_data(self, datum):
-        source_path = self.collection.get_abspath(datum.path)
-        recid = datum.id
+    def batch_annotations(self, batch):
+        """Return annotations of all recordings in batch by recording id."""
+        recids = [datum.id for datum in batch]
+        query = eval(f'lambda annotation: annotation.recording.id in {recids}')
+
+        annotations = {recid: [] for recid in recids}
+        for annotation in self.collection.annotations(query=query):
+            annotations[annotation.recording.id].append(annotation)
+        return annotations
+
+    def copy_file(self, recid, source_path, filesize=None):
         target_path = os.path.join(self.media_path, f"{recid}_copy.wav")
-        media_copy(source_path, target_path)
+        method = media_link(source_path, target_path, method=self.link)
+
+        if self.verify and method == "copy":
+            if filesize is None:
+                filesize = media_size(source_path)
+            target_size = media_size(target_path)
+            if None not in (filesize, target_size) and filesize != target_size:
+                message = (f"Copy of {source_path} has {target_size} bytes, "
+                           f"expected {filesize}.")
+                raise ValueError(message)
 
         if not self.absolute_path:
             return os.path.join("media", f"{recid}_copy.wav")
 
         return os.path.abspath(target_path)
 
-    def prepare_datum(self, datum):
+    def copy_data(self, datum):
+        source_path = self.collection.get_abspath(datum.path)
+        filesize = dict(datum.media_info).get("filesize")
+        return self.copy_file(datum.id, source_path, filesize)
+
+    def copy_batch(self, batch, executor=None):
+        """Copy files of a batch of recordings and return target paths."""
+        jobs = [(datum.id,
+                 self.collection.get_abspath(datum.path),
+                 dict(datum.media_info).get("filesize"))
+                for datum in batch]
+
+        if executor is None:
+            return [self.copy_file(*job) for job in jobs]
+
+        return list(executor.map(lambda job: self.copy_file(*job), jobs))
+
+    def prepare_datum(self, datum, path=None):
         meta = datum.to_dict()
-        if self.target_path is not None:
+        if path is None and self.target_path is not None:
             path = self.copy_data(datum)
-        else:
+        elif path is None:
             path = meta["path"]
 
         meta["path"] = path
@@ -129,22 +187,43 @@ class CopyDatastore(Datastore):
 
         recording_inserts = 0
         annotation_inserts = 0
-        for datum in self.iter():
-            meta = self.prepare_datum(datum)
-            meta['datastore'] = datastore_id
-
-            annotations = []
-            for annotation in self.iter_annotations(datum):
-                annotation_meta = self.prepare_annotation(datum, annotation)
-                annotations.append(annotation_meta)
-
-            with db_session:
-                recording = collection.insert(meta)[0]
-                for ann in annotations:
-                    ann["recording"] = recording
-                    collection.annotate([ann])
-                    annotation_inserts += 1
-
-            recording_inserts += 1
+
+        executor = None
+        if self.target_path is not None and self.workers > 1:
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        try:
+            for batch in self.iter_batches():
+                if self.target_path is not None:
+                    paths = self.copy_batch(batch, executor=executor)
+                else:
+                    paths = [None for _ in batch]
+
+                annotations = self.batch_annotations(batch)
+
+                metas = []
+                batch_annotations = []
+                for datum, path in zip(batch, paths):
+                    meta = self.prepare_datum(datum, path=path)
+                    meta['datastore'] = datastore_id
+                    metas.append(meta)
+                    batch_annotations.append([
+                        self.prepare_annotation(datum, annotation)
+                        for annotation in annotations[datum.id]])
+
+                with db_session:
+                    recordings = collection.insert(metas)
+                    annotation_metas = []
+                    for recording, anns in zip(recordings, batch_annotations):
+                        for ann in anns:
+                            ann["recording"] = recording
+                            annotation_metas.append(ann)
+                    collection.annotate(annotation_metas)
+
+                recording_inserts += len(recordings)
+                annotation_inserts += len(annotation_metas)
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         return datastore_id, recording_inserts, annotation_inserts
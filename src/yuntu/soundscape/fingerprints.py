@@ -0,0 +1,201 @@
+"""Approximate nearest neighbour search over soundscape fingerprints.
+
+Wavelet fingerprints are stored in soundscape dataframes as one float column
+per component, named '<index name>_<component>'. A FingerprintIndex hashes
+those vectors with random hyperplane projections (cosine LSH) into several
+tables and answers similarity queries by reranking only the vectors that
+share a bucket with the query.
+"""
+import re
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+DEFAULT_FINGERPRINT_NAME = "WAVELET_FINGERPRINT"
+
+
+def fingerprint_columns(columns, name=DEFAULT_FINGERPRINT_NAME):
+    """Return fingerprint component columns ordered by component."""
+    pattern = re.compile(rf"^{re.escape(name)}_(\d+)$")
+    matches = []
+    for col in columns:
+        match = pattern.match(str(col))
+        if match is not None:
+            matches.append((int(match.group(1)), col))
+
+    if len(matches) == 0:
+        message = f"Could not find fingerprint columns for '{name}'."
+        raise ValueError(message)
+
+    return [col for _, col in sorted(matches)]
+
+
+class FingerprintIndex:
+    """Random projection LSH index for fingerprint vectors.
+
+    Vectors are normalized on insertion so that similarity is the cosine
+    between fingerprints. Hashing is done on vectors centered at the mean
+    of the indexed vectors, since fingerprints share a dominant positive
+    component and hyperplanes through the origin would put most of them
+    in the same buckets.
+
+    Parameters
+    ----------
+    vectors : numpy.ndarray
+        Array of shape (n, d) with one fingerprint per row.
+    keys : array-like, optional
+        Identifiers for each row. Defaults to row positions.
+    ntables : int
+        Number of hash tables. More tables increase recall.
+    nbits : int
+        Number of hyperplanes per table. More bits reduce bucket sizes.
+    seed : int
+        Seed for hyperplane generation.
+    """
+
+    def __init__(self, vectors, keys=None, ntables=8, nbits=12, seed=0):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError("Argument 'vectors' must be a 2D array.")
+        if nbits > 62:
+            raise ValueError("Argument 'nbits' must be at most 62.")
+
+        if keys is None:
+            keys = np.arange(vectors.shape[0])
+
+        self.keys = np.asarray(keys)
+        self.vectors = self._normalize(vectors)
+        self.mean = np.zeros(vectors.shape[1], dtype=np.float32)
+        if vectors.shape[0] > 0:
+            self.mean = self.vectors.mean(axis=0)
+        self.ntables = ntables
+        self.nbits = nbits
+        self.seed = seed
+
+        rng = np.random.RandomState(seed)
+        self.planes = rng.normal(size=(ntables, vectors.shape[1], nbits)).astype(np.float32)
+        self._weights = np.left_shift(np.int64(1), np.arange(nbits, dtype=np.int64))
+
+        codes = self._hash(self.vectors)
+        self._orders = np.argsort(codes, axis=1, kind="stable")
+        self._codes = np.take_along_axis(codes, self._orders, axis=1)
+
+    @staticmethod
+    def _normalize(vectors):
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1
+        return vectors / norms
+
+    def _hash(self, vectors):
+        """Return bucket codes of shape (ntables, n)."""
+        bits = np.einsum("nd,tdb->tnb", vectors - self.mean, self.planes) > 0
+        return bits.astype(np.int64) @ self._weights
+
+    def _bucket(self, table, code):
+        start = np.searchsorted(self._codes[table], code, side="left")
+        stop = np.searchsorted(self._codes[table], code, side="right")
+        return self._orders[table, start:stop]
+
+    def _candidates(self, codes, k, multiprobe=True):
+        candidates = [self._bucket(table, code)
+                      for table, code in enumerate(codes)]
+        found = np.unique(np.concatenate(candidates))
+
+        if multiprobe and found.size < k:
+            for table, code in enumerate(codes):
+                for bit in self._weights:
+                    candidates.append(self._bucket(table, code ^ bit))
+            found = np.unique(np.concatenate(candidates))
+
+        return found
+
+    def query(self, vectors, k=10, multiprobe=True):
+        """Return the k most similar indexed fingerprints for each query.
+
+        Parameters
+        ----------
+        vectors : numpy.ndarray
+            A single fingerprint or an array of shape (m, d).
+        k : int
+            Number of neighbours to return per query.
+        multiprobe : bool
+            Whether to probe buckets at hamming distance one when exact
+            buckets hold less than k candidates.
+
+        Returns
+        -------
+        results : pandas.DataFrame
+            Long format dataframe with columns 'query', 'key' and
+            'similarity', sorted by query and decreasing similarity.
+        """
+        vectors = self._normalize(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+        codes = self._hash(vectors)
+
+        queries = []
+        keys = []
+        similarities = []
+        for n in range(vectors.shape[0]):
+            candidates = self._candidates(codes[:, n], k, multiprobe=multiprobe)
+            sims = self.vectors[candidates] @ vectors[n]
+            top = np.argsort(-sims, kind="stable")[:k]
+            queries.append(np.full(top.size, n))
+            keys.append(self.keys[candidates[top]])
+            similarities.append(sims[top])
+
+        return pd.DataFrame({"query": np.concatenate(queries),
+                             "key": np.concatenate(keys),
+                             "similarity": np.concatenate(similarities)})
+
+    def save(self, path):
+        """Save index to a '.npz' file.
+
+        Object keys are stored as fixed width unicode so that the file can
+        be loaded without pickle.
+        """
+        keys = self.keys
+        if keys.dtype.kind == "O":
+            keys = np.asarray(keys.tolist())
+            if keys.dtype.kind == "O":
+                keys = keys.astype(str)
+        np.savez(path,
+                 vectors=self.vectors,
+                 keys=keys,
+                 params=np.array([self.ntables, self.nbits, self.seed]))
+
+    @classmethod
+    def load(cls, path):
+        """Load index saved with 'save'."""
+        with np.load(path, allow_pickle=False) as data:
+            ntables, nbits, seed = data["params"].tolist()
+            return cls(data["vectors"], keys=data["keys"],
+                       ntables=ntables, nbits=nbits, seed=seed)
+
+    @classmethod
+    def from_dataframe(cls, dataframe, name=DEFAULT_FINGERPRINT_NAME,
+                       key_column=None, **kwargs):
+        """Build index from fingerprint columns of a soundscape dataframe.
+
+        Rows are identified by 'key_column' if given or by row positions
+        otherwise. The dataframe index is not used since it repeats on
+        exploded soundscapes.
+        """
+        columns = fingerprint_columns(dataframe.columns, name=name)
+        keys = None
+        if key_column is not None:
+            keys = dataframe[key_column].values
+        return cls(dataframe[columns].values, keys=keys, **kwargs)
+
+    @classmethod
+    def from_parquet(cls, path, name=DEFAULT_FINGERPRINT_NAME,
+                     key_column=None, **kwargs):
+        """Build index from a persisted soundscape reading only needed columns."""
+        schema_columns = pq.ParquetDataset(path).schema.names
+        columns = fingerprint_columns(schema_columns, name=name)
+        if key_column is not None:
+            columns = [key_column] + columns
+        dataframe = pd.read_parquet(path, columns=columns)
+        return cls.from_dataframe(dataframe, name=name,
+                                  key_column=key_column, **kwargs)
+
+    def __len__(self):
+        return self.vectors.shape[0]
@@ -11,6 +11,7 @@ from yuntu.soundscape.processors.indices.direct import CORE
 from yuntu.soundscape.processors.indices.direct import TOTAL
 
 from yuntu.soundscape.transitions.basic import as_dd, add_hash, add_absoute_time
+from yuntu.soundscape.transitions.basic import as_balanced_dd
 from yuntu.soundscape.transitions.index import slice_features
 
 INDICES = [TOTAL(), EXAG(), INFORMATION(), CORE()]
@@ -46,6 +47,7 @@ class Soundscape(Pipeline):
                  feature_config=FEATURE_CONFIG,
                  time_hop=TIME_HOP,
                  frequency_hop=FREQUENCY_HOP,
+                 longest_first=False,
                  **kwargs):
         super().__init__(name, **kwargs)
         if not isinstance(indices, (tuple, list)):
@@ -61,6 +63,7 @@ class Soundscape(Pipeline):
         self.feature_config = feature_config
         self.frequency_hop = frequency_hop
         self.time_hop = time_hop
+        self.longest_first = longest_first
         self.build()
 
     def build(self):
@@ -84,8 +87,12 @@ class Soundscape(Pipeline):
         self['npartitions'] = place(data=10,
                                     name='npartitions',
                                     ptype='scalar')
-        self['recordings_dd'] = as_dd(self['recordings'],
-                                      self['npartitions'])
+        self['longest_first'] = place(data=self.longest_first,
+                                      name='longest_first',
+                                      ptype='dynamic')
+        self['recordings_dd'] = as_balanced_dd(self['recordings'],
+                                               self['npartitions'],
+                                               self['longest_first'])
         self['soundscape'] = slice_features(self['recordings_dd'],
                                             self['slice_config'],
                                             self['indices'])
@@ -11,6 +11,7 @@ class ProbeDataframe(Pipeline):
                  recordings,
                  probe_config,
                  time_col=None,
+                 longest_first=False,
                  **kwargs):
 
         if not isinstance(probe_config, dict):
@@ -21,6 +22,7 @@ class ProbeDataframe(Pipeline):
         self.recordings = recordings
         self.probe_config = probe_config
         self.time_col=time_col
+        self.longest_first = longest_first
         self.build()
 
     def build(self):
@@ -34,8 +36,12 @@ class ProbeDataframe(Pipeline):
                                  name='time_col',
                                  ptype='scalar')
         self["probe_config"] = place(self.probe_config, 'dict', 'probe_config')
+        self['longest_first'] = place(data=self.longest_first,
+                                      name='longest_first',
+                                      ptype='dynamic')
         self['recordings_bag'] = bag_dataframe(self['recordings'],
-                                               self['npartitions'])
+                                               self['npartitions'],
+                                               self['longest_first'])
         self['id_type'] = place(data=self.recordings.dtypes.id.str,
                                 name='id_type',
                                 ptype='scalar')
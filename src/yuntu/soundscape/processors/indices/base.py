@@ -1,6 +1,7 @@
 """Acoustic indices."""
 from abc import ABC
 from abc import abstractmethod
+import numpy as np
 
 class AcousticIndex(ABC):
     """Base class for acoustic indices."""
@@ -19,3 +20,12 @@ class AcousticIndex(ABC):
     @abstractmethod
     def run(self, array):
         """Run transformations and return index."""
+
+    def run_batch(self, arrays):
+        """Run index on a sequence of arrays.
+
+        Returns an array whose first axis corresponds to input arrays.
+        Indices that can be vectorized over several inputs should
+        override this method.
+        """
+        return np.array([self.run(array) for array in arrays])
@@ -2,7 +2,6 @@ import numpy as np
 import pywt
 from skimage.transform import resize
 from scipy.ndimage import gaussian_filter
-from scipy import stats
 from yuntu.soundscape.processors.indices.base import AcousticIndex
 
 
@@ -12,6 +11,13 @@ def antialiased_resize(im, new_size):
     im = resize(im, new_size)
     return im
 
+def batch_antialiased_resize(ims, new_size):
+    """Resize a stack of images along its last two axes."""
+    r = float(new_size[0]) / ims.shape[1]
+    ims = gaussian_filter(ims, [0, 0.25/r, 0.25/r])
+    ims = resize(ims, [ims.shape[0]] + list(new_size))
+    return ims
+
 def pack_wavelet_coeffs(w, level=4):
     pw = np.zeros(2**((level-1)*2), dtype=np.float32)
 
@@ -24,19 +30,74 @@ def pack_wavelet_coeffs(w, level=4):
             ni += len(np.ravel(w[i][j]))
     return pw
 
+def batch_pack_wavelet_coeffs(w, level=4):
+    """Pack coefficients of a batched decomposition, one row per image."""
+    ncomponents = 2**((level-1)*2)
+    nims = w[0].shape[0]
+    coeffs = [w[0].reshape(nims, -1)]
+    for i in range(1, level):
+        coeffs += [w[i][j].reshape(nims, -1) for j in range(0, 3)]
+    coeffs = np.concatenate(coeffs, axis=1)
+
+    if coeffs.shape[1] > ncomponents:
+        raise ValueError("Decomposition has more coefficients than "
+                         "the packed fingerprint can hold.")
+
+    pw = np.zeros([nims, ncomponents], dtype=np.float32)
+    pw[:, :coeffs.shape[1]] = coeffs
+    return pw
+
+def sparsify_coefficients(pw, ncoeffs):
+    """Keep the 'ncoeffs' largest coefficients in magnitude per row."""
+    if ncoeffs >= pw.shape[-1]:
+        return pw
+    drop = np.argpartition(np.abs(pw), -ncoeffs, axis=-1)[..., :-ncoeffs]
+    pw = pw.copy()
+    np.put_along_axis(pw, drop, 0, axis=-1)
+    return pw
+
 def get_sparse_haar_coefficients(im, ncoeffs = 40, level=4):
     w = pywt.wavedec2(im, 'Haar')
     pw = pack_wavelet_coeffs(w, level=level)
+    pw = sparsify_coefficients(pw, ncoeffs)
     pw = pw / np.sqrt(np.sum(pw**2))
 
     return pw
 
+def batch_sparse_haar_coefficients(ims, ncoeffs=40, level=4):
+    """Return sparse normalized Haar coefficients for a stack of images."""
+    w = pywt.wavedec2(ims, 'Haar', axes=(-2, -1))
+    pw = batch_pack_wavelet_coeffs(w, level=level)
+    pw = sparsify_coefficients(pw, ncoeffs)
+    pw = pw / np.sqrt(np.sum(pw**2, axis=1, keepdims=True))
+
+    return pw
+
 def get_fingerprint(array, ncoeffs=40, level=2, latus=128):
-    norm_array = stats.zscore(array)
     im = antialiased_resize(array, [latus, latus])
     fingerprint = get_sparse_haar_coefficients(im, ncoeffs=ncoeffs, level=level)
     return fingerprint
 
+def get_batch_fingerprints(arrays, ncoeffs=40, level=2, latus=128):
+    """Return fingerprints for a sequence of arrays, one row per array.
+
+    Arrays with the same shape are stacked, resized and decomposed
+    together.
+    """
+    fingerprints = np.zeros([len(arrays), 2**((level-1)*2)], dtype=np.float32)
+
+    groups = {}
+    for n, array in enumerate(arrays):
+        groups.setdefault(np.shape(array), []).append(n)
+
+    for positions in groups.values():
+        ims = np.stack([arrays[n] for n in positions])
+        ims = batch_antialiased_resize(ims, [latus, latus])
+        fingerprints[positions] = batch_sparse_haar_coefficients(ims,
+                                                                 ncoeffs=ncoeffs,
+                                                                 level=level)
+    return fingerprints
+
 class WAVELET(AcousticIndex):
     name = 'WAVELET_FINGERPRINT'
 
@@ -47,5 +108,14 @@ class WAVELET(AcousticIndex):
         self.ncomponents = 2**((level-1)*2)
         super().__init__(*args,**kwargs)
 
-    def run(self, array, **kwargs):
-        return get_fingerprint(array, **kwargs)
+    def run(self, array):
+        return get_fingerprint(array,
+                               ncoeffs=self.ncoeffs,
+                               level=self.level,
+                               latus=self.latus)
+
+    def run_batch(self, arrays):
+        return get_batch_fingerprints(arrays,
+                                      ncoeffs=self.ncoeffs,
+                                      level=self.level,
+                                      latus=self.latus)
@@ -1,13 +1,21 @@
 """Miscelaneous template based probes."""
 import numpy as np
+from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from skimage.feature import peak_local_max, match_template
+from shapely.geometry import box as shapely_box
 from shapely.ops import unary_union
 
-from yuntu.core.geometry import BBox, Polygon, FrequencyInterval
+from yuntu.core.geometry import Polygon, FrequencyInterval
 from yuntu.core.annotation.annotation import Annotation
 from yuntu.core.audio.features.spectrogram import Spectrogram
 from yuntu.soundscape.processors.probes.base import TemplateProbe
 
+# Cells of the label image built at a time when scoring merged regions
+MERGE_BLOCK_CELLS = 2 ** 22
+
+
 class CrossCorrelationProbe(TemplateProbe):
     """A probe that uses cross correaltion to match inputs with templates."""
     name = "Correlation probe"
@@ -48,18 +56,6 @@ class CrossCorrelationProbe(TemplateProbe):
 
         self._extend_interval_with(mold)
 
-    def _build_output(self, corr, target, geom):
-        corr_values = corr[target.to_mask(geometry=geom).array]
-        if corr_values.size > 0:
-            return {
-                "geometry": geom,
-                "labels": [{"key": "tag", "value": self.tag, "type": "crosscorr_tag"}],
-                "score": {
-                    "peak_corr": np.amax(corr_values)
-                }
-            }
-        return None
-
     def _extend_interval_with(self, mold):
         freqs = mold.frequencies
         if self._frequency_interval is None:
@@ -107,42 +103,141 @@ class CrossCorrelationProbe(TemplateProbe):
                                    min_distance=peak_distance,
                                    threshold_abs=thresh)
 
-        boxes = []
-        for x, y in all_peaks:
-            xind1 = max(0, x - int(round(min_distancex/2)))
-            xind2 = min(xind1 + min_distancex, corr.shape[0])-1
-            if xind2 - xind1 > 1:
-                min_freq = target.frequencies[xind1]
-                max_freq = target.frequencies[xind2]
-                yind1 = max(0, y - int(round(min_distancey/2)))
-                yind2 = min(yind1 + min_distancey, corr.shape[1]-1)
-                if yind2 - yind1 > 1:
-                    start_time = target.times[yind1]
-                    end_time = target.times[yind2]
-                    new_box = BBox(start_time, end_time,
-                                   min_freq, max_freq)
-                    boxes.append(new_box)
-
-        boxes = unary_union([b.geometry for b in boxes])
-        if boxes.geom_type == 'MultiPolygon':
-            boxes = [Polygon(geometry=geom) for geom in boxes]
-        else:
-            boxes = [Polygon(geometry=boxes)]
+        if all_peaks.shape[0] == 0:
+            return []
+
+        boxes = self._peak_boxes(all_peaks, corr.shape,
+                                 min_distancex, min_distancey)
+        if boxes.shape[0] == 0:
+            return []
+
+        labels, scores = self._merge_boxes(corr, boxes)
+
+        order = np.argsort(labels, kind='stable')
+        groups = np.split(boxes[order],
+                          np.cumsum(np.bincount(labels))[:-1])
 
         output = []
-        for box in boxes:
-            if box.geometry.geom_type == 'MultiPolygon':
-                for poly in box.geometry:
-                    new_box = Polygon(geometry=poly)
-                    result = self._build_output(corr, target, new_box)
-                    if result is not None:
-                        output.append(result)
-            else:
-                result = self._build_output(corr, target, box)
-                if result is not None:
-                    output.append(result)
+        for members, score in zip(groups, scores):
+            geom = unary_union([shapely_box(target.times[yind1],
+                                            target.frequencies[xind1],
+                                            target.times[yind2],
+                                            target.frequencies[xind2])
+                                for xind1, xind2, yind1, yind2 in members])
+            parts = geom.geoms if geom.geom_type == 'MultiPolygon' else [geom]
+            for part in parts:
+                output.append({
+                    "geometry": Polygon(geometry=part),
+                    "labels": [{"key": "tag",
+                                "value": self.tag,
+                                "type": "crosscorr_tag"}],
+                    "score": {
+                        "peak_corr": score
+                    }
+                })
         return output
 
+    @staticmethod
+    def _peak_boxes(peaks, shape, min_distancex, min_distancey):
+        """Return index limits of boxes centered at peaks.
+
+        Boxes are returned as an array of rows
+        (xind1, xind2, yind1, yind2) with inclusive limits. Boxes that
+        are too thin along any axis are dropped.
+        """
+        xind1 = np.maximum(0, peaks[:, 0] - int(round(min_distancex/2)))
+        xind2 = np.minimum(xind1 + min_distancex, shape[0]) - 1
+        yind1 = np.maximum(0, peaks[:, 1] - int(round(min_distancey/2)))
+        yind2 = np.minimum(yind1 + min_distancey, shape[1] - 1)
+        boxes = np.stack([xind1, xind2, yind1, yind2], axis=1)
+        keep = ((xind2 - xind1) > 1) & ((yind2 - yind1) > 1)
+        return boxes[keep]
+
+    @staticmethod
+    def _merge_boxes(corr, boxes):
+        """Merge overlapping boxes and compute peak correlation per group.
+
+        Boxes are sorted by their first index along one axis and pairs of
+        boxes with overlapping intervals along that axis are found with a
+        sweep. Pairs whose intervals also overlap along the other axis are
+        joined if they share more than a corner, as in the union of their
+        geometries. Connected components of the joined pairs are the merged
+        regions, so regions that only touch at a corner are scored apart.
+
+        Returns
+        -------
+        labels : numpy.ndarray
+            Merged region index for each box.
+        scores : numpy.ndarray
+            Maximum correlation within each merged region.
+        """
+        nboxes = boxes.shape[0]
+        xind1, xind2, yind1, yind2 = boxes.T
+
+        # Sweep along the axis with the least overlapping intervals
+        sweeps = []
+        for starts, ends in [(xind1, xind2), (yind1, yind2)]:
+            order = np.argsort(starts, kind='stable')
+            upper = np.searchsorted(starts[order], ends[order], side='right')
+            counts = np.maximum(upper - np.arange(nboxes) - 1, 0)
+            sweeps.append((counts.sum(), order, counts))
+        _, order, counts = min(sweeps, key=lambda sweep: sweep[0])
+
+        lower = np.arange(nboxes)
+        offsets = (np.arange(counts.sum()) -
+                   np.repeat(np.cumsum(counts) - counts, counts))
+        first = order[np.repeat(lower, counts)]
+        second = order[np.repeat(lower + 1, counts) + offsets]
+
+        xoverlap = (np.minimum(xind2[first], xind2[second]) -
+                    np.maximum(xind1[first], xind1[second]))
+        yoverlap = (np.minimum(yind2[first], yind2[second]) -
+                    np.maximum(yind1[first], yind1[second]))
+        joined = ((xoverlap >= 0) & (yoverlap >= 0) &
+                  ((xoverlap > 0) | (yoverlap > 0)))
+
+        graph = coo_matrix((np.ones(joined.sum()),
+                            (first[joined], second[joined])),
+                           shape=(nboxes, nboxes))
+        nregions, labels = connected_components(graph, directed=False)
+
+        # Regions are painted into a label image and reduced with a labeled
+        # maximum. The image is built in strips of rows so that memory stays
+        # bounded for long recordings. Distinct regions can only share
+        # corner cells, which are added to both regions below.
+        ymin, ymax = yind1.min(), yind2.max()
+        width = ymax - ymin + 1
+        nrows = max(1, MERGE_BLOCK_CELLS // width)
+        dtype = np.min_scalar_type(nregions)
+        scores = np.full(nregions, -np.inf)
+        for row in range(xind1.min(), xind2.max() + 1, nrows):
+            stop = row + nrows
+            inside = np.nonzero((xind1 < stop) & (xind2 >= row))[0]
+            if inside.size == 0:
+                continue
+
+            label_image = np.zeros((nrows, width), dtype=dtype)
+            for position in inside:
+                x1, x2, y1, y2 = boxes[position]
+                label_image[max(x1 - row, 0):x2 - row + 1,
+                            y1 - ymin:y2 - ymin + 1] = labels[position] + 1
+
+            window = corr[row:stop, ymin:ymax + 1]
+            label_image = label_image[:window.shape[0]]
+            painted = label_image > 0
+            index = np.unique(labels[inside]) + 1
+            maxima = ndimage.maximum(window[painted], label_image[painted],
+                                     index=index)
+            np.maximum.at(scores, index - 1, maxima)
+
+        corner = (xoverlap == 0) & (yoverlap == 0)
+        corner_x = np.maximum(xind1[first[corner]], xind1[second[corner]])
+        corner_y = np.maximum(yind1[first[corner]], yind1[second[corner]])
+        corner_values = corr[corner_x, corner_y]
+        np.maximum.at(scores, labels[first[corner]], corner_values)
+        np.maximum.at(scores, labels[second[corner]], corner_values)
+        return labels, scores
+
     def corr(self, target, method='mean'):
         corr = self.compare(target)
         if len(self.template) > 0:
@@ -0,0 +1,201 @@
+"""Chunked storage for raw probe outputs.
+
+A store is a directory of fixed size chunk files (plain '.npy' arrays that
+can be memory mapped) and index files that map keys to the chunk, offset,
+shape and dtype of each stored array. Every writer owns its chunk and index
+files so that several workers can append to the same store concurrently
+without any locking. Entries carry their write time so that, when a key is
+written more than once, the newest entry wins regardless of which index
+file holds it.
+"""
+import os
+import glob
+import json
+import time
+import uuid
+import numpy as np
+
+CHUNK_PREFIX = "chunk"
+INDEX_PREFIX = "index"
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _atomic_save(path, array):
+    """Save array to path without exposing partially written files."""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "wb") as tmp_file:
+        np.save(tmp_file, array)
+    os.replace(tmp_path, path)
+
+
+def _atomic_dump(path, obj):
+    """Dump json to path without exposing partially written files."""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w") as tmp_file:
+        json.dump(obj, tmp_file)
+    os.replace(tmp_path, path)
+
+
+class ChunkWriter:
+    """Append arrays to a chunked store.
+
+    Arrays are flattened and buffered in memory until the buffer reaches
+    'chunk_size' bytes or an array of a different dtype is appended, then
+    the buffer is written as a single chunk file and the writer's index
+    is updated.
+
+    Parameters
+    ----------
+    store_dir : str
+        Store directory. It is created if it does not exist.
+    chunk_size : int
+        Approximate chunk size in bytes.
+    """
+
+    def __init__(self, store_dir, chunk_size=DEFAULT_CHUNK_SIZE):
+        if not os.path.exists(store_dir):
+            os.makedirs(store_dir, exist_ok=True)
+
+        self.store_dir = store_dir
+        self.chunk_size = chunk_size
+        self.writer_id = uuid.uuid4().hex
+        self.index = {}
+        self._nchunks = 0
+        self._buffer = []
+        self._buffer_size = 0
+        self._buffer_dtype = None
+
+    @property
+    def chunk_name(self):
+        """Return file name of the chunk being buffered."""
+        return f"{CHUNK_PREFIX}-{self.writer_id}-{self._nchunks:05d}.npy"
+
+    @property
+    def index_path(self):
+        """Return path of this writer's index file."""
+        return os.path.join(self.store_dir,
+                            f"{INDEX_PREFIX}-{self.writer_id}.json")
+
+    def append(self, key, array):
+        """Append array to store under key and return its index entry."""
+        array = np.asarray(array)
+
+        if self._buffer_dtype is not None and array.dtype != self._buffer_dtype:
+            self.flush()
+
+        entry = {
+            "chunk": self.chunk_name,
+            "offset": self._buffer_size,
+            "shape": list(array.shape),
+            "dtype": array.dtype.str,
+            "written": time.time_ns()
+        }
+        self.index[str(key)] = entry
+
+        self._buffer.append(array.ravel())
+        self._buffer_size += array.size
+        self._buffer_dtype = array.dtype
+
+        if self._buffer_size * array.dtype.itemsize >= self.chunk_size:
+            self.flush()
+
+        return entry
+
+    def flush(self):
+        """Write buffered arrays as a new chunk and update index."""
+        if len(self._buffer) == 0:
+            return
+
+        chunk_path = os.path.join(self.store_dir, self.chunk_name)
+        _atomic_save(chunk_path, np.concatenate(self._buffer))
+        _atomic_dump(self.index_path, self.index)
+
+        self._nchunks += 1
+        self._buffer = []
+        self._buffer_size = 0
+        self._buffer_dtype = None
+
+    def close(self):
+        """Flush remaining arrays."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+
+class ChunkStore:
+    """Read arrays from a chunked store.
+
+    Chunks are opened as read only memory maps, so reading an array only
+    touches the pages that hold its data.
+
+    Parameters
+    ----------
+    store_dir : str
+        Store directory.
+    """
+
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+        self._index = None
+        self._chunks = {}
+
+    @property
+    def index(self):
+        """Return merged index of all writers."""
+        if self._index is None:
+            self.refresh()
+        return self._index
+
+    def refresh(self):
+        """Reload index files from store directory.
+
+        When several index files hold the same key, the entry with the
+        latest write time is kept. Entries without write time are treated
+        as the oldest.
+        """
+        self._index = {}
+        pattern = os.path.join(self.store_dir, f"{INDEX_PREFIX}-*.json")
+        for path in sorted(glob.glob(pattern)):
+            with open(path, "r") as index_file:
+                writer_index = json.load(index_file)
+            for key, entry in writer_index.items():
+                current = self._index.get(key)
+                if (current is None or
+                        entry.get("written", 0) >= current.get("written", 0)):
+                    self._index[key] = entry
+
+    def keys(self):
+        """Return stored keys."""
+        return self.index.keys()
+
+    def entry(self, key):
+        """Return index entry for key."""
+        return self.index[str(key)]
+
+    def chunk(self, name):
+        """Return memory mapped chunk by name."""
+        if name not in self._chunks:
+            path = os.path.join(self.store_dir, name)
+            self._chunks[name] = np.load(path, mmap_mode="r")
+        return self._chunks[name]
+
+    def read(self, key):
+        """Return stored array for key as a view of its chunk."""
+        entry = self.entry(key)
+        size = int(np.prod(entry["shape"], dtype=np.int64))
+        data = self.chunk(entry["chunk"])
+        offset = entry["offset"]
+        return data[offset:offset + size].reshape(entry["shape"])
+
+    def __contains__(self, key):
+        return str(key) in self.index
+
+    def __getitem__(self, key):
+        return self.read(key)
+
+    def __len__(self):
+        return len(self.index)
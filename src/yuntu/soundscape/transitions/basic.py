@@ -10,6 +10,7 @@ import requests
 import dask.dataframe as dd
 import dask.bag as db
 from pony.orm import db_session
+from pony.orm import select
 
 from yuntu.utils import module_object
 from yuntu.core.audio.audio import Audio, MEDIA_INFO_FIELDS
@@ -18,10 +19,17 @@ from yuntu.collection.methods import collection
 from yuntu.core.pipeline.places import *
 from yuntu.core.pipeline.transitions.decorators import transition
 from yuntu.soundscape.hashers.base import Hasher
-from yuntu.soundscape.utils import absolute_timing
+from dask import delayed
+from yuntu.soundscape.utils import absolute_timing, balanced_splits
+from yuntu.soundscape.utils import balanced_partitions
 
 
-def get_fragment_size(col_config, query, limit=None, offset=0):
+def get_fragment_keys(col_config, query, limit=None, offset=0):
+    """Return ordered ids and durations of queried recordings.
+
+    Keys are read with a single ordered query that does not load
+    recording entities.
+    """
     col = collection(**col_config)
     if limit is None:
         query_slice = slice(offset, None)
@@ -29,10 +37,16 @@ def get_fragment_size(col_config, query, limit=None, offset=0):
         query_slice = slice(offset, offset + limit)
 
     with db_session:
-        fragment_length = len(col.recordings(query=query).order_by(lambda r: r.id)[query_slice])
+        matches = col.recordings(query=query)
+        rows = select((r.id, r.media_info["duration"])
+                      for r in matches).order_by(1)[query_slice]
+        rows = list(rows)
 
     col.db_manager.db.disconnect()
-    return fragment_length
+
+    ids = np.array([row[0] for row in rows], dtype=np.int64)
+    durations = np.array([row[1] or 0 for row in rows], dtype=np.float64)
+    return ids, durations
 
 def insert_datastore(dstore_config, col_config):
     dstore_class = module_object(dstore_config["module"])
@@ -108,6 +122,21 @@ def as_dd(pd_dataframe, npartitions):
     return dask_dataframe
 
 
+@transition(name='as_balanced_dd', outputs=["recordings_dd"],
+            signature=((PandasDataFramePlace, ScalarPlace, DynamicPlace),
+                       (DaskDataFramePlace,)))
+def as_balanced_dd(pd_dataframe, npartitions, longest_first=False):
+    """Transform recording dataframe to a dask dataframe balanced by cost.
+
+    Partitions hold recordings of similar total duration times samplerate
+    instead of a similar number of rows.
+    """
+    partitions = balanced_partitions(pd_dataframe, npartitions,
+                                     longest_first=longest_first)
+    return dd.from_delayed([delayed(part) for part in partitions],
+                           meta=pd_dataframe.iloc[:0])
+
+
 @transition(name="source_partition", outputs=["datastore_configs"],
             signature=((DynamicPlace, DynamicPlace, ScalarPlace), (DynamicPlace,)))
 def source_partition(datastore_config, rest_auth, npartitions=1):
@@ -134,29 +163,25 @@ def source_partition(datastore_config, rest_auth, npartitions=1):
 @transition(name="get_partitions", outputs=["partitions"],
             signature=((DictPlace, DynamicPlace, ScalarPlace, ScalarPlace, ScalarPlace), (DynamicPlace,)))
 def get_partitions(col_config, query, npartitions=1, limit=None, offset=0):
-    length = get_fragment_size(col_config, query, limit=limit, offset=offset)
-    if length == 0:
+    """Split queried recordings in id ranges of similar total duration.
+
+    Each partition holds the query and a half open recording id range
+    (start, stop) so that workers read their recordings with an indexed
+    range scan.
+    """
+    ids, durations = get_fragment_keys(col_config, query, limit=limit, offset=offset)
+    if ids.size == 0:
         raise ValueError("Collection has no data. Populate collection first.")
 
-    psize = int(np.floor(length / npartitions))
-    psize = min(length, max(psize, 1))
+    starts = balanced_splits(durations, npartitions)
+    stops = np.append(starts[1:], ids.size)
 
     partitions = []
-    offset_length = offset+length
-    for ind in range(offset, offset_length, psize):
-        ioffset = ind
-        ilimit = min(psize, offset_length - ioffset)
-
-        stop = False
-        if offset_length - (ioffset + ilimit) < 30:
-            ilimit = offset_length - ioffset
-            stop = True
-
-        partitions.append({"query": query, "limit": ilimit, "offset": ioffset})
-
-        if stop:
-            break
-
+    for start, stop in zip(starts, stops):
+        stop_id = int(ids[stop]) if stop < ids.size else int(ids[-1]) + 1
+        partitions.append({"query": query,
+                           "id_range": (int(ids[start]), stop_id),
+                           "duration": float(durations[start:stop].sum())})
 
     return db.from_sequence(partitions, npartitions=len(partitions))
 
@@ -201,16 +226,21 @@ def load_datastores(col_config, dstore_configs):
 
 
 @transition(name="bag_dataframe", outputs=["dataframe_bag"], persist=False,
-            signature=((PandasDataFramePlace, ScalarPlace), (DynamicPlace,)))
-def bag_dataframe(dataframe, npartitions):
-    """Transform dataframe to dict bag."""
+            signature=((PandasDataFramePlace, ScalarPlace, DynamicPlace), (DynamicPlace,)))
+def bag_dataframe(dataframe, npartitions, longest_first=False):
+    """Transform recording dataframe to dict bag balanced by cost.
+
+    Each bag partition holds recordings of similar total duration times
+    samplerate.
+    """
     if dataframe.empty:
         raise ValueError("Dataframe has no data.")
     total = dataframe.shape[0]
-    size = int(np.floor(float(total)/float(npartitions)))
-    if size <= 0:
+    if npartitions > total:
         raise ValueError(f"Too many partitions. Max is {total} for this dataframe.")
 
-    dict_dataframe = [dataframe.iloc[i*size : min((i+1)*size, total)].to_dict(orient="records") for i in range(npartitions)]
+    dict_dataframe = [part.to_dict(orient="records")
+                      for part in balanced_partitions(dataframe, npartitions,
+                                                      longest_first=longest_first)]
 
-    return db.from_sequence(dict_dataframe, npartitions=npartitions)
+    return db.from_sequence(dict_dataframe, npartitions=len(dict_dataframe))
@@ -48,7 +48,7 @@ def feature_slices(row, audio, config, indices):
         results = []
         if index.ncomponents > 1:
             base_name = index.name
-            cut_results = np.concatenate([index(fcut) for fcut in feature_cuts], axis=0)
+            cut_results = index.run_batch(feature_cuts)
             for n in range(index.ncomponents):
                 subindex_name = f'{base_name}_{n}'
                 new_row[subindex_name] = cut_results[:,n]
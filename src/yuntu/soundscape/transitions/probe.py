@@ -12,6 +12,7 @@ from yuntu.collection.methods import collection
 from yuntu.core.pipeline.places import *
 from yuntu.core.pipeline import transition
 from yuntu.soundscape.utils import absolute_timing
+from yuntu.soundscape.storage import ChunkWriter, ChunkStore, DEFAULT_CHUNK_SIZE
 
 def write_probe_outputs(partition, probe_config, col_config, write_config, batch_size, overwrite=False):
     """Run probe on partition and write results"""
@@ -20,12 +21,18 @@ def write_probe_outputs(partition, probe_config, col_config, write_config, batch
 
     with db_session:
         dataframe = col.get_recording_dataframe(query=partition["query"],
-                                                offset=partition["offset"],
-                                                limit=partition["limit"],
+                                                offset=partition.get("offset", 0),
+                                                limit=partition.get("limit"),
+                                                id_range=partition.get("id_range"),
                                                 with_annotations=True,
                                                 with_metadata=True)
     col.db_manager.db.disconnect()
 
+    if write_config.get("format", "npy") == "chunked":
+        return write_chunked_probe_outputs(dataframe, probe_config,
+                                           write_config, batch_size,
+                                           overwrite=overwrite)
+
     probe_class = module_object(probe_config["module"])
     probe_kwargs = probe_config["kwargs"]
 
@@ -54,6 +61,42 @@ def write_probe_outputs(partition, probe_config, col_config, write_config, batch
 
     return rows
 
+def write_chunked_probe_outputs(dataframe, probe_config, write_config, batch_size, overwrite=False):
+    """Run probe on recordings and append results to a chunked store"""
+    write_dir = write_config["write_dir"]
+    chunk_size = write_config.get("chunk_size", DEFAULT_CHUNK_SIZE)
+
+    store = ChunkStore(write_dir)
+    probe_class = module_object(probe_config["module"])
+    probe_kwargs = probe_config["kwargs"]
+
+    rows = []
+    count = 0
+    with probe_class(**probe_kwargs) as probe, \
+         ChunkWriter(write_dir, chunk_size=chunk_size) as writer:
+        for rid, path, duration, timeexp in dataframe[["id", "path", "duration", "timeexp"]].values:
+            if rid in store and not overwrite:
+                entry = store.entry(rid)
+            else:
+                with Audio(path=path, timeexp=timeexp) as audio:
+                    raw_output = probe.predict(audio, batch_size)
+                entry = writer.append(rid, raw_output)
+
+            rows.append({
+                "id": rid,
+                "probe_output": os.path.join(write_dir, entry["chunk"]),
+                "offset": entry["offset"],
+                "shape": json.dumps(entry["shape"]),
+                "dtype": entry["dtype"]
+            })
+
+            count += 1
+
+            if count % 10 == 0:
+                gc.collect()
+
+    return rows
+
 def probe_all_timed(recording_rows, probe_config, time_col):
     """Run probe row by row"""
     probe_class = module_object(probe_config["module"])
@@ -170,8 +213,9 @@ def insert_probe_annotations(partition, probe_config, col_config, overwrite=Fals
 
     with db_session:
         dataframe = col.get_recording_dataframe(query=partition["query"],
-                                                offset=partition["offset"],
-                                                limit=partition["limit"],
+                                                offset=partition.get("offset", 0),
+                                                limit=partition.get("limit"),
+                                                id_range=partition.get("id_range"),
                                                 with_annotations=use_annotations,
                                                 with_metadata=use_metadata)
 
@@ -252,6 +296,10 @@ def probe_write(partitions, probe_config, col_config, write_config, batch_size,
                              batch_size=batch_size).flatten()
 
     meta = [('id', np.dtype('int')), ('probe_output', np.dtype('<U'))]
+    if write_config.get("format", "npy") == "chunked":
+        meta = meta + [('offset', np.dtype('int')),
+                       ('shape', np.dtype('<U')),
+                       ('dtype', np.dtype('<U'))]
 
     return results.to_dataframe(meta=meta)
 
@@ -1,5 +1,6 @@
 """Utilities for soundscape operations and indices."""
 import itertools
+import heapq
 import json
 import numpy as np
 from yuntu.core.windows import TimeFrequencyWindow
@@ -168,3 +169,100 @@ def parse_json(row, columns):
         if isinstance(row[col], (str, bytes, bytearray)):
             row[col] = json.loads(row[col])
     return row
+
+def balanced_splits(weights, npartitions):
+    """Return split positions of a sequence into parts of similar weight.
+
+    Parameters
+    ----------
+    weights : array-like
+        Non negative weight of each element, in sequence order.
+    npartitions : int
+        Maximum number of parts.
+
+    Returns
+    -------
+    splits : numpy.ndarray
+        Sorted positions where each part starts, the first one being 0.
+        Empty parts are never produced, so there may be less than
+        'npartitions' splits.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    npartitions = max(1, min(int(npartitions), weights.size))
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+    if total <= 0:
+        cumulative = np.arange(1, weights.size + 1, dtype=np.float64)
+        total = cumulative[-1]
+
+    targets = total * np.arange(1, npartitions) / npartitions
+    splits = np.searchsorted(cumulative, targets, side="right")
+    splits = np.unique(np.concatenate([[0], splits]))
+    return splits[splits < weights.size].astype(np.int64)
+
+
+def recording_costs(dataframe, duration_col="duration",
+                    samplerate_col="samplerate"):
+    """Return estimated processing cost of each recording.
+
+    Cost is proportional to the number of samples, that is duration times
+    samplerate. Missing columns are ignored and each row costs one unit if
+    neither is present.
+    """
+    costs = np.ones(len(dataframe), dtype=np.float64)
+    for col in (duration_col, samplerate_col):
+        if col in dataframe.columns:
+            costs = costs * dataframe[col].fillna(0).to_numpy(dtype=np.float64)
+    return costs
+
+
+def balanced_partitions(dataframe, npartitions, longest_first=False,
+                        duration_col="duration", samplerate_col="samplerate"):
+    """Split recording dataframe in partitions of similar processing cost.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        Recordings with duration and samplerate columns.
+    npartitions : int
+        Maximum number of partitions.
+    longest_first : bool
+        If False, rows keep their order and partitions are contiguous
+        slices. If True, recordings are assigned from the most to the least
+        costly to the partition with the lowest total cost and each
+        partition is sorted by decreasing cost, so that long recordings
+        start early and do not straggle at the end of a computation.
+    duration_col : str
+        Name of the duration column.
+    samplerate_col : str
+        Name of the samplerate column.
+
+    Returns
+    -------
+    partitions : list of pandas.DataFrame
+        Non empty partitions.
+    """
+    costs = recording_costs(dataframe, duration_col=duration_col,
+                            samplerate_col=samplerate_col)
+
+    if not longest_first:
+        splits = np.append(balanced_splits(costs, npartitions), len(dataframe))
+        return [dataframe.iloc[start:stop]
+                for start, stop in zip(splits[:-1], splits[1:])]
+
+    npartitions = max(1, min(int(npartitions), len(dataframe)))
+    order = np.argsort(-costs, kind="stable")
+    loads = [(0.0, part) for part in range(npartitions)]
+    assignments = np.empty(len(dataframe), dtype=np.int64)
+    for position in order:
+        load, part = heapq.heappop(loads)
+        assignments[position] = part
+        heapq.heappush(loads, (load + costs[position], part))
+
+    ordered = assignments[order]
+    return [dataframe.iloc[order[ordered == part]]
+            for part in range(npartitions)
+            if np.any(ordered == part)]
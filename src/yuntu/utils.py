@@ -5,6 +5,7 @@ from importlib import import_module
 import os
 import io
 import tempfile
+import threading
 import subprocess
 from contextlib import contextmanager
 
@@ -14,6 +15,94 @@ from tqdm import tqdm
 
 TMP_DIR = os.path.join(tempfile.gettempdir(), 'yuntu')
 
+S3_CONFIG = {
+    "endpoint_url": os.environ.get("YUNTU_S3_ENDPOINT_URL"),
+    "max_pool_connections": 50,
+    "block_size": 5 * 2**20,
+    "cache_type": "readahead",
+}
+
+_S3_LOCK = threading.Lock()
+_S3_FILESYSTEM = None
+_S3_PID = None
+
+
+def configure_s3(**kwargs):
+    """Update configuration of the shared S3 filesystem.
+
+    Parameters
+    ----------
+    endpoint_url : str
+        Endpoint of an S3 compatible service (e.g. a local MinIO or moto
+        server). Defaults to the YUNTU_S3_ENDPOINT_URL environment variable.
+    max_pool_connections : int
+        Maximum number of pooled connections to the service.
+    block_size : int
+        Default block size in bytes for opened files.
+    cache_type : str
+        Default read cache for opened files ('readahead', 'bytes', 'none').
+
+    Any other keyword argument is passed to S3FileSystem. The shared
+    filesystem is rebuilt on next use.
+    """
+    S3_CONFIG.update(kwargs)
+    reset_s3_filesystem()
+
+
+def reset_s3_filesystem():
+    """Drop the shared S3 filesystem so that it is rebuilt on next use."""
+    global _S3_FILESYSTEM, _S3_PID
+    with _S3_LOCK:
+        _S3_FILESYSTEM = None
+        _S3_PID = None
+
+
+def get_s3_filesystem():
+    """Return process wide S3 filesystem shared by all media helpers.
+
+    The filesystem is built once per process, so that connections and
+    credentials are reused across calls. Child processes build their own
+    filesystem on first use since connection pools must not be shared
+    across forks.
+    """
+    global _S3_FILESYSTEM, _S3_PID
+    pid = os.getpid()
+    with _S3_LOCK:
+        if _S3_FILESYSTEM is None or _S3_PID != pid:
+            from s3fs.core import S3FileSystem
+
+            config = dict(S3_CONFIG)
+            endpoint_url = config.pop("endpoint_url")
+            max_pool_connections = config.pop("max_pool_connections")
+            block_size = config.pop("block_size")
+            cache_type = config.pop("cache_type")
+
+            client_kwargs = config.pop("client_kwargs", {})
+            if endpoint_url is not None:
+                client_kwargs["endpoint_url"] = endpoint_url
+            config_kwargs = config.pop("config_kwargs", {})
+            config_kwargs["max_pool_connections"] = max_pool_connections
+
+            _S3_FILESYSTEM = S3FileSystem(client_kwargs=client_kwargs,
+                                          config_kwargs=config_kwargs,
+                                          default_block_size=block_size,
+                                          default_cache_type=cache_type,
+                                          skip_instance_cache=True,
+                                          **config)
+            _S3_PID = pid
+        return _S3_FILESYSTEM
+
+
+def _reset_s3_after_fork():
+    global _S3_LOCK, _S3_FILESYSTEM, _S3_PID
+    _S3_LOCK = threading.Lock()
+    _S3_FILESYSTEM = None
+    _S3_PID = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_s3_after_fork)
+
 
 @contextmanager
 def tmp_file(basename):